@@ -5,7 +5,7 @@ from typing import Optional, List
 from .database import Database
 
 
-@dataclass
+@dataclass(slots=True)
 class CreditCard:
     id: Optional[int]
     pay_type_code: str
@@ -2,6 +2,7 @@
 
 import sqlite3
 import logging
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
 import os
@@ -17,6 +18,7 @@ class Database:
 
     _instance: Optional['Database'] = None
     _connection: Optional[sqlite3.Connection] = None
+    _bulk_depth: int = 0
 
     def __new__(cls):
         if cls._instance is None:
@@ -39,8 +41,46 @@ class Database:
         return self.connection.executemany(sql, params_list)
 
     def commit(self):
+        # Inside bulk_load() the outer context owns the single COMMIT
+        if self._bulk_depth:
+            return
         self.connection.commit()
 
+    @contextmanager
+    def bulk_load(self):
+        """Run a batch of writes as one transaction with relaxed syncing.
+
+        Model-level commit() calls become no-ops until the outermost block
+        exits, which commits once (or rolls back on error). synchronous is
+        lowered to NORMAL for the duration and then restored. The rollback
+        journal is left alone so a crash mid-load cannot corrupt the file.
+        """
+        if self._bulk_depth:
+            self._bulk_depth += 1
+            try:
+                yield self
+            finally:
+                self._bulk_depth -= 1
+            return
+
+        conn = self.connection
+        if conn.in_transaction:
+            conn.commit()
+        previous_sync = conn.execute("PRAGMA synchronous").fetchone()[0]
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("BEGIN IMMEDIATE")
+        self._bulk_depth = 1
+        try:
+            yield self
+        except BaseException:
+            conn.rollback()
+            raise
+        else:
+            conn.commit()
+        finally:
+            self._bulk_depth = 0
+            conn.execute(f"PRAGMA synchronous = {int(previous_sync)}")
+
     def close(self):
         if self._connection:
             _logger.debug("Closing database connection")
@@ -220,6 +260,10 @@ def init_db():
     # Create indexes for performance
     db.execute("CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions(date)")
     db.execute("CREATE INDEX IF NOT EXISTS idx_transactions_payment_method ON transactions(payment_method)")
+    # Ledger and Posted tab queries filter on is_posted first, then the date range
+    db.execute("CREATE INDEX IF NOT EXISTS idx_transactions_posted_date ON transactions(is_posted, date)")
+    # Deleting a recurring charge unlinks (and foreign-key checks) its transactions
+    db.execute("CREATE INDEX IF NOT EXISTS idx_transactions_recurring_date ON transactions(recurring_charge_id, date)")
     db.execute("CREATE INDEX IF NOT EXISTS idx_recurring_day ON recurring_charges(day_of_month)")
     db.execute("CREATE INDEX IF NOT EXISTS idx_deferred_promo_end ON deferred_purchases(promo_end_date)")
     db.execute("CREATE INDEX IF NOT EXISTS idx_plaid_mappings_item ON plaid_account_mappings(plaid_item_id)")
@@ -1,12 +1,33 @@
 """Transaction model"""
 
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Iterable, Optional, List
 from datetime import datetime, date
 from .database import Database
 
+# Shared by every bulk insert so sqlite3's statement cache reuses one
+# prepared statement; row tuples follow this column order
+INSERT_SQL = (
+    "INSERT INTO transactions"
+    " (date, description, amount, payment_method, recurring_charge_id, is_posted, notes)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
 
-@dataclass
+# Columns in Transaction field order, so a fetched row unpacks straight
+# into the constructor without a dict round-trip per row
+SELECT_SQL = (
+    "SELECT id, date, description, amount, payment_method, recurring_charge_id,"
+    " is_posted, posted_date, notes FROM transactions"
+)
+
+# SQLite builds may cap bound parameters at 999 per statement
+DELETE_CHUNK_SIZE = 900
+
+# Reclaim file space after a delete-all only when it removed this many rows
+VACUUM_THRESHOLD = 5000
+
+
+@dataclass(slots=True)
 class Transaction:
     id: Optional[int]
     date: str  # ISO format: YYYY-MM-DD (due date)
@@ -44,83 +65,129 @@ class Transaction:
         db.commit()
         return self
 
+    @classmethod
+    def bulk_insert(cls, rows: Iterable[tuple]) -> int:
+        """Insert many new transactions with one executemany and one commit.
+
+        Each row is a plain tuple of
+        (date, description, amount, payment_method, recurring_charge_id, is_posted, notes).
+        rows may be a generator; it is streamed into SQLite without being
+        materialized. Returns the number of rows inserted.
+        """
+        if isinstance(rows, (list, tuple)) and not rows:
+            return 0
+        db = Database()
+        # sqlite3 opens a single implicit transaction for the whole batch
+        cursor = db.executemany(INSERT_SQL, rows)
+        db.commit()
+        return max(cursor.rowcount, 0)
+
     def delete(self):
         if self.id:
             db = Database()
             db.execute("DELETE FROM transactions WHERE id = ?", (self.id,))
             db.commit()
 
+    @classmethod
+    def delete_many(cls, ids: List[int]) -> int:
+        """Delete transactions by id with one DELETE ... IN (...) per chunk
+        and a single commit. Returns the number of rows deleted.
+        """
+        ids = [i for i in ids if i]
+        if not ids:
+            return 0
+        db = Database()
+        deleted = 0
+        for start in range(0, len(ids), DELETE_CHUNK_SIZE):
+            chunk = ids[start:start + DELETE_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            cursor = db.execute(
+                f"DELETE FROM transactions WHERE id IN ({placeholders})", tuple(chunk))
+            deleted += cursor.rowcount
+        db.commit()
+        return deleted
+
+    @classmethod
+    def delete_all(cls) -> int:
+        """Delete every transaction in one explicit transaction.
+        VACUUMs afterwards only when enough rows were removed to be worth it.
+        Returns the number of rows deleted.
+        """
+        db = Database()
+        conn = db.connection
+        if conn.in_transaction:
+            db.commit()
+        db.execute("BEGIN")
+        try:
+            deleted = db.execute("DELETE FROM transactions").rowcount
+            db.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        if deleted >= VACUUM_THRESHOLD:
+            db.execute("VACUUM")
+        return deleted
+
+    @classmethod
+    def _from_rows(cls, rows) -> List['Transaction']:
+        """Build transactions from rows selected with SELECT_SQL"""
+        return [cls(trans_id, date, description, amount, payment_method,
+                    recurring_charge_id, bool(is_posted), posted_date, notes)
+                for (trans_id, date, description, amount, payment_method,
+                     recurring_charge_id, is_posted, posted_date, notes) in rows]
+
     @classmethod
     def get_by_id(cls, trans_id: int) -> Optional['Transaction']:
         db = Database()
-        row = db.execute("SELECT * FROM transactions WHERE id = ?", (trans_id,)).fetchone()
-        if row:
-            data = dict(row)
-            data['is_posted'] = bool(data['is_posted'])
-            return cls(**data)
-        return None
+        rows = db.execute(f"{SELECT_SQL} WHERE id = ?", (trans_id,)).fetchall()
+        return cls._from_rows(rows)[0] if rows else None
 
     @classmethod
     def get_all(cls, limit: int = None, offset: int = 0) -> List['Transaction']:
         db = Database()
         # Sort by date, then amount DESC (positive before negative), then id
-        sql = "SELECT * FROM transactions ORDER BY date, amount DESC, id"
+        sql = f"{SELECT_SQL} ORDER BY date, amount DESC, id"
         if limit:
             sql += f" LIMIT {limit} OFFSET {offset}"
         rows = db.execute(sql).fetchall()
-        result = []
-        for row in rows:
-            data = dict(row)
-            data['is_posted'] = bool(data['is_posted'])
-            result.append(cls(**data))
-        return result
+        return cls._from_rows(rows)
 
     @classmethod
-    def get_by_date_range(cls, start_date: str, end_date: str) -> List['Transaction']:
+    def get_by_date_range(cls, start_date: str, end_date: str,
+                          posted: Optional[bool] = None) -> List['Transaction']:
+        """Transactions dated within [start_date, end_date]; posted=True/False
+        restricts to posted or unposted rows in SQL"""
         db = Database()
-        rows = db.execute("""
-            SELECT * FROM transactions
-            WHERE date >= ? AND date <= ?
-            ORDER BY date, amount DESC, id
-        """, (start_date, end_date)).fetchall()
-        result = []
-        for row in rows:
-            data = dict(row)
-            data['is_posted'] = bool(data['is_posted'])
-            result.append(cls(**data))
-        return result
+        sql = f"{SELECT_SQL} WHERE date >= ? AND date <= ?"
+        params = [start_date, end_date]
+        if posted is not None:
+            sql += " AND is_posted = ?"
+            params.append(1 if posted else 0)
+        sql += " ORDER BY date, amount DESC, id"
+        rows = db.execute(sql, params).fetchall()
+        return cls._from_rows(rows)
 
     @classmethod
     def get_by_payment_method(cls, method: str) -> List['Transaction']:
         db = Database()
-        rows = db.execute("""
-            SELECT * FROM transactions
+        rows = db.execute(f"""
+            {SELECT_SQL}
             WHERE payment_method = ?
             ORDER BY date, amount DESC, id
         """, (method,)).fetchall()
-        result = []
-        for row in rows:
-            data = dict(row)
-            data['is_posted'] = bool(data['is_posted'])
-            result.append(cls(**data))
-        return result
+        return cls._from_rows(rows)
 
     @classmethod
     def get_future_transactions(cls, from_date: str = None) -> List['Transaction']:
         if from_date is None:
             from_date = datetime.now().strftime('%Y-%m-%d')
         db = Database()
-        rows = db.execute("""
-            SELECT * FROM transactions
+        rows = db.execute(f"""
+            {SELECT_SQL}
             WHERE date >= ?
             ORDER BY date, amount DESC, id
         """, (from_date,)).fetchall()
-        result = []
-        for row in rows:
-            data = dict(row)
-            data['is_posted'] = bool(data['is_posted'])
-            result.append(cls(**data))
-        return result
+        return cls._from_rows(rows)
 
     @classmethod
     def delete_future_recurring(cls, from_date: str = None):
@@ -178,17 +245,12 @@ class Transaction:
     def get_posted(cls) -> List['Transaction']:
         """Get all posted transactions, ordered by posted_date descending"""
         db = Database()
-        rows = db.execute("""
-            SELECT * FROM transactions
+        rows = db.execute(f"""
+            {SELECT_SQL}
             WHERE is_posted = 1
             ORDER BY posted_date DESC, date DESC, id DESC
         """).fetchall()
-        result = []
-        for row in rows:
-            data = dict(row)
-            data['is_posted'] = bool(data['is_posted'])
-            result.append(cls(**data))
-        return result
+        return cls._from_rows(rows)
 
     @classmethod
     def clear_posted(cls) -> int:
@@ -1,9 +1,14 @@
 """Calculation utilities for budget projections"""
 
+import calendar
+from collections import Counter
 from datetime import datetime, date, timedelta
-from typing import List, Dict, Tuple, Optional
+from functools import lru_cache
+from typing import Iterator, List, Dict, Tuple, Optional
 from dataclasses import dataclass
 
+import numpy as np
+
 from ..models.transaction import Transaction
 from ..models.recurring_charge import RecurringCharge
 from ..models.credit_card import CreditCard
@@ -23,6 +28,34 @@ class BalanceSnapshot:
     total_cc_utilization: float
 
 
+@lru_cache(maxsize=256)
+def days_in_month(year: int, month: int) -> int:
+    """Return the number of days in a month (memoized calendar.monthrange)"""
+    return calendar.monthrange(year, month)[1]
+
+
+def dates_every(first: date, end: date, days: int) -> List[date]:
+    """Return every days-th day from first through end (inclusive)"""
+    if first > end:
+        return []
+    count = (end - first).days // days + 1
+    return [first + timedelta(days=days * i) for i in range(count)]
+
+
+def biweekly_dates(first: date, end: date) -> List[date]:
+    """Return every 14th day from first through end (inclusive)"""
+    return dates_every(first, end, 14)
+
+
+def month_range(start: date, end: date) -> Iterator[Tuple[int, int]]:
+    """Yield (year, month) for every month from start's through end's (inclusive)"""
+    start_idx = start.year * 12 + start.month - 1
+    end_idx = end.year * 12 + end.month - 1
+    for idx in range(start_idx, end_idx + 1):
+        year, month0 = divmod(idx, 12)
+        yield year, month0 + 1
+
+
 def calculate_running_balances(transactions: List[Transaction],
                                starting_balances: Dict[str, float]) -> List[Dict]:
     """
@@ -36,12 +69,13 @@ def calculate_running_balances(transactions: List[Transaction],
         List of dicts with transaction and running balances
     """
     # Get all credit cards for calculating available credit
-    cards = {c.pay_type_code: c for c in CreditCard.get_all()}
+    all_cards = CreditCard.get_all()
+    cards = {c.pay_type_code: c for c in all_cards}
 
     # Build CC payment maps for linked card balance updates
     cc_payment_map = {}
     cc_name_map = {}
-    card_id_to_code = {c.id: c for c in CreditCard.get_all()}
+    card_id_to_code = {c.id: c for c in all_cards}
     for charge in RecurringCharge.get_all():
         if charge.linked_card_id and charge.linked_card_id in card_id_to_code:
             code = card_id_to_code[charge.linked_card_id].pay_type_code
@@ -51,6 +85,11 @@ def calculate_running_balances(transactions: List[Transaction],
     # Initialize running balances
     running = starting_balances.copy()
 
+    # Total owed across cards, kept up to date as each transaction moves at
+    # most two card balances instead of re-summing every card per row
+    total_balance = sum(running.get(code, 0) for code in cards)
+    total_limit = sum(c.credit_limit for c in all_cards)
+
     results = []
     for trans in transactions:
         method = trans.payment_method
@@ -59,6 +98,7 @@ def calculate_running_balances(transactions: List[Transaction],
         if method in running:
             if method in cards:
                 running[method] = running[method] - trans.amount  # CC: charges increase owed
+                total_balance -= trans.amount
             else:
                 running[method] = running[method] + trans.amount
 
@@ -70,6 +110,7 @@ def calculate_running_balances(transactions: List[Transaction],
                 linked_card_code = cc_name_map[trans.description]
             if linked_card_code and linked_card_code in running:
                 running[linked_card_code] += trans.amount
+                total_balance += trans.amount
 
         # Calculate available credit for credit cards
         available = {}
@@ -80,8 +121,6 @@ def calculate_running_balances(transactions: List[Transaction],
                 available[code] = card.credit_limit - running.get(code, 0)
 
         # Calculate total utilization
-        total_balance = sum(running.get(c.pay_type_code, 0) for c in cards.values())
-        total_limit = sum(c.credit_limit for c in cards.values())
         utilization = total_balance / total_limit if total_limit > 0 else 0
 
         results.append({
@@ -94,6 +133,91 @@ def calculate_running_balances(transactions: List[Transaction],
     return results
 
 
+def compute_ledger_balances(transactions: list, starting: dict, initial: list,
+                            code_to_idx: dict, cc_payment_map: dict,
+                            cc_name_map: dict) -> tuple:
+    """
+    Compute the balance snapshot after each ledger row.
+
+    Balances are positional: slot 0 is Chase and slots 1..n are the cards in
+    column order. Works only on pre-fetched data, so it is safe to call from
+    a worker thread.
+
+    Each row contributes at most two balance changes (its own pay type and,
+    for a card payment, the linked card). Those are scattered into a
+    (rows, slots) delta matrix and the running balances come from a single
+    cumulative sum down the rows. The sum runs on integer cents, so long
+    ledgers do not accumulate floating point drift.
+
+    Args:
+        transactions: Ledger rows in display order
+        starting: Starting balances by pay type code
+        initial: Starting balance for each slot
+        code_to_idx: Pay type code -> slot
+        cc_payment_map: Recurring charge id -> slot of the card it pays
+        cc_name_map: Description -> slot, fallback for manual CC payments
+
+    Returns:
+        Tuple of (rows x slots array of balances, per-row total card balance)
+    """
+    n = len(transactions)
+    slots = len(initial)
+    # Pull the fields out of the row objects once, and bind the dict
+    # lookups to locals, so the per-row passes below stay cheap
+    methods = np.array([t.payment_method for t in transactions], dtype=str)
+    rec_ids = [t.recurring_charge_id for t in transactions]
+    descs = [t.description for t in transactions]
+    posted = np.fromiter((t.is_posted for t in transactions), dtype=bool, count=n)
+    # Whole cents; float dollars only come back at the end
+    amounts = np.rint(
+        np.fromiter((t.amount for t in transactions), dtype=np.float64, count=n) * 100
+    ).astype(np.int64)
+    payment_get = cc_payment_map.get
+    name_get = cc_name_map.get
+
+    # Turn pay type codes into small integers once: only the handful of
+    # distinct codes are looked up in the dicts, and each row just indexes
+    # the per-code arrays
+    codes, code_ids = np.unique(methods, return_inverse=True)
+    code_slot = np.array([code_to_idx.get(c, -1) for c in codes.tolist()], dtype=np.intp)
+    code_known = np.array([c in starting for c in codes.tolist()], dtype=bool)
+    own = code_slot[code_ids]
+
+    # Only non-posted rows on a known pay type move balances; posted
+    # transactions are already reflected in the current balance
+    live = code_known[code_ids] & ~posted
+
+    # A CC payment also reduces the debt of the card it pays. Match on the
+    # recurring charge first, then fall back to the description for manual
+    # payments matching a known charge name. Card slots start at 1, so 0
+    # means "no linked card".
+    linked = np.fromiter(
+        ((payment_get(r) if r else None) or name_get(d, 0) for r, d in zip(rec_ids, descs)),
+        dtype=np.intp, count=n
+    )
+
+    delta = np.zeros((n, slots), dtype=np.int64)
+    rows = np.arange(n)
+
+    # Each scatter below touches at most one cell per row, so plain fancy
+    # indexing is safe and avoids the unbuffered np.add.at path
+    # Bank account moves in the normal direction; card charges increase owed
+    mask = live & (own >= 0)
+    signed = np.where(own == 0, amounts, -amounts)
+    delta[rows[mask], own[mask]] = signed[mask]
+
+    # Payment amount is negative (from Chase), so adding it reduces card debt
+    mask = live & (linked > 0)
+    delta[rows[mask], linked[mask]] += amounts[mask]
+
+    if n:
+        delta[0] += np.rint(np.asarray(initial, dtype=np.float64) * 100).astype(np.int64)
+    cents = np.cumsum(delta, axis=0)
+    # Total owed across cards
+    totals = cents[:, 1:].sum(axis=1)
+    return cents / 100, totals / 100
+
+
 def calculate_90_day_minimum(starting_balance: float,
                              transactions: List[Transaction],
                              payment_method: str = 'C') -> Tuple[float, Optional[date]]:
@@ -220,27 +344,32 @@ def generate_future_transactions(months_ahead: int = 12,
         else:
             posted_other.add((p.description, p.date[:10]))
 
-    transactions = []
-    current_date = start_date
-
-    while current_date <= end_date:
-        year = current_date.year
-        month = current_date.month
-        day = current_date.day
-
-        for charge in charges:
-            # Skip special frequency charges for now (handled separately)
-            if charge.frequency == 'SPECIAL':
-                continue
+    # Index the monthly charges by day of month once, so each day only
+    # visits the charges due on it. Special charges are handled separately
+    # and Lisa-linked ones in payday generation; days outside 1-31 never
+    # fall on a date. Amounts are resolved once per charge, since a linked
+    # card's minimum payment needs a query.
+    by_day = {}
+    for charge in charges:
+        if charge.frequency == 'SPECIAL' or charge.id in lisa_linked_ids:
+            continue
+        if not 1 <= charge.day_of_month <= 31:
+            continue
+        by_day.setdefault(charge.day_of_month, []).append((charge, charge.get_actual_amount()))
+    days = sorted(by_day)
 
-            # Skip charges linked to Lisa Payments (handled in payday generation)
-            if charge.id in lisa_linked_ids:
+    transactions = []
+    for year, month in month_range(start_date, end_date):
+        last_day = days_in_month(year, month)
+        for day in days:
+            if day > last_day:
+                break
+            current_date = date(year, month, day)
+            if current_date < start_date or current_date > end_date:
                 continue
+            date_str = current_date.isoformat()
 
-            # Check if this charge occurs on this day
-            if charge.day_of_month == day:
-                date_str = current_date.strftime('%Y-%m-%d')
-
+            for charge, amount in by_day[day]:
                 # Skip if this charge+date is already posted
                 if (charge.id, date_str) in posted_recurring:
                     continue
@@ -249,15 +378,13 @@ def generate_future_transactions(months_ahead: int = 12,
                     id=None,
                     date=date_str,
                     description=charge.name,
-                    amount=charge.get_actual_amount(),
+                    amount=amount,
                     payment_method=charge.payment_method,
                     recurring_charge_id=charge.id,
                     is_posted=False
                 )
                 transactions.append(trans)
 
-        current_date += timedelta(days=1)
-
     # Handle special charges (mortgage on specific schedule, etc.)
     # Also skip Lisa-linked charges
     transactions.extend(_generate_special_charges(start_date, end_date, charges, lisa_linked_ids, posted_recurring))
@@ -305,18 +432,33 @@ def _generate_special_charges(start_date: date, end_date: date,
         # 999 = Lisa3UOAP
 
         if charge.day_of_month == 991:
-            # Mortgage - assume bi-weekly on Fridays
-            current = start_date
-            while current <= end_date:
-                # Find next Friday
-                days_until_friday = (4 - current.weekday()) % 7
-                if days_until_friday == 0:
-                    days_until_friday = 7
-                current += timedelta(days=days_until_friday)
-                if current > end_date:
-                    break
-
-                date_str = current.strftime('%Y-%m-%d')
+            # Mortgage - Fridays, starting with the first one after start_date.
+            # Each step is 14 days and then on to the following Friday, so
+            # the schedule repeats every 21 days
+            first_friday = start_date + timedelta(days=(3 - start_date.weekday()) % 7 + 1)
+            date_strs = (d.isoformat() for d in dates_every(first_friday, end_date, 21))
+            transactions.extend(
+                Transaction(
+                    id=None,
+                    date=date_str,
+                    description=charge.name,
+                    amount=charge.amount,
+                    payment_method='C',
+                    recurring_charge_id=charge.id,
+                    is_posted=False
+                )
+                for date_str in date_strs
+                # Skip if already posted
+                if (charge.id, date_str) not in posted_recurring
+            )
+
+        elif charge.day_of_month in [992, 993, 994, 995]:
+            # Monthly special charges - treat as monthly on the 15th
+            for year, month in month_range(start_date, end_date):
+                current = date(year, month, 15)
+                if current < start_date or current > end_date:
+                    continue
+                date_str = current.isoformat()
                 # Skip if already posted
                 if (charge.id, date_str) not in posted_recurring:
                     trans = Transaction(
@@ -329,32 +471,6 @@ def _generate_special_charges(start_date: date, end_date: date,
                         is_posted=False
                     )
                     transactions.append(trans)
-                current += timedelta(days=14)
-
-        elif charge.day_of_month in [992, 993, 994, 995]:
-            # Monthly special charges - treat as monthly on the 15th
-            current = date(start_date.year, start_date.month, 15)
-            while current <= end_date:
-                if current >= start_date:
-                    date_str = current.strftime('%Y-%m-%d')
-                    # Skip if already posted
-                    if (charge.id, date_str) not in posted_recurring:
-                        trans = Transaction(
-                            id=None,
-                            date=date_str,
-                            description=charge.name,
-                            amount=charge.amount,
-                            payment_method='C',
-                            recurring_charge_id=charge.id,
-                            is_posted=False
-                        )
-                        transactions.append(trans)
-
-                # Move to next month
-                if current.month == 12:
-                    current = date(current.year + 1, 1, 15)
-                else:
-                    current = date(current.year, current.month + 1, 15)
 
     return transactions
 
@@ -364,7 +480,6 @@ def _generate_payday_transactions(start_date: date, end_date: date,
                                   posted_other: set = None) -> List[Transaction]:
     """Generate payday transactions based on paycheck configuration"""
     from ..models.shared_expense import SharedExpense
-    import calendar
 
     transactions = []
 
@@ -383,31 +498,25 @@ def _generate_payday_transactions(start_date: date, end_date: date,
             days_ahead = (pay_dow - anchor.weekday()) % 7
             anchor += timedelta(days=days_ahead)
 
-        # Walk backward from anchor to cover the start of start_date's month
-        # (needed for accurate payday-per-month counting)
+        # First payday on or after the start of start_date's month (needed for
+        # accurate payday-per-month counting); ceiling division steps from the
+        # anchor in either direction without walking 14 days at a time
         month_start = date(start_date.year, start_date.month, 1)
-        current = anchor
-        while current - timedelta(days=14) >= month_start:
-            current -= timedelta(days=14)
-
-        # Collect ALL paydays (from month start to end_date) for counting
-        all_paydays = []
-        while current <= end_date:
-            all_paydays.append(current)
-            current += timedelta(days=14)
+        periods = -(-(month_start - anchor).days // 14)
+        all_paydays = biweekly_dates(anchor + timedelta(days=periods * 14), end_date)
 
         # Count paydays per month (using all paydays, including past ones in current month)
-        paydays_per_month = {}
-        for payday in all_paydays:
-            month_key = (payday.year, payday.month)
-            paydays_per_month[month_key] = paydays_per_month.get(month_key, 0) + 1
+        paydays_per_month = Counter((p.year, p.month) for p in all_paydays)
 
         # Filter to only paydays >= start_date for transaction generation
         paydays = [p for p in all_paydays if p >= start_date]
 
+        # Lisa payment per paycheck count; each lookup reads every shared expense
+        lisa_payments = {}
+
         # Generate transactions for each payday
         for payday in paydays:
-            date_str = payday.strftime('%Y-%m-%d')
+            date_str = payday.isoformat()
 
             # Payday transaction - skip if already posted
             if ('Payday', date_str) not in posted_other:
@@ -425,7 +534,10 @@ def _generate_payday_transactions(start_date: date, end_date: date,
             # Lisa payment - based on number of paydays in this month
             month_key = (payday.year, payday.month)
             paycheck_count = paydays_per_month.get(month_key, 2)
-            lisa_amount = SharedExpense.calculate_lisa_payment(paycheck_count)
+            lisa_amount = lisa_payments.get(paycheck_count)
+            if lisa_amount is None:
+                lisa_amount = SharedExpense.calculate_lisa_payment(paycheck_count)
+                lisa_payments[paycheck_count] = lisa_amount
 
             if lisa_amount > 0 and ('Lisa Payment', date_str) not in posted_other:
                 lisa_trans = Transaction(
@@ -441,7 +553,7 @@ def _generate_payday_transactions(start_date: date, end_date: date,
 
             # Add LDBPD marker (Last Day Before PayDay)
             ldbpd_date = payday - timedelta(days=1)
-            ldbpd_date_str = ldbpd_date.strftime('%Y-%m-%d')
+            ldbpd_date_str = ldbpd_date.isoformat()
             if ldbpd_date >= start_date and ('LDBPD', ldbpd_date_str) not in posted_other:
                 ldbpd = Transaction(
                     id=None,
@@ -465,23 +577,22 @@ def _generate_interest_charges(start_date: date, end_date: date,
     Generate interest charges for credit cards.
     Interest is charged 3 days after due date, based on previous day's balance.
     """
-    import calendar
-
     if posted_other is None:
         posted_other = set()
 
     # Get credit cards with interest rate and due day
-    cards = [c for c in CreditCard.get_all() if c.interest_rate > 0 and c.due_day]
+    all_cards = CreditCard.get_all()
+    cards = [c for c in all_cards if c.interest_rate > 0 and c.due_day]
     if not cards:
         return transactions
 
     # Get starting balances
-    starting_balances = get_starting_balances()
+    starting_balances = get_starting_balances(all_cards)
 
     # Build map of recurring_charge_id -> pay_type_code for CC payments
     cc_payment_map = {}
     cc_name_map = {}
-    card_id_to_code = {c.id: c.pay_type_code for c in CreditCard.get_all()}
+    card_id_to_code = {c.id: c.pay_type_code for c in all_cards}
     for charge in RecurringCharge.get_all():
         if charge.linked_card_id and charge.linked_card_id in card_id_to_code:
             cc_payment_map[charge.id] = card_id_to_code[charge.linked_card_id]
@@ -490,29 +601,37 @@ def _generate_interest_charges(start_date: date, end_date: date,
     # Sort transactions by date for processing
     sorted_trans = sorted(transactions, key=lambda x: x.date)
 
-    # Track running balances for each card
+    # The card each transaction pays off, resolved once instead of per card
+    # and month
+    linked_codes = []
+    for trans in sorted_trans:
+        linked_code = None
+        if trans.recurring_charge_id and trans.recurring_charge_id in cc_payment_map:
+            linked_code = cc_payment_map[trans.recurring_charge_id]
+        elif trans.description in cc_name_map:
+            linked_code = cc_name_map[trans.description]
+        linked_codes.append(linked_code)
+
+    # A card's interest dates only move forward, so each card walks the
+    # sorted transactions once: its balance is carried over from the
+    # previous month instead of re-summed from the first transaction
+    position = {c.pay_type_code: 0 for c in cards}
     running = {c.pay_type_code: starting_balances.get(c.pay_type_code, 0) for c in cards}
 
     # Generate interest dates for each card for each month
     interest_charges = []
-    current_month = date(start_date.year, start_date.month, 1)
-
-    while current_month <= end_date:
-        year = current_month.year
-        month = current_month.month
-        days_in_month = calendar.monthrange(year, month)[1]
+    for year, month in month_range(start_date, end_date):
+        month_days = days_in_month(year, month)
 
         for card in cards:
             # Calculate interest charge date (due_day + 3)
             interest_day = card.due_day + 3
 
             # Handle month rollover
-            if interest_day > days_in_month:
+            if interest_day > month_days:
                 # Roll to next month
-                if month == 12:
-                    interest_date = date(year + 1, 1, interest_day - days_in_month)
-                else:
-                    interest_date = date(year, month + 1, interest_day - days_in_month)
+                next_year, next_month0 = divmod(year * 12 + month, 12)
+                interest_date = date(next_year, next_month0 + 1, interest_day - month_days)
             else:
                 interest_date = date(year, month, interest_day)
 
@@ -522,38 +641,30 @@ def _generate_interest_charges(start_date: date, end_date: date,
 
             # Calculate balance on the day before interest date
             balance_date = interest_date - timedelta(days=1)
-            balance_date_str = balance_date.strftime('%Y-%m-%d')
-
-            # Calculate running balance up to balance_date
-            card_balance = starting_balances.get(card.pay_type_code, 0)
-            for trans in sorted_trans:
-                if trans.date > balance_date_str:
-                    break
-
+            balance_date_str = balance_date.isoformat()
+
+            # Advance the running balance up to balance_date
+            code = card.pay_type_code
+            i = position[code]
+            card_balance = running[code]
+            while i < len(sorted_trans) and sorted_trans[i].date <= balance_date_str:
+                trans = sorted_trans[i]
                 # Direct transactions to this card (charges are negative, increase owed)
-                if trans.payment_method == card.pay_type_code:
+                if trans.payment_method == code:
                     card_balance -= trans.amount
-
                 # Credit card payments reduce the balance
-                linked_code = None
-                if trans.recurring_charge_id and trans.recurring_charge_id in cc_payment_map:
-                    linked_code = cc_payment_map[trans.recurring_charge_id]
-                elif trans.description in cc_name_map:
-                    linked_code = cc_name_map[trans.description]
-                if linked_code == card.pay_type_code:
+                if linked_codes[i] == code:
                     card_balance += trans.amount  # trans.amount is negative
-
-            # Also include any interest charges we've already generated
-            for ic in interest_charges:
-                if ic.date <= balance_date_str and ic.payment_method == card.pay_type_code:
-                    card_balance -= ic.amount  # interest is negative, increases owed
+                i += 1
+            position[code] = i
+            running[code] = card_balance
 
             # Only charge interest if there's a balance owed
             if card_balance > 0:
                 # Monthly interest = balance * (APR / 12)
                 monthly_rate = card.interest_rate / 12
                 interest_amount = round(card_balance * monthly_rate, 2)
-                interest_date_str = interest_date.strftime('%Y-%m-%d')
+                interest_date_str = interest_date.isoformat()
                 interest_desc = f"{card.name} Interest"
 
                 # Skip if already posted
@@ -568,12 +679,8 @@ def _generate_interest_charges(start_date: date, end_date: date,
                         is_posted=False
                     )
                     interest_charges.append(interest_trans)
-
-        # Move to next month
-        if current_month.month == 12:
-            current_month = date(current_month.year + 1, 1, 1)
-        else:
-            current_month = date(current_month.year, current_month.month + 1, 1)
+                    # Later months' balances include this charge
+                    running[code] -= interest_trans.amount
 
     # Add interest charges to transactions
     transactions.extend(interest_charges)
@@ -581,8 +688,17 @@ def _generate_interest_charges(start_date: date, end_date: date,
     return transactions
 
 
-def get_starting_balances() -> Dict[str, float]:
-    """Get the starting balances for all payment methods"""
+def get_starting_balances(cards: List[CreditCard] = None) -> Dict[str, float]:
+    """
+    Get the starting balances for all payment methods.
+
+    These are the stored current balances of accounts, cards and loans,
+    three small table reads; callers that reuse them hold on to the result.
+
+    Args:
+        cards: CreditCard.get_all() when the caller just fetched it, so the
+            card table is not read a second time
+    """
     balances = {}
 
     # Get account balances
@@ -591,7 +707,9 @@ def get_starting_balances() -> Dict[str, float]:
             balances[account.pay_type_code] = account.current_balance
 
     # Get credit card balances
-    for card in CreditCard.get_all():
+    if cards is None:
+        cards = CreditCard.get_all()
+    for card in cards:
         balances[card.pay_type_code] = card.current_balance
 
     # Get loan balances
@@ -102,9 +102,12 @@ def export_transactions(filepath: Path, start_date: str = None, end_date: str =
     """
     db = Database()
 
+    # Rows come out of SQLite already in CSV column order and text form, so
+    # csv.writer writes them without a Python loop over every row
     query = """
         SELECT t.date, t.description, t.amount, t.payment_method,
-               t.is_posted, t.notes, rc.name as recurring_charge
+               CASE WHEN t.is_posted THEN 'Yes' ELSE 'No' END,
+               COALESCE(t.notes, ''), COALESCE(rc.name, '')
         FROM transactions t
         LEFT JOIN recurring_charges rc ON t.recurring_charge_id = rc.id
     """
@@ -129,10 +132,7 @@ def export_transactions(filepath: Path, start_date: str = None, end_date: str =
         writer = csv.writer(f)
         writer.writerow(['Date', 'Description', 'Amount', 'Payment Method',
                         'Posted', 'Notes', 'Recurring Charge'])
-        for row in rows:
-            writer.writerow([row['date'], row['description'], row['amount'],
-                           row['payment_method'], 'Yes' if row['is_posted'] else 'No',
-                           row['notes'] or '', row['recurring_charge'] or ''])
+        writer.writerows(rows)
 
     return len(rows)
 
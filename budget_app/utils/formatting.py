@@ -0,0 +1,10 @@
+"""Display formatting shared by the views"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1024)
+def display_date(iso: str) -> str:
+    """MM/DD/YYYY for an ISO date (any time part is ignored); cached since
+    many rows share a date"""
+    return f"{iso[5:7]}/{iso[8:10]}/{iso[:4]}"
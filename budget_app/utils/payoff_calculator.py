@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 from typing import List, Dict, Optional
 from datetime import date, timedelta
-from dateutil.relativedelta import relativedelta
+from functools import lru_cache
 import copy
 
 
@@ -64,6 +64,14 @@ def calculate_minimum_payment(balance: float, apr: float, fixed_min: Optional[fl
     return max(calculated, min(25.0, balance))
 
 
+@lru_cache(maxsize=None)
+def _month_start(month_index: int) -> date:
+    """First day of the month numbered year * 12 + (month - 1); cached since
+    every strategy steps through the same run of months"""
+    year, month0 = divmod(month_index, 12)
+    return date(year, month0 + 1, 1)
+
+
 def _simulate_payoff(
     cards: List[CardPayoffInfo],
     monthly_extra: float,
@@ -101,11 +109,15 @@ def _simulate_payoff(
     schedule = []
     total_interest = 0
     total_payments = 0
-    current_date = date.today().replace(day=1) + relativedelta(months=1)
+    # Payments start on the first of next month
+    today = date.today()
+    first_month = today.year * 12 + today.month
+    current_date = today
     month_count = 0
     payoff_order = []
 
     while working_cards and month_count < max_months:
+        current_date = _month_start(first_month + month_count)
         month_count += 1
 
         # Apply interest to all cards
@@ -114,12 +126,6 @@ def _simulate_payoff(
             card.balance += interest
             total_interest += interest
 
-        # Calculate total minimum payments required
-        total_minimums = sum(
-            calculate_minimum_payment(c.balance, c.apr, c.min_payment)
-            for c in working_cards
-        )
-
         # Available for extra payments
         extra_available = monthly_extra
 
@@ -175,9 +181,8 @@ def _simulate_payoff(
                     payoff_order.append(card.name)
                 working_cards.remove(card)
 
-        current_date += relativedelta(months=1)
-
-    payoff_date = current_date - relativedelta(months=1) if month_count > 0 else date.today()
+    # The month of the last payment
+    payoff_date = current_date
 
     return PayoffResult(
         method="",
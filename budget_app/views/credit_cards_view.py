@@ -12,6 +12,11 @@ from PyQt6.QtGui import QColor
 from ..models.credit_card import CreditCard
 
 
+# Cell text colors, shared by every row instead of built per row
+RED = QColor("#f44336")
+ORANGE = QColor("#ff9800")
+
+
 class CreditCardsView(QWidget):
     """View for managing credit cards"""
 
@@ -104,22 +109,22 @@ class CreditCardsView(QWidget):
 
             balance_item = NumericSortItem(f"${card.current_balance:,.2f}", card.current_balance)
             if card.current_balance > card.credit_limit:
-                balance_item.setForeground(QColor("#f44336"))
+                balance_item.setForeground(RED)
             self.table.setItem(row, 2, balance_item)
 
             self.table.setItem(row, 3, NumericSortItem(f"${card.credit_limit:,.2f}", card.credit_limit))
 
             available_item = NumericSortItem(f"${card.available_credit:,.2f}", card.available_credit)
             if card.available_credit < 0:
-                available_item.setForeground(QColor("#f44336"))
+                available_item.setForeground(RED)
             self.table.setItem(row, 4, available_item)
 
             util_pct = card.utilization * 100
             util_item = NumericSortItem(f"{util_pct:.1f}%", util_pct)
             if util_pct > 80:
-                util_item.setForeground(QColor("#f44336"))
+                util_item.setForeground(RED)
             elif util_pct > 50:
-                util_item.setForeground(QColor("#ff9800"))
+                util_item.setForeground(ORANGE)
             self.table.setItem(row, 5, util_item)
 
             self.table.setItem(row, 6, NumericSortItem(f"${card.min_payment:,.2f}", card.min_payment))
@@ -189,11 +194,13 @@ class CreditCardsView(QWidget):
 
     def _notify_recurring_changes(self):
         """Notify parent window that credit cards have changed"""
-        # Find main window and mark recurring charges view as dirty
+        # Find main window and mark recurring charges and ledger views as dirty
         parent = self.parent()
         while parent:
             if hasattr(parent, 'recurring_view'):
                 parent.recurring_view.mark_dirty()
+                if hasattr(parent, 'transactions_view'):
+                    parent.transactions_view.invalidate_cards()
                 break
             parent = parent.parent()
 
@@ -19,6 +19,13 @@ from ..models.transaction import Transaction
 from ..utils.calculations import find_first_negative_balance, get_starting_balances
 
 
+# Cell text colors, shared by every row instead of built per row
+RED = QColor("#f44336")
+ORANGE = QColor("#ff9800")
+YELLOW = QColor("#ffeb3b")
+GREEN = QColor("#4caf50")
+
+
 class DashboardView(QWidget):
     """Dashboard with financial summary"""
 
@@ -274,13 +281,13 @@ class DashboardView(QWidget):
             util_pct = card.utilization * 100
             util_item = NumericSortItem(f"{util_pct:.1f}%", util_pct)
             if util_pct > 80:
-                util_item.setForeground(QColor("#f44336"))
+                util_item.setForeground(RED)
             elif util_pct > 50:
-                util_item.setForeground(QColor("#ff9800"))
+                util_item.setForeground(ORANGE)
             elif util_pct > 30:
-                util_item.setForeground(QColor("#ffeb3b"))
+                util_item.setForeground(YELLOW)
             else:
-                util_item.setForeground(QColor("#4caf50"))
+                util_item.setForeground(GREEN)
             self.cards_table.setItem(row, 4, util_item)
 
             self.cards_table.setItem(row, 5, NumericSortItem(f"${card.min_payment:,.2f}", card.min_payment))
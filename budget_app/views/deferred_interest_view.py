@@ -13,6 +13,14 @@ from ..models.deferred_interest import DeferredPurchase
 from ..models.credit_card import CreditCard
 
 
+# Text color per risk level, shared by every row; LOW keeps the default
+RISK_COLORS = {
+    "EXPIRED": QColor("#f44336"),  # Red
+    "HIGH": QColor("#ff5722"),  # Deep orange
+    "MEDIUM": QColor("#ff9800"),  # Orange
+}
+
+
 class DeferredInterestView(QWidget):
     """View for managing deferred interest purchases"""
 
@@ -161,13 +169,7 @@ class DeferredInterestView(QWidget):
 
     def _get_risk_color(self, risk_level: str) -> QColor:
         """Get color for risk level"""
-        if risk_level == "EXPIRED":
-            return QColor("#f44336")  # Red
-        elif risk_level == "HIGH":
-            return QColor("#ff5722")  # Deep orange
-        elif risk_level == "MEDIUM":
-            return QColor("#ff9800")  # Orange
-        return None  # Default color for LOW
+        return RISK_COLORS.get(risk_level)  # None (default color) for LOW
 
     def _update_alerts(self, purchases):
         """Update the alerts section"""
@@ -372,8 +372,11 @@ class MainWindow(QMainWindow):
 
                 # Generate new ones
                 transactions = generate_future_transactions(months_ahead=months)
-                for trans in transactions:
-                    trans.save()
+                # One executemany and commit for the whole batch
+                Transaction.bulk_insert(
+                    (t.date, t.description, t.amount, t.payment_method,
+                     t.recurring_charge_id, int(t.is_posted), t.notes)
+                    for t in transactions)
 
                 QMessageBox.information(
                     self,
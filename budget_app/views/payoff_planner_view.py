@@ -14,6 +14,10 @@ from ..utils.payoff_calculator import (
 )
 
 
+# Text color for the best payoff method's row
+BEST_GREEN = QColor("#4caf50")
+
+
 class PayoffPlannerView(QWidget):
     """View for planning credit card payoff strategies"""
 
@@ -205,7 +209,7 @@ class PayoffPlannerView(QWidget):
                 for col in range(self.comparison_table.columnCount()):
                     item = self.comparison_table.item(row, col)
                     if item:
-                        item.setForeground(QColor("#4caf50"))
+                        item.setForeground(BEST_GREEN)
 
         # Select first row
         if self.results:
@@ -9,6 +9,12 @@ from PyQt6.QtGui import QColor
 
 from ..models.transaction import Transaction
 from ..models.credit_card import CreditCard
+from ..utils.formatting import display_date
+
+
+# Cell text colors, shared by every row instead of built per row
+RED = QColor("#f44336")
+GREEN = QColor("#4caf50")
 
 
 class PostedTransactionsView(QWidget):
@@ -99,6 +105,10 @@ class PostedTransactionsView(QWidget):
         header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         header.setStretchLastSection(True)
 
+        # Every row keeps the style's default height, so Qt never measures
+        # cell contents to size rows
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+
         self.table.setColumnWidth(0, 100)  # Due Date
         self.table.setColumnWidth(1, 100)  # Posted Date
         self.table.setColumnWidth(2, 80)   # Pay Type
@@ -123,44 +133,63 @@ class PostedTransactionsView(QWidget):
         # Get all posted transactions
         transactions = Transaction.get_posted()
 
-        self.table.setRowCount(len(transactions))
-
-        for row, trans in enumerate(transactions):
-            # Due Date (original transaction date)
-            due_date = trans.date[:10]
-            display_due = f"{due_date[5:7]}/{due_date[8:10]}/{due_date[:4]}"
-            due_item = QTableWidgetItem(display_due)
-            self.table.setItem(row, 0, due_item)
-
-            # Posted Date
-            if trans.posted_date:
-                posted_date = trans.posted_date[:10]
-                display_posted = f"{posted_date[5:7]}/{posted_date[8:10]}/{posted_date[:4]}"
-            else:
-                display_posted = "-"
-            posted_item = QTableWidgetItem(display_posted)
-            self.table.setItem(row, 1, posted_item)
-
-            # Pay Type
-            pay_item = QTableWidgetItem(trans.payment_method)
-            self.table.setItem(row, 2, pay_item)
-
-            # Description
-            desc_item = QTableWidgetItem(trans.description)
-            desc_item.setData(Qt.ItemDataRole.UserRole, trans.id)
-            self.table.setItem(row, 3, desc_item)
-
-            # Amount
-            amount_item = QTableWidgetItem(f"${trans.amount:,.2f}")
-            if trans.amount < 0:
-                amount_item.setForeground(QColor("#f44336"))
-            else:
-                amount_item.setForeground(QColor("#4caf50"))
-            self.table.setItem(row, 4, amount_item)
-
-            # Notes
-            notes_item = QTableWidgetItem(trans.notes or "")
-            self.table.setItem(row, 5, notes_item)
+        # Fill with sorting and repaints off so each setItem() is a plain store
+        # instead of a re-sort and viewport update; rows are allocated once.
+        # Hidden, the table also skips per-item geometry updates; nothing is
+        # painted before it is shown again, so the hide does not flicker.
+        was_sorting = self.table.isSortingEnabled()
+        was_hidden = self.table.isHidden()
+        self.table.setSortingEnabled(False)
+        self.table.setUpdatesEnabled(False)
+        self.table.hide()
+        try:
+            self.table.setRowCount(len(transactions))
+
+            # Recurring charges post the same amounts again and again;
+            # format each distinct amount once
+            amount_texts = {}
+
+            for row, trans in enumerate(transactions):
+                # Due Date (original transaction date); posted rows share
+                # few distinct dates, so display_date() serves them cached
+                due_item = QTableWidgetItem(display_date(trans.date))
+                self.table.setItem(row, 0, due_item)
+
+                # Posted Date
+                if trans.posted_date:
+                    display_posted = display_date(trans.posted_date)
+                else:
+                    display_posted = "-"
+                posted_item = QTableWidgetItem(display_posted)
+                self.table.setItem(row, 1, posted_item)
+
+                # Pay Type
+                pay_item = QTableWidgetItem(trans.payment_method)
+                self.table.setItem(row, 2, pay_item)
+
+                # Description
+                desc_item = QTableWidgetItem(trans.description)
+                desc_item.setData(Qt.ItemDataRole.UserRole, trans.id)
+                self.table.setItem(row, 3, desc_item)
+
+                # Amount
+                amount_text = amount_texts.get(trans.amount)
+                if amount_text is None:
+                    amount_text = amount_texts[trans.amount] = f"${trans.amount:,.2f}"
+                amount_item = QTableWidgetItem(amount_text)
+                if trans.amount < 0:
+                    amount_item.setForeground(RED)
+                else:
+                    amount_item.setForeground(GREEN)
+                self.table.setItem(row, 4, amount_item)
+
+                # Notes
+                notes_item = QTableWidgetItem(trans.notes or "")
+                self.table.setItem(row, 5, notes_item)
+        finally:
+            self.table.setSortingEnabled(was_sorting)
+            self.table.setUpdatesEnabled(True)
+            self.table.setHidden(was_hidden)
 
         self.info_label.setText(f"Showing {len(transactions)} posted transaction(s)")
 
@@ -222,6 +251,7 @@ class PostedTransactionsView(QWidget):
                 trans.delete()
                 self.mark_dirty()
                 self.refresh()
+                self._notify_ledger_change()
 
     def _clear_all_posted(self):
         """Clear all posted transactions"""
@@ -245,3 +275,13 @@ class PostedTransactionsView(QWidget):
             QMessageBox.information(self, "Cleared", f"Deleted {deleted} posted transaction(s).")
             self.mark_dirty()
             self.refresh()
+            self._notify_ledger_change()
+
+    def _notify_ledger_change(self):
+        """Drop the ledger's cached rows, which may still hold deleted transactions"""
+        parent = self.parent()
+        while parent:
+            if hasattr(parent, 'transactions_view'):
+                parent.transactions_view.mark_dirty()
+                break
+            parent = parent.parent()
@@ -14,6 +14,12 @@ from ..models.recurring_charge import RecurringCharge
 from ..models.credit_card import CreditCard
 
 
+# Cell text colors, shared by every row instead of built per row
+RED = QColor("#f44336")
+GREEN = QColor("#4caf50")
+INACTIVE_GRAY = QColor("#808080")
+
+
 class RecurringChargesView(QWidget):
     """View for managing recurring charges"""
 
@@ -99,9 +105,9 @@ class RecurringChargesView(QWidget):
             display_amount = charge.get_actual_amount()
             amount_item = QTableWidgetItem(f"${display_amount:,.2f}")
             if display_amount < 0:
-                amount_item.setForeground(QColor("#f44336"))
+                amount_item.setForeground(RED)
             else:
-                amount_item.setForeground(QColor("#4caf50"))
+                amount_item.setForeground(GREEN)
             self.table.setItem(row, 1, amount_item)
 
             # Day display - for linked cards, show the card's due_day
@@ -125,7 +131,7 @@ class RecurringChargesView(QWidget):
 
             active_item = QTableWidgetItem("Yes" if charge.is_active else "No")
             if not charge.is_active:
-                active_item.setForeground(QColor("#808080"))
+                active_item.setForeground(INACTIVE_GRAY)
             self.table.setItem(row, 6, active_item)
 
     def _get_selected_charge_id(self) -> int:
@@ -142,6 +148,7 @@ class RecurringChargesView(QWidget):
         if dialog.exec() == QDialog.DialogCode.Accepted:
             charge = dialog.get_charge()
             charge.save()
+            self._notify_charge_changes()
             self.refresh(force=True)
 
     def _edit_charge(self):
@@ -158,8 +165,18 @@ class RecurringChargesView(QWidget):
                 updated = dialog.get_charge()
                 updated.id = charge.id
                 updated.save()
+                self._notify_charge_changes()
                 self.refresh(force=True)
 
+    def _notify_charge_changes(self):
+        """Tell the ledger its cached charges and CC payment links are stale"""
+        parent = self.parent()
+        while parent:
+            if hasattr(parent, 'transactions_view'):
+                parent.transactions_view.invalidate_recurring_charges()
+                break
+            parent = parent.parent()
+
     def _delete_charge(self):
         """Delete the selected recurring charge"""
         charge_id = self._get_selected_charge_id()
@@ -195,6 +212,7 @@ class RecurringChargesView(QWidget):
 
                 db.commit()
                 charge.delete()
+                self._notify_charge_changes()
                 self.refresh(force=True)
 
 
@@ -0,0 +1,303 @@
+"""Table model behind the transactions ledger"""
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+from PyQt6.QtGui import QColor
+from functools import lru_cache
+
+import numpy as np
+
+from ..models.transaction import Transaction
+from ..utils.formatting import display_date
+
+
+# Ledger column of the first card's Owed column (after checkbox, Date,
+# Pay Type, Description, Amount and Chase Balance)
+FIRST_CARD_COLUMN = 6
+
+# Cell text colors, shared by every cell instead of built per data() call
+RED = QColor("#f44336")
+ORANGE = QColor("#ff9800")
+GREEN = QColor("#4caf50")
+RECURRING_BLUE = QColor("#64b5f6")
+
+# Ledger cell colors by code; the model keeps one code per cell
+FOREGROUNDS = (None, GREEN, ORANGE, RED, RECURRING_BLUE)
+FG_NONE, FG_GREEN, FG_ORANGE, FG_RED, FG_BLUE = range(len(FOREGROUNDS))
+
+
+def ledger_filter_arrays(transactions: list) -> tuple:
+    """
+    Split out the fields the ledger filters test, as arrays.
+
+    Reads the row objects only, so RefreshWorker can build these off the
+    GUI thread alongside the balances.
+
+    Returns:
+        Tuple of (amounts, pay type codes, lowercased descriptions)
+    """
+    # One pass over the rows; the columns are split apart in C
+    fields = [(t.amount, t.payment_method, t.description.lower()) for t in transactions]
+    amounts, methods, descs = zip(*fields) if fields else ((), (), ())
+    return (np.array(amounts, dtype=np.float64), np.array(methods, dtype=str),
+            np.array(descs, dtype=str))
+
+
+@lru_cache(maxsize=2048)
+def _fmt_money(cents: int) -> str:
+    """Currency text for an amount in whole cents; cached since amounts repeat"""
+    return f"${cents / 100:,.2f}"
+
+
+class TransactionsTableModel(QAbstractTableModel):
+    """
+    Table model for the ledger.
+
+    Holds the transactions and their balance snapshots as plain Python data;
+    cell text is produced in data() only for the cells the view actually
+    paints and memoized until the next reset, while cell colors are coded for
+    every cell at once when rows are loaded. Columns are: posted checkbox, Date, Pay Type,
+    Description, Amount, Chase Balance, an Owed/Avail pair per card, and
+    CC Utilization.
+    """
+    posted_toggled = pyqtSignal(object, bool)  # Transaction, is_posted
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._headers = []
+        self._transactions = []
+        self._posted = []
+        self._snapshots = []
+        self._avail = []  # (rows, cards) available credit
+        self._util = []  # Per-row total card utilization
+        self._card_limits = []
+        self._limits = np.zeros(0)  # card_limits as an array, for whole-column math
+        self._total_limit = 0
+        self._display_cache = {}  # (row, col) -> formatted cell text
+        self._colors = np.zeros((0, 0), dtype=np.int8)  # (rows, cols) FOREGROUNDS codes
+        self._color_rows = []  # _colors as nested lists, for per-cell lookups
+        self._recurring = np.zeros(0, dtype=bool)  # Row has a recurring_charge_id
+        self._card_columns = {}  # column -> (card index, is_avail_column)
+        self._owed_columns = np.zeros(0, dtype=np.intp)  # Owed column per card
+        self._util_column = -1
+        self._set_filter_arrays(ledger_filter_arrays([]))
+
+    def set_columns(self, headers: list):
+        """Replace the column headers; rows are cleared until the next set_ledger"""
+        self.beginResetModel()
+        self._headers = list(headers)
+        # Resolve card columns once per layout instead of on every cell
+        self._util_column = len(headers) - 1
+        self._card_columns = {col: divmod(col - FIRST_CARD_COLUMN, 2)
+                              for col in range(FIRST_CARD_COLUMN, self._util_column)}
+        self._owed_columns = np.arange(FIRST_CARD_COLUMN, self._util_column - 1, 2)
+        self._transactions = []
+        self._posted = []
+        self._snapshots = []
+        self._avail = []
+        self._util = []
+        self._display_cache = {}
+        self._colors = np.zeros((0, len(self._headers)), dtype=np.int8)
+        self._color_rows = []
+        self._recurring = np.zeros(0, dtype=bool)
+        self._set_filter_arrays(ledger_filter_arrays([]))
+        self.endResetModel()
+
+    def set_ledger(self, transactions: list, snapshots: list, totals: list,
+                   card_limits: list, filter_arrays: tuple = None):
+        """Replace all rows in one model reset; filter_arrays, if given, is
+        ledger_filter_arrays(transactions) computed ahead of time"""
+        self.beginResetModel()
+        self._transactions = transactions
+        self._posted = [t.is_posted for t in transactions]
+        # One (rows, slots) float array, indexed as [row, slot] per cell
+        self._snapshots = np.asarray(snapshots, dtype=np.float64).reshape(
+            len(transactions), len(card_limits) + 1)
+        self._card_limits = list(card_limits)
+        self._total_limit = sum(card_limits)
+        # Avail and utilization for every row at once, rather than per cell
+        self._limits = np.asarray(self._card_limits, dtype=np.float64)
+        self._avail = self._limits - self._snapshots[:, 1:]
+        totals = np.asarray(totals, dtype=np.float64)
+        self._util = (totals / self._total_limit if self._total_limit > 0
+                      else np.zeros(len(totals)))
+        self._display_cache = {}
+        if filter_arrays is None:
+            filter_arrays = ledger_filter_arrays(transactions)
+        self._set_filter_arrays(filter_arrays)
+        self._recurring = np.array([bool(t.recurring_charge_id) for t in transactions],
+                                   dtype=bool)
+        # Money columns rounded to whole cents for every row at once; data()
+        # then only looks up the cached text for the cells that are painted
+        self._amount_cents = np.rint(self._amounts * 100).astype(np.int64).tolist()
+        self._snapshot_cents = np.rint(self._snapshots * 100).astype(np.int64).tolist()
+        self._avail_cents = np.rint(self._avail * 100).astype(np.int64).tolist()
+        self._colors = self._color_codes()
+        # Every painted cell asks for its color on each repaint; indexing
+        # Python lists is several times cheaper than a numpy scalar lookup
+        self._color_rows = self._colors.tolist()
+        self.endResetModel()
+
+    def recurring_count(self) -> int:
+        """Number of rows generated from a recurring charge"""
+        return int(np.count_nonzero(self._recurring))
+
+    def _color_codes(self) -> np.ndarray:
+        """FOREGROUNDS code for every cell, thresholded a column at a time"""
+        colors = np.zeros((len(self._transactions), len(self._headers)), dtype=np.int8)
+        columns = colors.shape[1]
+        if columns > 3:
+            # Highlight recurring transactions
+            colors[:, 3] = np.where(self._recurring, FG_BLUE, FG_NONE)
+        if columns > 4:
+            colors[:, 4] = np.where(self._amounts < 0, FG_RED, FG_GREEN)
+        if columns > 5:
+            chase = self._snapshots[:, 0]
+            colors[:, 5] = np.select([chase < 0, chase < 500], [FG_RED, FG_ORANGE])
+        # All card columns at once: (rows, cards) blocks against the limits
+        cards = min(len(self._limits), len(self._owed_columns))
+        if cards:
+            owed_columns = self._owed_columns[:cards]
+            limits = self._limits[:cards]
+            owed = self._snapshots[:, 1:cards + 1]
+            colors[:, owed_columns] = np.select([owed > limits, owed > limits * 0.8],
+                                                [FG_RED, FG_ORANGE])
+            avail = self._avail[:, :cards]
+            colors[:, owed_columns + 1] = np.select([avail < 0, avail < 100],
+                                                    [FG_RED, FG_ORANGE])
+        if FIRST_CARD_COLUMN <= self._util_column < columns:
+            util = self._util
+            colors[:, self._util_column] = np.select([util > 0.8, util > 0.5],
+                                                     [FG_RED, FG_ORANGE])
+        return colors
+
+    def _set_filter_arrays(self, filter_arrays: tuple):
+        """Keep the filterable fields as arrays so filters are vectorized"""
+        self._amounts, self._methods, self._descs = filter_arrays
+
+    def row_mask(self, pay_types: set = None, desc_filter: str = '',
+                 amount_min: float = None, amount_max: float = None,
+                 sign_filter: int = 0) -> np.ndarray:
+        """
+        Boolean array of the rows that pass the ledger filters.
+
+        Args:
+            pay_types: Pay type codes to keep, or None for all
+            desc_filter: Lowercase substring the description must contain
+            amount_min: Minimum amount, or None
+            amount_max: Maximum amount, or None
+            sign_filter: 0=All, 1=Income only, 2=Expenses only
+        """
+        amounts = self._amounts
+        mask = np.ones(len(amounts), dtype=bool)
+        if pay_types is not None:
+            mask &= np.isin(self._methods, list(pay_types))
+        if desc_filter:
+            mask &= np.char.find(self._descs, desc_filter) >= 0
+        if amount_min is not None:
+            mask &= amounts >= amount_min
+        if amount_max is not None:
+            mask &= amounts <= amount_max
+        if sign_filter == 1:
+            mask &= amounts > 0
+        elif sign_filter == 2:
+            mask &= amounts < 0
+        return mask
+
+    def transaction(self, row: int) -> Transaction:
+        """Transaction shown on a row"""
+        return self._transactions[row]
+
+    def transaction_id(self, row: int) -> int:
+        """Id of the transaction shown on a row"""
+        return self._transactions[row].id
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._transactions)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section: int, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (role == Qt.ItemDataRole.DisplayRole
+                and orientation == Qt.Orientation.Horizontal
+                and 0 <= section < len(self._headers)):
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index: QModelIndex):
+        if index.column() == 0:
+            return Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled
+        return Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            # Scrolling repaints the same cells many times; format each once
+            key = (row, col)
+            cache = self._display_cache
+            if key not in cache:
+                cache[key] = self._display(self._transactions[row], row, col)
+            return cache[key]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return FOREGROUNDS[self._color_rows[row][col]]
+        if role == Qt.ItemDataRole.CheckStateRole and col == 0:
+            return Qt.CheckState.Checked if self._posted[row] else Qt.CheckState.Unchecked
+        if role == Qt.ItemDataRole.UserRole and col in (0, 3):
+            # Transaction ID lives on the checkbox and description cells
+            return self._transactions[row].id
+        return None
+
+    def setData(self, index: QModelIndex, value, role=Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or index.column() != 0 or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        checked = Qt.CheckState(value) == Qt.CheckState.Checked
+        row = index.row()
+        if not self.set_posted(row, checked):
+            return False
+        trans = self._transactions[row]
+        if trans.id:
+            self.posted_toggled.emit(trans, checked)
+        return True
+
+    def set_posted(self, row: int, is_posted: bool) -> bool:
+        """Update one row's posted state in place; only its checkbox cell is
+        repainted. Returns False if the row already had that state."""
+        if self._posted[row] == is_posted:
+            return False
+        self._posted[row] = is_posted
+        # The row objects are shared with the view's ledger cache, so a
+        # render-only reload sees the new state too; the view drops balances
+        # computed with the old state when it saves the change
+        self._transactions[row].is_posted = is_posted
+        index = self.index(row, 0)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        return True
+
+    def _card_cents(self, row: int, col: int) -> int:
+        """What a card column shows, in cents - available credit or balance owed"""
+        i, is_avail = self._card_columns[col]
+        if is_avail:
+            return self._avail_cents[row][i]
+        return self._snapshot_cents[row][i + 1]
+
+    def _display(self, trans: Transaction, row: int, col: int):
+        if col == 0:
+            return None
+        if col == 1:
+            # Date - convert from YYYY-MM-DD to MM/DD/YYYY for display
+            return display_date(trans.date)
+        if col == 2:
+            return trans.payment_method
+        if col == 3:
+            return trans.description
+        if col == 4:
+            return _fmt_money(self._amount_cents[row])
+        if col == 5:
+            return _fmt_money(self._snapshot_cents[row][0])
+        if col == self._util_column:
+            return f"{self._util[row] * 100:.1f}%"
+        return _fmt_money(self._card_cents(row, col))
@@ -1,16 +1,23 @@
 """Transactions ledger view with running balances"""
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView, QAbstractItemView,
     QPushButton, QDialog, QFormLayout, QLineEdit,
     QComboBox, QHeaderView, QMessageBox, QDateEdit, QLabel,
     QCheckBox, QGroupBox, QProgressBar, QApplication, QMenu, QWidgetAction
 )
 from .widgets import NoScrollSpinBox, MoneySpinBox
-from PyQt6.QtCore import Qt, QDate, QThread, pyqtSignal, QSettings
-from PyQt6.QtGui import QColor, QBrush, QCursor, QAction
+from .transactions_model import TransactionsTableModel, ledger_filter_arrays
+from PyQt6.QtCore import (
+    Qt, QDate, QThread, QTimer, pyqtSignal, QSettings, QSignalBlocker
+)
+from PyQt6.QtGui import QCursor, QAction
+from bisect import insort
+from contextlib import contextmanager
 from datetime import datetime, timedelta, date
-import calendar
+from functools import lru_cache
+
+import numpy as np
 
 from ..models.transaction import Transaction
 from ..models.credit_card import CreditCard
@@ -18,7 +25,83 @@ from ..models.account import Account
 from ..models.recurring_charge import RecurringCharge
 from ..models.paycheck import PaycheckConfig
 from ..models.shared_expense import SharedExpense
-from ..utils.calculations import calculate_running_balances, get_starting_balances
+from ..utils.calculations import (
+    calculate_running_balances, compute_ledger_balances, get_starting_balances,
+    days_in_month, biweekly_dates, month_range
+)
+
+
+# Ledgers at least this long compute running balances on a worker thread
+ASYNC_REFRESH_THRESHOLD = 2000
+
+# Card columns are at least this wide; longer card names widen them so the
+# header label fits, measured once per rebuild instead of per row
+CARD_COLUMN_WIDTH = 95
+HEADER_PADDING = 24  # Header margins plus room for the sort indicator
+
+# Summary label styles, by the same thresholds as the cells
+SUMMARY_RED = "font-weight: bold; color: #f44336;"
+SUMMARY_ORANGE = "font-weight: bold; color: #ff9800;"
+SUMMARY_GREEN = "font-weight: bold; color: #4caf50;"
+
+
+@lru_cache(maxsize=512)
+def _paydays_in_month(year: int, month: int) -> int:
+    """Paydays (2 or 3) in a month, from its Friday count; cached per month"""
+    # Day-of-month of the first Friday; a fifth Friday exists exactly when
+    # four more weeks still fit in the month
+    first_friday = 1 + (4 - date(year, month, 1).weekday()) % 7
+
+    # For bi-weekly, typically 2 paychecks per month, sometimes 3
+    # If 5 Fridays, likely 3 paydays; if 4, likely 2
+    return 3 if first_friday + 28 <= days_in_month(year, month) else 2
+
+
+def _ledger_order(trans: Transaction) -> tuple:
+    """Sort key matching the ORDER BY of Transaction.get_by_date_range"""
+    return (trans.date, -trans.amount, trans.id)
+
+
+class RefreshWorker(QThread):
+    """Computes ledger running balances in a background thread.
+
+    A superseded worker is asked to stop through cancel(); it then skips
+    its remaining steps and finishes with None.
+    """
+    finished = pyqtSignal(int, object)  # generation, (snapshots, totals, filter arrays) or None
+    error = pyqtSignal(int, str)      # generation, message
+    progress = pyqtSignal(int, int)   # generation, percent
+
+    def __init__(self, generation: int, ledger: dict):
+        super().__init__()
+        self.generation = generation
+        self.ledger = ledger
+        self.cancelled = False
+
+    def cancel(self):
+        """Ask the worker to skip its remaining steps (safe from any thread)"""
+        self.cancelled = True
+
+    def run(self):
+        ledger = self.ledger
+        try:
+            self.progress.emit(self.generation, 25)
+            if self.cancelled:
+                self.finished.emit(self.generation, None)
+                return
+            result = compute_ledger_balances(
+                ledger['transactions'], ledger['starting'], ledger['initial'],
+                ledger['code_to_idx'], ledger['cc_payment_map'], ledger['cc_name_map']
+            )
+            self.progress.emit(self.generation, 75)
+            if self.cancelled:
+                self.finished.emit(self.generation, None)
+                return
+            # Filter arrays too, so the GUI thread only swaps data in
+            self.finished.emit(self.generation,
+                               (*result, ledger_filter_arrays(ledger['transactions'])))
+        except Exception as e:
+            self.error.emit(self.generation, str(e))
 
 
 class TransactionsView(QWidget):
@@ -28,8 +111,57 @@ class TransactionsView(QWidget):
         super().__init__()
         self._first_load = True
         self._data_dirty = True  # Track if data needs reload
+        self._render_dirty = False  # Table needs repopulating, data unchanged
+        self._ledger_cache = None  # Inputs fetched for the current date range
+        self._payment_methods_cache = None  # (label, code) pairs for TransactionDialog
+        self._recurring_charges_cache = None  # RecurringCharge.get_all(), kept across date changes
+        self._cc_payment_map_cache = None  # (card order, cc_payment_map, cc_name_map)
+        self._bulk_depth = 0  # refresh() is suppressed while inside bulk_mode()
+        self._pending_refresh = False  # refresh() was skipped while the tab was hidden
+        self._row_visible = None  # Filter mask last applied to the table rows
         self._last_from_date = None
         self._last_to_date = None
+
+        # Background refresh bookkeeping (see RefreshWorker)
+        self._loading = False
+        self._refresh_generation = 0
+        self._refresh_workers = {}
+
+        # One settings handle for the view; the hidden-column list mirrors
+        # what was last persisted so unchanged lists are not rewritten
+        self._settings = QSettings("BudgetApp", "PersonalBudgetManager")
+        self._hidden_columns = []
+
+        # Debounce column width persistence while a header is being dragged
+        self._save_widths_timer = QTimer(self)
+        self._save_widths_timer.setSingleShot(True)
+        self._save_widths_timer.setInterval(500)
+        self._save_widths_timer.timeout.connect(self._save_column_widths_now)
+
+        # Likewise coalesce clicks in the columns menu into one settings write
+        self._save_visibility_timer = QTimer(self)
+        self._save_visibility_timer.setSingleShot(True)
+        self._save_visibility_timer.setInterval(400)
+        self._save_visibility_timer.timeout.connect(self._save_column_visibility)
+
+        # Coalesce rapid pay-type toggles into a single reload
+        self._pay_type_timer = QTimer(self)
+        self._pay_type_timer.setSingleShot(True)
+        self._pay_type_timer.setInterval(150)
+        self._pay_type_timer.timeout.connect(self._apply_pay_type_filter)
+
+        # Re-filter once typing in the text filters pauses
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(200)
+        self._filter_timer.timeout.connect(self._apply_filters)
+
+        # Coalesce back-to-back add/edit/delete refreshes into one
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self.refresh)
+
         self._setup_ui()
 
     def _setup_ui(self):
@@ -98,6 +230,7 @@ class TransactionsView(QWidget):
         self.pay_type_btn = QPushButton("All ▼")
         self.pay_type_menu = QMenu(self)
         self.pay_type_btn.setMenu(self.pay_type_menu)
+        self.pay_type_menu.aboutToHide.connect(self._flush_pay_type_filter)
         toolbar.addWidget(self.pay_type_btn)
 
         # Columns visibility button with dropdown menu
@@ -119,7 +252,7 @@ class TransactionsView(QWidget):
         self.desc_filter = QLineEdit()
         self.desc_filter.setPlaceholderText("Search...")
         self.desc_filter.setFixedWidth(150)
-        self.desc_filter.textChanged.connect(self._apply_filters)
+        self.desc_filter.textChanged.connect(self._schedule_filters)
         filter_layout.addWidget(self.desc_filter)
 
         # Amount min filter
@@ -127,7 +260,7 @@ class TransactionsView(QWidget):
         self.amount_min_filter = QLineEdit()
         self.amount_min_filter.setPlaceholderText("e.g. -500")
         self.amount_min_filter.setFixedWidth(80)
-        self.amount_min_filter.textChanged.connect(self._apply_filters)
+        self.amount_min_filter.textChanged.connect(self._schedule_filters)
         filter_layout.addWidget(self.amount_min_filter)
 
         # Amount max filter
@@ -135,7 +268,7 @@ class TransactionsView(QWidget):
         self.amount_max_filter = QLineEdit()
         self.amount_max_filter.setPlaceholderText("e.g. 5000")
         self.amount_max_filter.setFixedWidth(80)
-        self.amount_max_filter.textChanged.connect(self._apply_filters)
+        self.amount_max_filter.textChanged.connect(self._schedule_filters)
         filter_layout.addWidget(self.amount_max_filter)
 
         # Show only positive/negative
@@ -166,7 +299,9 @@ class TransactionsView(QWidget):
         layout.addLayout(info_layout)
 
         # Main table
-        self.table = QTableWidget()
+        self.model = TransactionsTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self._setup_table_columns()
         layout.addWidget(self.table)
 
@@ -193,80 +328,89 @@ class TransactionsView(QWidget):
         """Set up table columns dynamically based on available cards"""
         # Base columns - checkbox column first (checkmark symbol as header)
         self._base_columns = ["\u2713", "Date", "Pay Type", "Description", "Amount", "Chase Balance"]
-        columns = self._base_columns.copy()
-
-        # Add columns for each credit card (both Owed and Avail)
-        self._cards = CreditCard.get_all()
-        self._card_owed_columns = []
-        self._card_avail_columns = []
-        for card in self._cards:
-            owed_col = f"{card.name} Owed"
-            avail_col = f"{card.name} Avail"
-            columns.append(owed_col)
-            columns.append(avail_col)
-            self._card_owed_columns.append(owed_col)
-            self._card_avail_columns.append(avail_col)
-
-        columns.append("CC Utilization")
-        self._all_columns = columns
-
-        self.table.setColumnCount(len(columns))
-        self.table.setHorizontalHeaderLabels(columns)
+        self._cards = []
+        self._cards_sig = None
 
         # Make columns user-resizable
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         header.setStretchLastSection(True)
 
-        # Set default column widths
-        default_widths = {
-            "\u2713": 35,
-            "Date": 90,
-            "Pay Type": 70,
-            "Description": 200,
-            "Amount": 100,
-            "Chase Balance": 110,
-            "CC Utilization": 100
-        }
-        for i, col in enumerate(columns):
-            if col in default_widths:
-                self.table.setColumnWidth(i, default_widths[col])
-            elif "Owed" in col or "Avail" in col:
-                self.table.setColumnWidth(i, 95)
+        # Every row keeps the style's default height, so Qt never measures
+        # cell contents to size rows
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+
+        with self._batch_column_updates():
+            # Card-dependent columns and the columns / pay type menus
+            self._ensure_columns(CreditCard.get_all())
 
-        # Restore saved column widths
-        self._load_column_widths()
+            # Restore saved column widths
+            self._load_column_widths()
 
         # Connect to save column widths when resized
         header.sectionResized.connect(self._save_column_widths)
 
         self.table.setAlternatingRowColors(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.doubleClicked.connect(self._edit_transaction)
 
         # Connect checkbox changes to handler
-        self.table.itemChanged.connect(self._on_item_changed)
-
-        # Set up the columns visibility menu
-        self._setup_columns_menu()
-
-        # Set up the payment type filter menu
+        self.model.posted_toggled.connect(self._post_transaction)
+        self.model.modelReset.connect(self._track_rows_after_reset)
+
+    def _ensure_columns(self, cards: list) -> bool:
+        """
+        Make the card columns match the given cards.
+
+        Columns and menus are only rebuilt when cards were added, removed or
+        renamed; otherwise the current (possibly user-sorted) column order is
+        kept and just the card data is updated.
+
+        Returns:
+            True if the columns were rebuilt
+        """
+        sig = tuple(sorted((c.id, c.name) for c in cards))
+        if sig == self._cards_sig:
+            by_id = {c.id: c for c in cards}
+            self._cards = [by_id[c.id] for c in self._cards]
+            return False
+
+        self._cards = list(cards)
+        self._cards_sig = sig
+        self._rebuild_columns_with_sorted_cards()
         self._setup_pay_type_menu()
+        return True
 
     def _save_column_widths(self):
+        """Schedule saving column widths (restarts on every resize event)"""
+        self._save_widths_timer.start()
+
+    def _save_column_widths_now(self):
         """Save column widths to settings"""
-        settings = QSettings("BudgetApp", "PersonalBudgetManager")
         widths = []
-        for i in range(self.table.columnCount()):
+        for i in range(self.model.columnCount()):
             widths.append(self.table.columnWidth(i))
-        settings.setValue("transactions/column_widths", widths)
+        self._settings.setValue("transactions/column_widths", widths)
+
+    def showEvent(self, event):
+        """Run a refresh that was deferred while the view was hidden"""
+        super().showEvent(event)
+        if self._pending_refresh:
+            self.refresh()
+
+    def hideEvent(self, event):
+        """Flush any pending column width/visibility save before the view is hidden"""
+        if self._save_widths_timer.isActive():
+            self._save_widths_timer.stop()
+            self._save_column_widths_now()
+        self._flush_column_visibility()
+        super().hideEvent(event)
 
     def _load_column_widths(self):
         """Load column widths from settings"""
-        settings = QSettings("BudgetApp", "PersonalBudgetManager")
-        widths = settings.value("transactions/column_widths")
-        if widths and len(widths) == self.table.columnCount():
+        widths = self._settings.value("transactions/column_widths")
+        if widths and len(widths) == self.model.columnCount():
             for i, width in enumerate(widths):
                 if isinstance(width, int) and width > 0:
                     self.table.setColumnWidth(i, width)
@@ -334,10 +478,11 @@ class TransactionsView(QWidget):
         self.columns_menu.addSeparator()
 
         # Load saved visibility settings
-        settings = QSettings("BudgetApp", "PersonalBudgetManager")
+        settings = self._settings
         hidden_columns = settings.value("transactions/hidden_columns", [])
         if hidden_columns is None:
             hidden_columns = []
+        self._hidden_columns = list(hidden_columns)
 
         # Add checkable action for each credit card column (both Owed and Avail)
         # Using QWidgetAction with QCheckBox so menu stays open for multi-select
@@ -363,35 +508,61 @@ class TransactionsView(QWidget):
                     self.table.setColumnHidden(i, True)
                     checkbox.setChecked(False)
 
+    @contextmanager
+    def _batch_column_updates(self):
+        """Hide/show many columns with a single repaint and header relayout"""
+        was_enabled = self.table.updatesEnabled()
+        self.table.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(self.table.horizontalHeader())
+        try:
+            yield
+        finally:
+            blocker.unblock()
+            self.table.setUpdatesEnabled(was_enabled)
+            if was_enabled:
+                self.table.viewport().update()
+
+    def _set_column_visible(self, column_index: int, visible: bool):
+        """Set a column's visibility and its menu checkbox without re-saving"""
+        self.table.setColumnHidden(column_index, not visible)
+        checkbox = self._column_checkboxes.get(column_index)
+        if checkbox is not None:
+            # The caller saves once; skip the per-checkbox _toggle_column
+            checkbox.blockSignals(True)
+            checkbox.setChecked(visible)
+            checkbox.blockSignals(False)
+
     def _toggle_column(self, column_index: int, visible: bool):
         """Toggle visibility of a column"""
         self.table.setColumnHidden(column_index, not visible)
-        self._save_column_visibility()
+        self._save_visibility_timer.start()
+
+    def _flush_column_visibility(self):
+        """Write a pending column visibility change immediately"""
+        if self._save_visibility_timer.isActive():
+            self._save_column_visibility()
 
     def _show_all_columns(self):
         """Show all columns"""
-        for i in range(self.table.columnCount()):
-            self.table.setColumnHidden(i, False)
-            if i in self._column_checkboxes:
-                self._column_checkboxes[i].setChecked(True)
+        with self._batch_column_updates():
+            for i in range(self.model.columnCount()):
+                self._set_column_visible(i, True)
         self._save_column_visibility()
 
     def _hide_all_cc_columns(self):
         """Hide all credit card columns"""
-        for i, col_name in enumerate(self._all_columns):
-            if "Owed" in col_name or "Avail" in col_name:
-                self.table.setColumnHidden(i, True)
-                if i in self._column_checkboxes:
-                    self._column_checkboxes[i].setChecked(False)
+        with self._batch_column_updates():
+            for i, col_name in enumerate(self._all_columns):
+                if "Owed" in col_name or "Avail" in col_name:
+                    self._set_column_visible(i, False)
         self._save_column_visibility()
 
     def _toggle_column_group(self, group_type: str, visible: bool):
         """Toggle visibility of a group of columns (Owed or Avail)"""
-        for i, col_name in enumerate(self._all_columns):
-            if group_type in col_name:
-                self.table.setColumnHidden(i, not visible)
-                if i in self._column_checkboxes:
-                    self._column_checkboxes[i].setChecked(visible)
+        with self._batch_column_updates():
+            for i, col_name in enumerate(self._all_columns):
+                if group_type in col_name:
+                    self._set_column_visible(i, visible)
         self._save_column_visibility()
 
     def _toggle_zero_owed_columns(self, visible: bool):
@@ -399,21 +570,22 @@ class TransactionsView(QWidget):
         # Get current card balances
         card_balances = {c.name: c.current_balance for c in self._cards}
 
-        for i, col_name in enumerate(self._all_columns):
-            if "Owed" in col_name:
-                # Extract card name from column name (e.g., "Amex Owed" -> "Amex")
-                card_name = col_name.replace(" Owed", "")
-                # Check if this card has $0 balance
-                if card_balances.get(card_name, -1) == 0:
-                    self.table.setColumnHidden(i, not visible)
-                    if i in self._column_checkboxes:
-                        self._column_checkboxes[i].setChecked(visible)
+        with self._batch_column_updates():
+            for i, col_name in enumerate(self._all_columns):
+                if "Owed" in col_name:
+                    # Extract card name from column name (e.g., "Amex Owed" -> "Amex")
+                    card_name = col_name.replace(" Owed", "")
+                    # Check if this card has $0 balance
+                    if card_balances.get(card_name, -1) == 0:
+                        self._set_column_visible(i, visible)
         self._save_column_visibility()
 
     def _sort_cc_columns(self, descending: bool = True):
         """Sort credit card columns by current balance"""
         # Sort cards by balance
         sorted_cards = sorted(self._cards, key=lambda c: c.current_balance, reverse=descending)
+        if [c.id for c in sorted_cards] == [c.id for c in self._cards]:
+            return  # Already in this order; rebuilding would only repaint
 
         # Update the internal cards list
         self._cards = sorted_cards
@@ -421,15 +593,15 @@ class TransactionsView(QWidget):
         # Rebuild the table columns with new order
         self._rebuild_columns_with_sorted_cards()
 
-        # Refresh data to populate with new column order
-        self.mark_dirty()
+        # Repopulate with the new column order; the data itself is unchanged
+        self._render_dirty = True
         self.refresh()
 
     def _rebuild_columns_with_sorted_cards(self):
         """Rebuild column structure after sorting cards"""
-        # Preserve current visibility settings
-        settings = QSettings("BudgetApp", "PersonalBudgetManager")
-        hidden_columns = settings.value("transactions/hidden_columns", [])
+        # Preserve current visibility settings, including a pending change
+        self._flush_column_visibility()
+        hidden_columns = self._settings.value("transactions/hidden_columns", [])
         if hidden_columns is None:
             hidden_columns = []
 
@@ -449,47 +621,58 @@ class TransactionsView(QWidget):
         columns.append("CC Utilization")
         self._all_columns = columns
 
-        # Update table headers
-        self.table.setColumnCount(len(columns))
-        self.table.setHorizontalHeaderLabels(columns)
-
-        # Set default column widths
-        default_widths = {
-            "\u2713": 35,
-            "Date": 90,
-            "Pay Type": 70,
-            "Description": 200,
-            "Amount": 100,
-            "Chase Balance": 110,
-            "CC Utilization": 100
-        }
-        for i, col in enumerate(columns):
-            if col in default_widths:
-                self.table.setColumnWidth(i, default_widths[col])
-            elif "Owed" in col or "Avail" in col:
-                self.table.setColumnWidth(i, 95)
-
-        # Rebuild the columns menu
-        self._setup_columns_menu()
-
-        # Restore visibility settings
-        for i, col_name in enumerate(self._all_columns):
-            if col_name in hidden_columns:
-                self.table.setColumnHidden(i, True)
-                if i in self._column_checkboxes:
-                    self._column_checkboxes[i].setChecked(False)
+        with self._batch_column_updates():
+            # Update table headers; visibility is re-applied from settings below
+            self.model.set_columns(columns)
+            for i in range(len(columns)):
+                self.table.setColumnHidden(i, False)
+
+            # Set default column widths
+            default_widths = {
+                "\u2713": 35,
+                "Date": 90,
+                "Pay Type": 70,
+                "Description": 200,
+                "Amount": 100,
+                "Chase Balance": 110,
+                "CC Utilization": 100
+            }
+            metrics = self.table.horizontalHeader().fontMetrics()
+            for i, col in enumerate(columns):
+                if col in default_widths:
+                    self.table.setColumnWidth(i, default_widths[col])
+                elif "Owed" in col or "Avail" in col:
+                    self.table.setColumnWidth(i, max(
+                        CARD_COLUMN_WIDTH, metrics.horizontalAdvance(col) + HEADER_PADDING))
+
+            # Rebuild the columns menu
+            self._setup_columns_menu()
+
+            # Restore visibility settings
+            for i, col_name in enumerate(self._all_columns):
+                if col_name in hidden_columns:
+                    self._set_column_visible(i, False)
+
+        # Header signals were blocked above; persist the new column layout
+        self._save_column_widths()
 
     def _save_column_visibility(self):
-        """Save column visibility to settings"""
-        settings = QSettings("BudgetApp", "PersonalBudgetManager")
+        """Save column visibility to settings (skipped when unchanged)"""
+        self._save_visibility_timer.stop()  # Saving now supersedes a pending save
         hidden = []
         for i, col_name in enumerate(self._all_columns):
             if self.table.isColumnHidden(i):
                 hidden.append(col_name)
-        settings.setValue("transactions/hidden_columns", hidden)
+        if hidden == self._hidden_columns and self._settings.contains("transactions/hidden_columns"):
+            return
+        self._settings.setValue("transactions/hidden_columns", hidden)
+        self._hidden_columns = hidden
 
     def _setup_pay_type_menu(self):
         """Set up the payment type filter menu"""
+        # Keep deselected types deselected when the menu is rebuilt
+        unchecked = {code for code, action in getattr(self, '_pay_type_actions', {}).items()
+                     if not action.isChecked()}
         self.pay_type_menu.clear()
         self._pay_type_actions = {}
 
@@ -507,7 +690,7 @@ class TransactionsView(QWidget):
         # Add Chase (Bank account)
         chase_action = QAction("Chase (Bank)", self)
         chase_action.setCheckable(True)
-        chase_action.setChecked(True)
+        chase_action.setChecked("C" not in unchecked)
         chase_action.setData("C")
         chase_action.triggered.connect(self._update_pay_type_filter)
         self.pay_type_menu.addAction(chase_action)
@@ -517,12 +700,15 @@ class TransactionsView(QWidget):
         for card in self._cards:
             action = QAction(card.name, self)
             action.setCheckable(True)
-            action.setChecked(True)
+            action.setChecked(card.pay_type_code not in unchecked)
             action.setData(card.pay_type_code)
             action.triggered.connect(self._update_pay_type_filter)
             self.pay_type_menu.addAction(action)
             self._pay_type_actions[card.pay_type_code] = action
 
+        self._selected_pay_types = self._checked_pay_types()
+        self._update_pay_type_button()
+
     def _select_all_pay_types(self):
         """Select all payment types"""
         for action in self._pay_type_actions.values():
@@ -535,9 +721,25 @@ class TransactionsView(QWidget):
             action.setChecked(False)
         self._update_pay_type_filter()
 
+    def _checked_pay_types(self) -> frozenset:
+        """Pay type codes currently checked in the menu"""
+        return frozenset(code for code, action in self._pay_type_actions.items()
+                         if action.isChecked())
+
     def _update_pay_type_filter(self):
-        """Update the filter button text and refresh if needed"""
-        selected = [code for code, action in self._pay_type_actions.items() if action.isChecked()]
+        """Update the filter button text and schedule re-filtering"""
+        selected = self._checked_pay_types()
+        if selected == self._selected_pay_types:
+            return  # e.g. "Select All" with everything already selected
+        self._selected_pay_types = selected
+        self._update_pay_type_button()
+
+        # Re-filter once the user stops clicking (or closes the menu)
+        self._pay_type_timer.start()
+
+    def _update_pay_type_button(self):
+        """Show the pay type selection summary on the filter button"""
+        selected = self._selected_pay_types
         total = len(self._pay_type_actions)
 
         if len(selected) == total:
@@ -547,26 +749,110 @@ class TransactionsView(QWidget):
         else:
             self.pay_type_btn.setText(f"{len(selected)}/{total} ▼")
 
-        self.mark_dirty()
-        self.refresh()
+    def _apply_pay_type_filter(self):
+        """Apply the current pay-type selection to the loaded rows"""
+        self._pay_type_timer.stop()
+        self._apply_filters()
+
+    def _flush_pay_type_filter(self):
+        """Apply a pending pay-type change immediately"""
+        if self._pay_type_timer.isActive():
+            self._apply_pay_type_filter()
 
-    def _get_selected_pay_types(self) -> list:
-        """Get list of selected payment type codes"""
-        if not hasattr(self, '_pay_type_actions'):
-            return None  # No filter applied
-        return [code for code, action in self._pay_type_actions.items() if action.isChecked()]
+    def _get_selected_pay_types(self) -> frozenset:
+        """Get the selected payment type codes"""
+        # None until the pay type menu exists: no filter applied
+        return getattr(self, '_selected_pay_types', None)
 
     def mark_dirty(self):
         """Mark data as dirty so next refresh reloads from database"""
         self._data_dirty = True
+        self._ledger_cache = None
+        self._payment_methods_cache = None
+        self._recurring_charges_cache = None
+        self._cc_payment_map_cache = None
+
+    def _update_ledger(self, removed_ids=(), added=()):
+        """
+        Patch the cached ledger rows after a transaction add, edit or delete.
+
+        Cards and recurring charges are untouched by these, so their caches
+        and the column layout stay valid; only the affected rows change in
+        place of re-querying the date range. Balances are recomputed for the
+        patched rows on the next refresh. Without a cached ledger this falls
+        back to a full reload.
+        """
+        cache = self._ledger_cache
+        if cache is None or self._data_dirty:
+            self.mark_dirty()
+            self._schedule_refresh()
+            return
+
+        # Build a new list: a RefreshWorker may still be reading the old one.
+        # Rows posted since the load are left out, as a reload of the range
+        # would (the view lists unposted rows only)
+        removed = set(removed_ids)
+        rows = [t for t in cache['transactions']
+                if not t.is_posted and t.id not in removed]
+        from_date, to_date = cache['key']
+        for trans in added:
+            # The view lists unposted rows within the date range only
+            if not trans.is_posted and from_date <= trans.date <= to_date:
+                insort(rows, trans, key=_ledger_order)
+
+        cache['transactions'] = rows
+        cache['results'] = {}  # Computed for the old rows
+        self._render_dirty = True
+        self._schedule_refresh()
+
+    def _refresh_cached_balances(self, trans: Transaction):
+        """
+        Bring the ledger cache up to date after a posting change was saved.
+
+        The cache is keyed on the date range only, but posting a transaction
+        saves new account and card balances without changing the range, so
+        the cached starting balances are re-read. Balances already computed
+        for any card order used the row's old posted state and are dropped;
+        the cached row is the model's own object and already has the new state.
+        """
+        cache = self._ledger_cache
+        if cache is None:
+            return
+        cache['starting'] = get_starting_balances()
+        cache['results'] = {}
+
+    def invalidate_cards(self):
+        """Drop cached card and charge data after cards are edited elsewhere"""
+        self.mark_dirty()
+
+    def invalidate_recurring_charges(self):
+        """Drop cached charges and CC payment maps after charges are edited elsewhere"""
+        self.mark_dirty()
+
+    def _payment_methods(self) -> list:
+        """(label, pay type code) pairs for the dialog, cached until mark_dirty"""
+        if self._payment_methods_cache is None:
+            self._payment_methods_cache = [("Chase (Bank)", "C")] + [
+                (card.name, card.pay_type_code) for card in CreditCard.get_all()]
+        return self._payment_methods_cache
+
+    def _schedule_filters(self):
+        """Re-filter after a pause in typing instead of on every keystroke"""
+        self._filter_timer.start()
 
     def _apply_filters(self):
         """Apply column filters to hide/show rows"""
+        self._filter_timer.stop()  # Applying now supersedes a pending pass
         desc_filter = self.desc_filter.text().lower().strip()
         amount_min_text = self.amount_min_filter.text().strip()
         amount_max_text = self.amount_max_filter.text().strip()
         sign_filter = self.amount_sign_filter.currentIndex()  # 0=All, 1=Income, 2=Expenses
 
+        # Pay type filter only applies when some types are deselected
+        pay_types = self._get_selected_pay_types()
+        if pay_types is not None and len(pay_types) >= len(self._pay_type_actions):
+            pay_types = None
+
         # Parse amount filters
         amount_min = None
         amount_max = None
@@ -581,39 +867,34 @@ class TransactionsView(QWidget):
         except ValueError:
             pass
 
-        # Apply filters to each row
-        for row in range(self.table.rowCount()):
-            show_row = True
-
-            # Description filter (column 3)
-            if desc_filter:
-                desc_item = self.table.item(row, 3)
-                if desc_item and desc_filter not in desc_item.text().lower():
-                    show_row = False
-
-            # Amount filter (column 4)
-            if show_row and (amount_min is not None or amount_max is not None or sign_filter != 0):
-                amount_item = self.table.item(row, 4)
-                if amount_item:
-                    try:
-                        amount_text = amount_item.text().replace('$', '').replace(',', '').strip()
-                        amount = float(amount_text)
-
-                        # Check min/max
-                        if amount_min is not None and amount < amount_min:
-                            show_row = False
-                        if amount_max is not None and amount > amount_max:
-                            show_row = False
-
-                        # Check sign filter
-                        if sign_filter == 1 and amount <= 0:  # Income only
-                            show_row = False
-                        elif sign_filter == 2 and amount >= 0:  # Expenses only
-                            show_row = False
-                    except ValueError:
-                        pass
-
-            self.table.setRowHidden(row, not show_row)
+        visible = self.model.row_mask(pay_types, desc_filter, amount_min,
+                                      amount_max, sign_filter)
+
+        # Only touch rows whose visibility differs from what the table
+        # currently shows (tracked across model resets)
+        previous = self._row_visible
+        if previous is None or len(previous) != len(visible):
+            changed = range(len(visible))
+        else:
+            changed = np.flatnonzero(visible != previous).tolist()
+        for row in changed:
+            self.table.setRowHidden(row, not visible[row])
+        self._row_visible = visible
+
+    def _track_rows_after_reset(self):
+        """
+        Carry the applied filter mask across a model reset.
+
+        The vertical header keeps the hidden flag of every row index that
+        still exists and shows rows past the old count, so a reload with
+        unchanged filters touches no rows instead of setting all of them.
+        """
+        previous = self._row_visible
+        visible = np.ones(self.model.rowCount(), dtype=bool)
+        if previous is not None:
+            kept = min(len(visible), len(previous))
+            visible[:kept] = previous[:kept]
+        self._row_visible = visible
 
     def _clear_filters(self):
         """Clear all column filters"""
@@ -621,16 +902,28 @@ class TransactionsView(QWidget):
         self.amount_min_filter.setText("")
         self.amount_max_filter.setText("")
         self.amount_sign_filter.setCurrentIndex(0)
-        # Show all rows
-        for row in range(self.table.rowCount()):
-            self.table.setRowHidden(row, False)
+        # Show all rows (the pay type selection still applies)
+        self._apply_filters()
 
     def refresh(self):
         """Refresh the table with transactions and running balances"""
-        # On first load, auto-generate recurring transactions if none exist
+        # This call covers any refresh _schedule_refresh() still has pending
+        self._refresh_timer.stop()
+        if self._bulk_depth:
+            return  # bulk_mode() refreshes once on exit
+
+        # A background tab only notes the request; showEvent() catches up
+        if self.window() is not self and not self.isVisible():
+            self._pending_refresh = True
+            return
+        self._pending_refresh = False
+
+        # On first load, auto-generate recurring transactions if none exist.
+        # This refresh loads the result, so generation must not refresh too.
         if self._first_load:
             self._first_load = False
-            self._auto_generate_if_needed()
+            with self.bulk_mode(refresh=False):
+                self._auto_generate_if_needed()
             self._data_dirty = True  # Force load on first view
 
         # Check if date range changed
@@ -640,225 +933,258 @@ class TransactionsView(QWidget):
                         current_to != self._last_to_date)
 
         # Skip refresh if data hasn't changed and dates are the same
-        if not self._data_dirty and not dates_changed:
+        if not self._data_dirty and not self._render_dirty and not dates_changed:
             return
 
+        data_dirty = self._data_dirty
         self._last_from_date = current_from
         self._last_to_date = current_to
         self._data_dirty = False
+        self._render_dirty = False
+        if data_dirty:
+            self._ledger_cache = None
 
-        # Show loading state
-        self.info_label.setText("Loading transactions...")
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setValue(0)
-        QApplication.setOverrideCursor(QCursor(Qt.CursorShape.WaitCursor))
-        QApplication.processEvents()
-
+        self._begin_loading()
         try:
-            # Get date range
-            from_date = self.from_date.date().toString("yyyy-MM-dd")
-            to_date = self.to_date.date().toString("yyyy-MM-dd")
-
-            # Get transactions (only non-posted for planning view)
-            all_transactions = Transaction.get_by_date_range(from_date, to_date)
-            # Filter out posted transactions - they appear in the Posted tab
-            all_transactions = [t for t in all_transactions if not t.is_posted]
-
-            # Filter by selected payment types
-            selected_pay_types = self._get_selected_pay_types()
-            if selected_pay_types is not None and len(selected_pay_types) < len(self._pay_type_actions):
-                transactions = [t for t in all_transactions if t.payment_method in selected_pay_types]
-            else:
-                transactions = all_transactions
-
-            self.progress_bar.setValue(20)
-            QApplication.processEvents()
-
-            # Get starting balances
-            starting = get_starting_balances()
-
-            # Use self._cards for column mapping (preserves sort order)
-            cards = self._cards
-            card_codes = [c.pay_type_code for c in cards]
-            card_code_set = set(card_codes)
-            card_limits = {c.pay_type_code: c.credit_limit for c in cards}
-            self.progress_bar.setValue(30)
-            QApplication.processEvents()
-
-            # Calculate running balances (optimized inline version)
-            running = starting.copy()
-            total_limit = sum(c.credit_limit for c in cards)
-
-            # Build cache of recurring charges that are credit card payments
-            # Maps recurring_charge_id -> pay_type_code of the linked card
-            cc_payment_map = {}
-            # Fallback: maps description -> pay_type_code for manual transactions
-            cc_name_map = {}
-            card_id_to_code = {c.id: c.pay_type_code for c in cards}
-            for charge in RecurringCharge.get_all():
-                if charge.linked_card_id and charge.linked_card_id in card_id_to_code:
-                    cc_payment_map[charge.id] = card_id_to_code[charge.linked_card_id]
-                    cc_name_map[charge.name] = card_id_to_code[charge.linked_card_id]
-
-            # Block table signals during population for performance
-            self.table.blockSignals(True)
-            self.table.setUpdatesEnabled(False)
-            self.table.setRowCount(len(transactions))
-
-            total_count = len(transactions)
-            recurring_count = 0
-
-            for row, trans in enumerate(transactions):
-                if trans.recurring_charge_id:
-                    recurring_count += 1
-
-                method = trans.payment_method
-
-                # Update the relevant balance - only for non-posted transactions
-                # Posted transactions are already reflected in the current balance
-                if method in running and not trans.is_posted:
-                    if method in card_code_set:
-                        running[method] -= trans.amount  # CC: charges increase owed, refunds decrease
-                    else:
-                        running[method] += trans.amount  # Bank accounts: normal direction
-
-                    # If this is a credit card payment, also update the card's balance
-                    # The payment reduces the card's debt (amount is negative, so it reduces owed)
-                    linked_card_code = None
-                    if trans.recurring_charge_id and trans.recurring_charge_id in cc_payment_map:
-                        linked_card_code = cc_payment_map[trans.recurring_charge_id]
-                    elif trans.description in cc_name_map:
-                        # Fallback for manual CC payments matching a known charge name
-                        linked_card_code = cc_name_map[trans.description]
-                    if linked_card_code and linked_card_code in running:
-                        # Payment amount is negative (from Chase), reduces card debt
-                        running[linked_card_code] += trans.amount  # trans.amount is already negative
-
-                # Calculate utilization
-                total_balance = sum(running.get(c.pay_type_code, 0) for c in cards)
-                utilization = total_balance / total_limit if total_limit > 0 else 0
-
-                # Posted checkbox (column 0)
-                checkbox_item = QTableWidgetItem()
-                checkbox_item.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
-                checkbox_item.setCheckState(Qt.CheckState.Checked if trans.is_posted else Qt.CheckState.Unchecked)
-                checkbox_item.setData(Qt.ItemDataRole.UserRole, trans.id)  # Store transaction ID
-                self.table.setItem(row, 0, checkbox_item)
-
-                # Date - convert from YYYY-MM-DD to MM/DD/YYYY for display
-                iso_date = trans.date[:10]
-                display_date = f"{iso_date[5:7]}/{iso_date[8:10]}/{iso_date[:4]}"
-                date_item = QTableWidgetItem(display_date)
-                self.table.setItem(row, 1, date_item)
-
-                # Pay Type
-                self.table.setItem(row, 2, QTableWidgetItem(trans.payment_method))
-
-                # Description - highlight recurring transactions
-                desc_item = QTableWidgetItem(trans.description)
-                desc_item.setData(Qt.ItemDataRole.UserRole, trans.id)
-                if trans.recurring_charge_id:
-                    desc_item.setForeground(QColor("#64b5f6"))
-                self.table.setItem(row, 3, desc_item)
-
-                # Amount
-                amount_item = QTableWidgetItem(f"${trans.amount:,.2f}")
-                if trans.amount < 0:
-                    amount_item.setForeground(QColor("#f44336"))
-                else:
-                    amount_item.setForeground(QColor("#4caf50"))
-                self.table.setItem(row, 4, amount_item)
-
-                # Chase Balance
-                chase_balance = running.get('C', 0)
-                chase_item = QTableWidgetItem(f"${chase_balance:,.2f}")
-                if chase_balance < 0:
-                    chase_item.setForeground(QColor("#f44336"))
-                elif chase_balance < 500:
-                    chase_item.setForeground(QColor("#ff9800"))
-                self.table.setItem(row, 5, chase_item)
-
-                # Credit card Owed and Available columns
-                for i, code in enumerate(card_codes):
-                    owed = running.get(code, 0)
-                    avail = card_limits.get(code, 0) - owed
-
-                    # Owed column
-                    owed_item = QTableWidgetItem(f"${owed:,.2f}")
-                    if owed > card_limits.get(code, 0):
-                        owed_item.setForeground(QColor("#f44336"))
-                    elif owed > card_limits.get(code, 0) * 0.8:
-                        owed_item.setForeground(QColor("#ff9800"))
-                    self.table.setItem(row, 6 + (i * 2), owed_item)
-
-                    # Avail column
-                    avail_item = QTableWidgetItem(f"${avail:,.2f}")
-                    if avail < 0:
-                        avail_item.setForeground(QColor("#f44336"))
-                    elif avail < 100:
-                        avail_item.setForeground(QColor("#ff9800"))
-                    self.table.setItem(row, 6 + (i * 2) + 1, avail_item)
-
-                # Utilization (after all card columns)
-                util_col = 6 + (len(card_codes) * 2)
-                util_item = QTableWidgetItem(f"{utilization * 100:.1f}%")
-                if utilization > 0.8:
-                    util_item.setForeground(QColor("#f44336"))
-                elif utilization > 0.5:
-                    util_item.setForeground(QColor("#ff9800"))
-                self.table.setItem(row, util_col, util_item)
-
-                # Update progress every 50 rows
-                if row % 50 == 0:
-                    progress = 30 + int((row / max(total_count, 1)) * 65)
-                    self.progress_bar.setValue(progress)
-                    QApplication.processEvents()
-
-            # Re-enable table updates
-            self.table.setUpdatesEnabled(True)
-            self.table.blockSignals(False)
-
-            # Update info label
-            self.info_label.setText(
-                f"Showing {total_count} transactions ({recurring_count} recurring, "
-                f"{total_count - recurring_count} manual)"
-            )
-            self.progress_bar.setValue(100)
-
-            # Update summary section with final balances
-            final_chase = running.get('C', 0)
-            final_total_balance = sum(running.get(c.pay_type_code, 0) for c in cards)
-            final_total_avail = total_limit - final_total_balance
-            final_util = final_total_balance / total_limit if total_limit > 0 else 0
-
-            self.chase_summary.setText(f"Chase: ${final_chase:,.2f}")
-            if final_chase < 0:
-                self.chase_summary.setStyleSheet("font-weight: bold; color: #f44336;")
-            elif final_chase < 500:
-                self.chase_summary.setStyleSheet("font-weight: bold; color: #ff9800;")
-            else:
-                self.chase_summary.setStyleSheet("font-weight: bold; color: #4caf50;")
-
-            self.total_avail_label.setText(f"Total CC Available: ${final_total_avail:,.2f}")
-            if final_total_avail < 0:
-                self.total_avail_label.setStyleSheet("font-weight: bold; color: #f44336;")
-            else:
-                self.total_avail_label.setStyleSheet("font-weight: bold; color: #4caf50;")
-
-            self.total_util_label.setText(f"Utilization: {final_util * 100:.1f}%")
-            if final_util > 0.8:
-                self.total_util_label.setStyleSheet("font-weight: bold; color: #f44336;")
-            elif final_util > 0.5:
-                self.total_util_label.setStyleSheet("font-weight: bold; color: #ff9800;")
-            else:
-                self.total_util_label.setStyleSheet("font-weight: bold; color: #4caf50;")
+            if data_dirty:
+                # Pick up added, removed or renamed cards before mapping columns
+                self._ensure_columns(CreditCard.get_all())
+            ledger = self._load_ledger(current_from, current_to)
+        except Exception:
+            self._end_loading()
+            raise
+
+        # Results from any refresh still running in the background are stale;
+        # let those workers stop early instead of finishing unused work
+        self._refresh_generation += 1
+        generation = self._refresh_generation
+        for worker in self._refresh_workers.values():
+            worker.cancel()
+
+        # The rows and card order fully determine the computed arrays, so a
+        # re-render of inputs seen before (e.g. sorting cards back) reuses them
+        result = ledger['results'].get(ledger['card_order'])
+        if result is not None:
+            try:
+                self._populate_table(ledger, *result)
+            finally:
+                self._end_loading()
+            return
 
+        if len(ledger['transactions']) >= ASYNC_REFRESH_THRESHOLD:
+            # Long ledgers: compute balances off the GUI thread
+            worker = RefreshWorker(generation, ledger)
+            worker.finished.connect(self._on_refresh_computed)
+            worker.error.connect(self._on_refresh_error)
+            worker.progress.connect(self._on_refresh_progress)
+            self._refresh_workers[generation] = worker
+            # Only this path returns to the event loop, so only here can the
+            # bar ever be painted
+            self.progress_bar.setValue(0)
+            self.progress_bar.setVisible(True)
+            worker.start()
+            return
+
+        try:
+            result = (*compute_ledger_balances(
+                ledger['transactions'], ledger['starting'], ledger['initial'],
+                ledger['code_to_idx'], ledger['cc_payment_map'], ledger['cc_name_map']
+            ), ledger_filter_arrays(ledger['transactions']))
+            ledger['results'][ledger['card_order']] = result
+            self._populate_table(ledger, *result)
         finally:
+            self._end_loading()
+
+    def _begin_loading(self):
+        """Show the loading state (idempotent while a refresh is pending)"""
+        self.info_label.setText("Loading transactions...")
+        if not self._loading:
+            self._loading = True
+            QApplication.setOverrideCursor(QCursor(Qt.CursorShape.WaitCursor))
+        # No processEvents() here: short ledgers finish before a repaint
+        # would matter, and long ones return to the event loop while
+        # RefreshWorker runs, which paints this state and its progress.
+        # The progress bar is shown only for the latter; toggling it for a
+        # synchronous refresh would relayout the view for nothing.
+
+    def _end_loading(self):
+        """Clear the loading state"""
+        if self._loading:
+            self._loading = False
             QApplication.restoreOverrideCursor()
-            self.progress_bar.setVisible(False)
+        self.progress_bar.setVisible(False)
+
+    def _load_ledger(self, from_date: str, to_date: str) -> dict:
+        """
+        Fetch everything the balance computation needs.
+
+        Runs on the GUI thread: the SQLite connection is owned by it.
+        Database reads are cached per date range until the view is marked
+        dirty, so re-rendering (e.g. after sorting card columns) skips SQL.
+        """
+        cache = self._ledger_cache
+        if cache is None or cache['key'] != (from_date, to_date):
+            # Only non-posted transactions for the planning view - posted
+            # ones appear in the Posted tab. Pay type selection is applied as
+            # a row filter afterwards, so running balances always include
+            # every payment method.
+            transactions = Transaction.get_by_date_range(from_date, to_date, posted=False)
+            cache = self._ledger_cache = {
+                'key': (from_date, to_date),
+                'transactions': transactions,
+                'starting': get_starting_balances(),
+                'results': {},  # card order -> (snapshots, totals, filter arrays)
+            }
+        transactions = cache['transactions']
+        starting = cache['starting']
+
+        # Use self._cards for column mapping (preserves sort order).
+        # Balances are kept positionally - slot 0 is Chase, slots 1..n are
+        # the cards in column order - so the row loop indexes lists
+        # instead of hashing pay type codes for every cell.
+        cards = self._cards
+        card_limits = [c.credit_limit for c in cards]
+        code_to_idx = {'C': 0}
+        for i, card in enumerate(cards, start=1):
+            code_to_idx[card.pay_type_code] = i
+        initial = [starting.get('C', 0)] + [starting.get(c.pay_type_code, 0) for c in cards]
+
+        cc_payment_map, cc_name_map = self._cc_payment_maps(cards)
+
+        return {
+            'transactions': transactions,
+            'starting': starting,
+            'card_order': tuple(c.id for c in cards),
+            'results': cache['results'],
+            'initial': initial,
+            'code_to_idx': code_to_idx,
+            'cc_payment_map': cc_payment_map,
+            'cc_name_map': cc_name_map,
+            'card_limits': card_limits,
+        }
 
-            # Reapply real-time filters (description, amount, sign) after table rebuild
-            self._apply_filters()
+    def _recurring_charges(self) -> list:
+        """RecurringCharge.get_all(), fetched once until mark_dirty"""
+        if self._recurring_charges_cache is None:
+            self._recurring_charges_cache = RecurringCharge.get_all()
+        return self._recurring_charges_cache
+
+    def _cc_payment_maps(self, cards: list) -> tuple:
+        """
+        Map credit card payments to the balance slot of the card they pay.
+
+        Recurring charges only change through mark_dirty(), so they are
+        fetched once and the maps are rebuilt only when the card column
+        order changes, not on every date range change.
+
+        Returns:
+            Tuple of (recurring_charge_id -> slot, description -> slot);
+            the description map is the fallback for manual transactions
+        """
+        order = tuple(c.id for c in cards)
+        cached = self._cc_payment_map_cache
+        if cached is not None and cached[0] == order:
+            return cached[1], cached[2]
+
+        cc_payment_map = {}
+        cc_name_map = {}
+        card_id_to_idx = {card_id: i for i, card_id in enumerate(order, start=1)}
+        for charge in self._recurring_charges():
+            if charge.linked_card_id and charge.linked_card_id in card_id_to_idx:
+                cc_payment_map[charge.id] = card_id_to_idx[charge.linked_card_id]
+                cc_name_map[charge.name] = card_id_to_idx[charge.linked_card_id]
+        self._cc_payment_map_cache = (order, cc_payment_map, cc_name_map)
+        return cc_payment_map, cc_name_map
+
+    def _on_refresh_computed(self, generation: int, result: tuple):
+        """Populate the table once a background refresh finishes"""
+        ledger = self._finish_refresh_worker(generation)
+        if ledger is None:
+            return  # A newer refresh superseded this one
+        ledger['results'][ledger['card_order']] = result
+        try:
+            self._populate_table(ledger, *result)
+        finally:
+            self._end_loading()
+
+    def _on_refresh_progress(self, generation: int, percent: int):
+        """Reflect background refresh progress (stale workers are ignored)"""
+        if generation == self._refresh_generation:
+            self.progress_bar.setValue(percent)
+
+    def _on_refresh_error(self, generation: int, message: str):
+        """Handle a failed background refresh"""
+        if self._finish_refresh_worker(generation) is None:
+            return
+        self._end_loading()
+        self._data_dirty = True  # Retry on the next refresh
+        self.info_label.setText("Failed to load transactions")
+        QMessageBox.critical(self, "Error", f"Failed to load transactions:\n{message}")
+
+    def _finish_refresh_worker(self, generation: int):
+        """Release a finished worker; return its ledger if still current"""
+        worker = self._refresh_workers.pop(generation, None)
+        if worker is None:
+            return None
+        worker.wait()
+        worker.deleteLater()
+        if generation != self._refresh_generation:
+            return None
+        return worker.ledger
+
+    def _populate_table(self, ledger: dict, snapshots: list, totals: list,
+                        filter_arrays: tuple = None):
+        """Hand computed balances to the model and update the summary labels"""
+        transactions = ledger['transactions']
+        card_limits = ledger['card_limits']
+        total_limit = sum(card_limits)
+
+        # One model reset; cells are formatted lazily as the view paints them
+        self.model.set_ledger(transactions, snapshots, totals, card_limits, filter_arrays)
+
+        total_count = len(transactions)
+        recurring_count = self.model.recurring_count()
+
+        # Update info label
+        self.info_label.setText(
+            f"Showing {total_count} transactions ({recurring_count} recurring, "
+            f"{total_count - recurring_count} manual)"
+        )
+        self.progress_bar.setValue(100)
+
+        # Update summary section with final balances
+        final = snapshots[-1] if len(snapshots) else ledger['initial']
+        final_chase = final[0]
+        final_total_balance = totals[-1] if len(totals) else sum(final[1:])
+        final_total_avail = total_limit - final_total_balance
+        final_util = final_total_balance / total_limit if total_limit > 0 else 0
+
+        self.chase_summary.setText(f"Chase: ${final_chase:,.2f}")
+        self._set_summary_style(
+            self.chase_summary,
+            SUMMARY_RED if final_chase < 0 else
+            SUMMARY_ORANGE if final_chase < 500 else SUMMARY_GREEN)
+
+        self.total_avail_label.setText(f"Total CC Available: ${final_total_avail:,.2f}")
+        self._set_summary_style(
+            self.total_avail_label,
+            SUMMARY_RED if final_total_avail < 0 else SUMMARY_GREEN)
+
+        self.total_util_label.setText(f"Utilization: {final_util * 100:.1f}%")
+        self._set_summary_style(
+            self.total_util_label,
+            SUMMARY_RED if final_util > 0.8 else
+            SUMMARY_ORANGE if final_util > 0.5 else SUMMARY_GREEN)
+
+        # Reapply row filters (pay type, description, amount, sign) after table rebuild
+        self._apply_filters()
+
+    @staticmethod
+    def _set_summary_style(label: QLabel, style: str):
+        """Apply a summary label style; an unchanged style is not re-applied,
+        since every setStyleSheet() re-parses it and re-polishes the label"""
+        if label.styleSheet() != style:
+            label.setStyleSheet(style)
 
     def _auto_generate_if_needed(self):
         """Auto-generate recurring transactions if none exist"""
@@ -878,24 +1204,51 @@ class TransactionsView(QWidget):
             clear_existing = dialog.get_clear_existing()
             self._do_generate_recurring(months, clear_existing, show_message=True)
 
+    @contextmanager
+    def bulk_mode(self, refresh: bool = True):
+        """Suppress refresh() and table repaints until the outermost block exits,
+        then refresh once (unless refresh=False)"""
+        self._bulk_depth += 1
+        if self._bulk_depth == 1:
+            self.table.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self._bulk_depth -= 1
+            if self._bulk_depth == 0:
+                self.table.setUpdatesEnabled(True)
+                if refresh:
+                    self.refresh()
+
     def _do_generate_recurring(self, months: int = 3, clear_existing: bool = True,
                                 show_message: bool = True):
         """Actually generate the recurring transactions"""
         from ..utils.calculations import generate_future_transactions
 
+        from ..models.database import Database
+
         today = datetime.now().date()
 
-        if clear_existing:
-            # Delete future recurring transactions
-            Transaction.delete_future_recurring(today.strftime('%Y-%m-%d'))
+        # Clear, insert and dedup commit once as a single transaction;
+        # the view refreshes once when bulk_mode exits
+        with self.bulk_mode(), Database().bulk_load():
+            if clear_existing:
+                # Delete future recurring transactions
+                Transaction.delete_future_recurring(today.isoformat())
+
+            # Generate transactions using the centralized function (includes interest charges)
+            transactions = generate_future_transactions(months_ahead=months)
+            # Insert as plain row tuples; nothing reads back the new ids
+            Transaction.bulk_insert(
+                (t.date, t.description, t.amount, t.payment_method,
+                 t.recurring_charge_id, int(t.is_posted), t.notes)
+                for t in transactions
+            )
 
-        # Generate transactions using the centralized function (includes interest charges)
-        transactions = generate_future_transactions(months_ahead=months)
-        for trans in transactions:
-            trans.save()
+            # Remove duplicates (date, pay type, description, amount)
+            dupes_removed = Transaction.dedup()
 
-        # Remove duplicates (date, pay type, description, amount)
-        dupes_removed = Transaction.dedup()
+            self.mark_dirty()
 
         if show_message:
             end_date = today + timedelta(days=months * 30)
@@ -905,16 +1258,10 @@ class TransactionsView(QWidget):
                 msg += f"\n{dupes_removed} duplicate(s) removed"
             QMessageBox.information(self, "Generation Complete", msg)
 
-        self.mark_dirty()
-        self.refresh()
-
     def _generate_special_charges(self, start_date: date, end_date: date,
                                    charges: list, paycheck: PaycheckConfig = None,
                                    lisa_linked_ids: set = None) -> int:
         """Generate transactions for special frequency charges"""
-        count = 0
-        special_charges = [c for c in charges if c.frequency == 'SPECIAL']
-
         # Get payday from config (default to Friday=4)
         pay_day = paycheck.pay_day_of_week if paycheck else 4
 
@@ -922,7 +1269,16 @@ class TransactionsView(QWidget):
         if lisa_linked_ids is None:
             lisa_linked_ids = set()
 
-        for charge in special_charges:
+        return Transaction.bulk_insert(self._iter_special_charge_rows(
+            start_date, end_date, charges, pay_day, lisa_linked_ids))
+
+    def _iter_special_charge_rows(self, start_date: date, end_date: date,
+                                  charges: list, pay_day: int, lisa_linked_ids: set):
+        """Yield insert rows for special frequency charges"""
+        for charge in charges:
+            if charge.frequency != 'SPECIAL':
+                continue
+
             # Skip Lisa payment codes (996-999) - handled separately based on paycheck count
             if charge.day_of_month >= 996:
                 continue
@@ -931,6 +1287,10 @@ class TransactionsView(QWidget):
             if charge.id in lisa_linked_ids:
                 continue
 
+            # Zero amounts would only add empty rows to every date in the schedule
+            if charge.amount == 0:
+                continue
+
             if charge.day_of_month == 991:
                 # Mortgage - bi-weekly, aligned with payday
                 current = start_date
@@ -939,57 +1299,24 @@ class TransactionsView(QWidget):
                     days_until_payday = 7
                 current += timedelta(days=days_until_payday)
 
-                while current <= end_date:
-                    trans = Transaction(
-                        id=None,
-                        date=current.strftime('%Y-%m-%d'),
-                        description=charge.name,
-                        amount=charge.amount,
-                        payment_method='C',
-                        recurring_charge_id=charge.id,
-                        is_posted=False
-                    )
-                    trans.save()
-                    count += 1
-                    current += timedelta(days=14)
+                for current in biweekly_dates(current, end_date):
+                    yield (current.isoformat(), charge.name, charge.amount,
+                           'C', charge.id, 0, None)
 
             elif charge.day_of_month in [992, 993, 994, 995]:
                 # Monthly special charges - on the 15th
-                current = date(start_date.year, start_date.month, 15)
-                if current < start_date:
-                    if current.month == 12:
-                        current = date(current.year + 1, 1, 15)
-                    else:
-                        current = date(current.year, current.month + 1, 15)
-
-                while current <= end_date:
-                    if charge.amount != 0:  # Skip zero amounts
-                        trans = Transaction(
-                            id=None,
-                            date=current.strftime('%Y-%m-%d'),
-                            description=charge.name,
-                            amount=charge.amount,
-                            payment_method='C',
-                            recurring_charge_id=charge.id,
-                            is_posted=False
-                        )
-                        trans.save()
-                        count += 1
-
-                    if current.month == 12:
-                        current = date(current.year + 1, 1, 15)
-                    else:
-                        current = date(current.year, current.month + 1, 15)
-
-        return count
+                for year, month in month_range(start_date, end_date):
+                    current = date(year, month, 15)
+                    if current < start_date or current > end_date:
+                        continue
+                    yield (current.isoformat(), charge.name, charge.amount,
+                           'C', charge.id, 0, None)
 
     def _generate_payday_transactions(self, start_date: date, end_date: date,
                                        paycheck: PaycheckConfig) -> int:
         """Generate payday and Lisa payment transactions"""
-        count = 0
-
         if paycheck.pay_frequency != 'BIWEEKLY':
-            return count
+            return 0
 
         # Use effective_date as the anchor for bi-weekly pay schedule
         # Parse effective_date to get the reference payday
@@ -999,133 +1326,83 @@ class TransactionsView(QWidget):
         # Find how many days between anchor and start_date
         days_diff = (start_date - anchor_date).days
 
-        # Find how many 14-day periods fit in that difference
-        periods = days_diff // 14
-        if days_diff % 14 != 0 and days_diff > 0:
-            periods += 1  # Round up to next payday
+        # Round up to whole 14-day periods; ceiling division also holds for
+        # a start before the anchor, so no stepping fixup is needed
+        periods = -(-days_diff // 14)
 
         # First payday is anchor + (periods * 14 days)
         current = anchor_date + timedelta(days=periods * 14)
 
-        # If current is before start_date (can happen with negative periods), move forward
-        while current < start_date:
-            current += timedelta(days=14)
-
-        # Get Lisa payment charges
-        lisa_2_charge = RecurringCharge.get_by_name('Lisa')
-        lisa_3_charge = RecurringCharge.get_by_name('Lisa3')
-
-        while current <= end_date:
+        # Get Lisa payment charges, as (amount, charge id) per paydays-in-month.
+        # A 3-payday month falls back to the 2-payday charge if Lisa3 is missing.
+        # Looked up here, not in the row generator, so no query runs mid-insert;
+        # the cached charge list serves both names (lowest id wins, as in
+        # get_by_name).
+        by_name = {}
+        for charge in sorted(self._recurring_charges(), key=lambda c: c.id):
+            by_name.setdefault(charge.name, charge)
+        lisa_2_charge = by_name.get('Lisa')
+        lisa_3_charge = by_name.get('Lisa3')
+        lisa_2 = (lisa_2_charge.amount, lisa_2_charge.id) if lisa_2_charge else (0, None)
+        lisa_table = {2: lisa_2,
+                      3: (lisa_3_charge.amount, lisa_3_charge.id) if lisa_3_charge else lisa_2}
+
+        return Transaction.bulk_insert(self._iter_payday_rows(
+            current, start_date, end_date, paycheck.net_pay, lisa_table))
+
+    def _iter_payday_rows(self, first_payday: date, start_date: date, end_date: date,
+                          net_pay: float, lisa_table: dict):
+        """Yield insert rows for paydays, LDBPD markers and Lisa payments"""
+        start_ordinal = start_date.toordinal()
+        # Paydays only cross into a new month every other row or so
+        last_ym = None
+        lisa_amount, lisa_charge_id = lisa_table[2]
+        for current in biweekly_dates(first_payday, end_date):
             # Add payday
-            trans = Transaction(
-                id=None,
-                date=current.strftime('%Y-%m-%d'),
-                description='Payday',
-                amount=paycheck.net_pay,
-                payment_method='C',
-                recurring_charge_id=None,
-                is_posted=False
-            )
-            trans.save()
-            count += 1
+            date_str = current.isoformat()
+            yield (date_str, 'Payday', net_pay, 'C', None, 0, None)
 
             # Add LDBPD marker (day before payday)
-            ldbpd_date = current - timedelta(days=1)
-            if ldbpd_date >= start_date:
-                ldbpd = Transaction(
-                    id=None,
-                    date=ldbpd_date.strftime('%Y-%m-%d'),
-                    description='LDBPD',
-                    amount=0,
-                    payment_method='C',
-                    recurring_charge_id=None,
-                    is_posted=False,
-                    notes='Pay period boundary marker'
-                )
-                ldbpd.save()
-                count += 1
+            ldbpd_ordinal = current.toordinal() - 1
+            if ldbpd_ordinal >= start_ordinal:
+                yield (date.fromordinal(ldbpd_ordinal).isoformat(), 'LDBPD', 0,
+                       'C', None, 0, 'Pay period boundary marker')
 
             # Determine if this is a 2 or 3 paycheck month and add Lisa payment
-            paycheck_count = self._count_paydays_in_month(current.year, current.month)
-
-            if paycheck_count == 3 and lisa_3_charge:
-                lisa_amount = lisa_3_charge.amount
-                lisa_charge_id = lisa_3_charge.id
-            elif lisa_2_charge:
-                lisa_amount = lisa_2_charge.amount
-                lisa_charge_id = lisa_2_charge.id
-            else:
-                lisa_amount = 0
-                lisa_charge_id = None
+            ym = (current.year, current.month)
+            if ym != last_ym:
+                last_ym = ym
+                lisa_amount, lisa_charge_id = lisa_table[self._count_paydays_in_month(*ym)]
 
             if lisa_amount != 0:
-                lisa_trans = Transaction(
-                    id=None,
-                    date=current.strftime('%Y-%m-%d'),
-                    description='Lisa',
-                    amount=lisa_amount,
-                    payment_method='C',
-                    recurring_charge_id=lisa_charge_id,
-                    is_posted=False
-                )
-                lisa_trans.save()
-                count += 1
-
-            current += timedelta(days=14)
-
-        return count
+                yield (date_str, 'Lisa', lisa_amount, 'C', lisa_charge_id, 0, None)
 
     def _count_paydays_in_month(self, year: int, month: int) -> int:
         """Count how many Fridays fall in a given month (assuming bi-weekly Friday paydays)"""
-        first_day = date(year, month, 1)
-        last_day = date(year, month, calendar.monthrange(year, month)[1])
-
-        # Find first Friday
-        days_until_friday = (4 - first_day.weekday()) % 7
-        first_friday = first_day + timedelta(days=days_until_friday)
-
-        count = 0
-        current = first_friday
-        while current <= last_day:
-            count += 1
-            current += timedelta(days=7)
-
-        # For bi-weekly, typically 2 paychecks per month, sometimes 3
-        # If 5 Fridays, likely 3 paydays; if 4, likely 2
-        return 3 if count >= 5 else 2
-
-    def _on_item_changed(self, item: QTableWidgetItem):
-        """Handle item changes - specifically checkbox state changes"""
-        # Only process checkbox column (column 0)
-        if item.column() != 0:
-            return
-
-        # Get transaction ID from the item's user data
-        trans_id = item.data(Qt.ItemDataRole.UserRole)
-        if not trans_id:
-            return
-
-        # Determine new posted state from checkbox
-        is_posted = item.checkState() == Qt.CheckState.Checked
+        return _paydays_in_month(year, month)
+
+    def _post_transaction(self, trans: Transaction, is_posted: bool):
+        """Save a posted-state change and update balances.
+
+        Checkbox toggles pass the row's own Transaction from the model, which
+        only emits on an actual change, so no lookup query is needed.
+        """
+        # Set posted_date when marking as posted
+        if is_posted:
+            trans.posted_date = datetime.now().strftime('%Y-%m-%d')
+            # Update account/card balances
+            self._update_balances_for_posted_transaction(trans)
+        else:
+            trans.posted_date = None
+            # Reverse the balance updates
+            self._reverse_balances_for_unposted_transaction(trans)
 
-        # Update transaction in database
-        trans = Transaction.get_by_id(trans_id)
-        if trans and trans.is_posted != is_posted:
-            # Set posted_date when marking as posted
-            if is_posted:
-                trans.posted_date = datetime.now().strftime('%Y-%m-%d')
-                # Update account/card balances
-                self._update_balances_for_posted_transaction(trans)
-            else:
-                trans.posted_date = None
-                # Reverse the balance updates
-                self._reverse_balances_for_unposted_transaction(trans)
-
-            trans.is_posted = is_posted
-            trans.save()
+        trans.is_posted = is_posted
+        trans.save()
+        self._refresh_cached_balances(trans)
 
-            # Notify parent window to refresh dashboard
-            self._notify_balance_change()
+        # Notify parent window to refresh dashboard
+        self._notify_balance_change()
 
     def _update_balances_for_posted_transaction(self, trans: Transaction):
         """Update account/card balances when a transaction is marked as posted"""
@@ -1194,23 +1471,38 @@ class TransactionsView(QWidget):
                 break
             parent = parent.parent()
 
+    def _selected_rows(self) -> list:
+        """Rows with any selected cell, in row order"""
+        return sorted({index.row() for index in self.table.selectionModel().selectedIndexes()})
+
     def _get_selected_transaction_id(self) -> int:
         """Get the ID of the selected transaction"""
-        selected = self.table.selectedItems()
-        if not selected:
+        rows = self._selected_rows()
+        if not rows:
             return None
-        row = selected[0].row()
-        # Transaction ID is stored in column 3 (Description) or column 0 (Checkbox)
-        return self.table.item(row, 3).data(Qt.ItemDataRole.UserRole)
+        return self.model.transaction_id(rows[0])
+
+    def _get_selected_transaction_ids(self) -> list:
+        """Get the IDs of all selected transactions, in row order"""
+        ids = []
+        for row in self._selected_rows():
+            trans_id = self.model.transaction_id(row)
+            if trans_id:
+                ids.append(trans_id)
+        return ids
+
+    def _schedule_refresh(self):
+        """Refresh shortly; repeated calls before the timer fires share one refresh"""
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
 
     def _add_transaction(self):
         """Add a new transaction"""
-        dialog = TransactionDialog(self)
+        dialog = TransactionDialog(self, payment_methods=self._payment_methods())
         if dialog.exec() == QDialog.DialogCode.Accepted:
             trans = dialog.get_transaction()
             trans.save()
-            self.mark_dirty()
-            self.refresh()
+            self._update_ledger(added=[trans])
 
     def _edit_transaction(self):
         """Edit the selected transaction"""
@@ -1221,33 +1513,37 @@ class TransactionsView(QWidget):
 
         trans = Transaction.get_by_id(trans_id)
         if trans:
-            dialog = TransactionDialog(self, trans)
+            dialog = TransactionDialog(self, trans, payment_methods=self._payment_methods())
             if dialog.exec() == QDialog.DialogCode.Accepted:
                 updated = dialog.get_transaction()
                 updated.id = trans.id
                 updated.save()
-                self.mark_dirty()
-                self.refresh()
+                self._update_ledger(removed_ids=[trans.id], added=[updated])
 
     def _delete_transaction(self):
-        """Delete the selected transaction"""
-        trans_id = self._get_selected_transaction_id()
-        if not trans_id:
+        """Delete the selected transaction(s)"""
+        trans_ids = self._get_selected_transaction_ids()
+        if not trans_ids:
             QMessageBox.warning(self, "Warning", "Please select a transaction to delete")
             return
 
-        trans = Transaction.get_by_id(trans_id)
-        if trans:
-            reply = QMessageBox.question(
-                self,
-                "Confirm Delete",
-                f"Are you sure you want to delete '{trans.description}'?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-            )
-            if reply == QMessageBox.StandardButton.Yes:
-                trans.delete()
-                self.mark_dirty()
-                self.refresh()
+        if len(trans_ids) == 1:
+            trans = Transaction.get_by_id(trans_ids[0])
+            if not trans:
+                return
+            prompt = f"Are you sure you want to delete '{trans.description}'?"
+        else:
+            prompt = f"Are you sure you want to delete {len(trans_ids)} transactions?"
+
+        reply = QMessageBox.question(
+            self,
+            "Confirm Delete",
+            prompt,
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            Transaction.delete_many(trans_ids)
+            self._update_ledger(removed_ids=trans_ids)
 
     def _delete_all_transactions(self):
         """Delete all transactions from the database"""
@@ -1279,8 +1575,7 @@ class TransactionsView(QWidget):
             )
 
             if reply2 == QMessageBox.StandardButton.Yes:
-                db.execute("DELETE FROM transactions")
-                db.commit()
+                count = Transaction.delete_all()
                 QMessageBox.information(self, "Deleted", f"Deleted {count} transactions.")
                 self.mark_dirty()
                 self.refresh()
@@ -1362,8 +1657,8 @@ class GenerateRecurringDialog(QDialog):
 
         # Summary of what will be generated
         charges = RecurringCharge.get_all(active_only=True)
-        regular_count = sum(1 for c in charges if c.frequency != 'SPECIAL')
         special_count = sum(1 for c in charges if c.frequency == 'SPECIAL')
+        regular_count = len(charges) - special_count
 
         summary = QGroupBox("Will Generate")
         summary_layout = QVBoxLayout(summary)
@@ -1395,9 +1690,11 @@ class GenerateRecurringDialog(QDialog):
 class TransactionDialog(QDialog):
     """Dialog for adding/editing a transaction"""
 
-    def __init__(self, parent=None, transaction: Transaction = None):
+    def __init__(self, parent=None, transaction: Transaction = None,
+                 payment_methods: list = None):
         super().__init__(parent)
         self.transaction = transaction
+        self._payment_methods = payment_methods
         self.setWindowTitle("Edit Transaction" if transaction else "Add Transaction")
         self.setMinimumWidth(400)
         self._setup_ui()
@@ -1457,6 +1754,10 @@ class TransactionDialog(QDialog):
 
     def _load_payment_methods(self):
         """Load available payment methods"""
+        if self._payment_methods is not None:
+            for label, code in self._payment_methods:
+                self.method_combo.addItem(label, code)
+            return
         self.method_combo.addItem("Chase (Bank)", "C")
         for card in CreditCard.get_all():
             self.method_combo.addItem(card.name, card.pay_type_code)
@@ -14,6 +14,223 @@ from budget_app.models.paycheck import PaycheckConfig, PaycheckDeduction
 from budget_app.models.shared_expense import SharedExpense
 
 
+class TestDaysInMonth:
+    """Tests for the memoized days_in_month helper"""
+
+    def test_matches_calendar(self):
+        """Agrees with calendar.monthrange across leap and non-leap years"""
+        import calendar
+        from budget_app.utils.calculations import days_in_month
+        for year in (2023, 2024, 2100):
+            for month in range(1, 13):
+                assert days_in_month(year, month) == calendar.monthrange(year, month)[1]
+
+    def test_february_leap_year(self):
+        """February has 29 days in a leap year"""
+        from budget_app.utils.calculations import days_in_month
+        assert days_in_month(2024, 2) == 29
+        assert days_in_month(2026, 2) == 28
+
+    def test_repeated_lookups_are_cached(self):
+        """Repeated lookups for the same month hit the cache"""
+        from budget_app.utils.calculations import days_in_month
+        days_in_month(2026, 7)
+        hits_before = days_in_month.cache_info().hits
+        days_in_month(2026, 7)
+        assert days_in_month.cache_info().hits == hits_before + 1
+
+
+class TestBiweeklyDates:
+    """Tests for the biweekly_dates schedule helper"""
+
+    def test_inclusive_range(self):
+        """Both endpoints are included when they fall on the schedule"""
+        from budget_app.utils.calculations import biweekly_dates
+        dates = biweekly_dates(date(2026, 1, 2), date(2026, 1, 30))
+        assert dates == [date(2026, 1, 2), date(2026, 1, 16), date(2026, 1, 30)]
+
+    def test_end_between_paydays(self):
+        """An end date between paydays stops at the last payday before it"""
+        from budget_app.utils.calculations import biweekly_dates
+        dates = biweekly_dates(date(2026, 1, 2), date(2026, 1, 29))
+        assert dates[-1] == date(2026, 1, 16)
+
+    def test_first_after_end(self):
+        """No dates when the first payday is past the end"""
+        from budget_app.utils.calculations import biweekly_dates
+        assert biweekly_dates(date(2026, 2, 1), date(2026, 1, 1)) == []
+
+    def test_dates_every_step(self):
+        """dates_every steps by any number of days"""
+        from budget_app.utils.calculations import dates_every
+        dates = dates_every(date(2026, 1, 2), date(2026, 2, 12), 21)
+        assert dates == [date(2026, 1, 2), date(2026, 1, 23)]
+
+
+class TestComputeLedgerBalances:
+    """Tests for the compute_ledger_balances helper"""
+
+    def _trans(self, amount, method, rec_id=None, desc='X'):
+        from budget_app.models.transaction import Transaction
+        return Transaction(id=None, date='2026-01-01', description=desc,
+                           amount=amount, payment_method=method,
+                           recurring_charge_id=rec_id)
+
+    def test_bank_and_card_directions(self):
+        """Bank rows add the amount, card rows subtract it (owed grows)"""
+        from budget_app.utils.calculations import compute_ledger_balances
+        rows = [self._trans(-100.0, 'C'), self._trans(-50.0, 'CH')]
+        snapshots, totals = compute_ledger_balances(
+            rows, {'C': 1000.0, 'CH': 200.0}, [1000.0, 200.0],
+            {'C': 0, 'CH': 1}, {}, {}
+        )
+        assert snapshots.tolist() == [[900.0, 200.0], [900.0, 250.0]]
+        assert totals.tolist() == [200.0, 250.0]
+
+    def test_linked_payment_reduces_card(self):
+        """A Chase payment linked to a card lowers both balances"""
+        from budget_app.utils.calculations import compute_ledger_balances
+        rows = [self._trans(-75.0, 'C', rec_id=7)]
+        snapshots, totals = compute_ledger_balances(
+            rows, {'C': 1000.0, 'CH': 200.0}, [1000.0, 200.0],
+            {'C': 0, 'CH': 1}, {7: 1}, {}
+        )
+        assert snapshots.tolist() == [[925.0, 125.0]]
+        assert totals.tolist() == [125.0]
+
+    def test_unknown_method_leaves_balances(self):
+        """Rows on a method with no starting balance change nothing"""
+        from budget_app.utils.calculations import compute_ledger_balances
+        rows = [self._trans(-10.0, 'ZZ')]
+        snapshots, totals = compute_ledger_balances(rows, {'C': 5.0}, [5.0], {'C': 0}, {}, {})
+        assert snapshots.tolist() == [[5.0]]
+        assert totals.tolist() == [0]
+
+    def test_totals_track_sum_of_card_slots(self):
+        """The incremental card total always equals the sum of card slots"""
+        from budget_app.utils.calculations import compute_ledger_balances
+        rows = [self._trans(-30.0, 'CH'), self._trans(-20.0, 'AM'),
+                self._trans(-25.0, 'C', rec_id=3), self._trans(15.0, 'AM')]
+        snapshots, totals = compute_ledger_balances(
+            rows, {'C': 500.0, 'CH': 100.0, 'AM': 50.0}, [500.0, 100.0, 50.0],
+            {'C': 0, 'CH': 1, 'AM': 2}, {3: 1}, {}
+        )
+        for balances, total in zip(snapshots, totals):
+            assert total == pytest.approx(sum(balances[1:]))
+
+    def test_matches_row_by_row_walk(self):
+        """Vectorized balances equal a plain row-by-row walk, posted rows included"""
+        from budget_app.utils.calculations import compute_ledger_balances
+        rows = [self._trans(-30.0, 'CH'), self._trans(-20.0, 'C', desc='Amex'),
+                self._trans(-25.0, 'C', rec_id=3), self._trans(15.0, 'AM'),
+                self._trans(-40.0, 'CH'), self._trans(-5.0, 'ZZ')]
+        rows[4].is_posted = True
+        snapshots, totals = compute_ledger_balances(
+            rows, {'C': 500.0, 'CH': 100.0, 'AM': 50.0}, [500.0, 100.0, 50.0],
+            {'C': 0, 'CH': 1, 'AM': 2}, {3: 1}, {'Amex': 2}
+        )
+        assert snapshots.tolist() == [
+            [500.0, 130.0, 50.0],
+            [480.0, 130.0, 30.0],
+            [455.0, 105.0, 30.0],
+            [455.0, 105.0, 15.0],
+            [455.0, 105.0, 15.0],
+            [455.0, 105.0, 15.0],
+        ]
+        assert totals.tolist() == [180.0, 160.0, 135.0, 120.0, 120.0, 120.0]
+
+    def test_card_paying_itself_nets_to_zero(self):
+        """Own and linked updates landing on the same slot both apply"""
+        from budget_app.utils.calculations import compute_ledger_balances
+        rows = [self._trans(-10.0, 'CH', rec_id=3)]
+        snapshots, totals = compute_ledger_balances(
+            rows, {'C': 100.0, 'CH': 60.0}, [100.0, 60.0],
+            {'C': 0, 'CH': 1}, {3: 1}, {}
+        )
+        assert snapshots.tolist() == [[100.0, 60.0]]
+        assert totals.tolist() == [60.0]
+
+    def test_unmapped_recurring_id_falls_back_to_description(self):
+        """A recurring id with no linked card still matches by charge name"""
+        from budget_app.utils.calculations import compute_ledger_balances
+        rows = [self._trans(-40.0, 'C', rec_id=99, desc='Card Pay')]
+        snapshots, totals = compute_ledger_balances(
+            rows, {'C': 100.0, 'CH': 60.0}, [100.0, 60.0],
+            {'C': 0, 'CH': 1}, {3: 1}, {'Card Pay': 1}
+        )
+        assert snapshots.tolist() == [[60.0, 20.0]]
+        assert totals.tolist() == [20.0]
+
+    def test_no_float_drift_over_many_rows(self):
+        """Running balances stay exact to the cent over long ledgers"""
+        from budget_app.utils.calculations import compute_ledger_balances
+        rows = [self._trans(0.1, 'C') for _ in range(1000)]
+        snapshots, totals = compute_ledger_balances(rows, {'C': 0.0}, [0.0], {'C': 0}, {}, {})
+        assert snapshots[-1][0] == 100.0
+        assert snapshots[9][0] == 1.0
+
+    def test_empty_ledger(self):
+        """No rows gives empty arrays shaped for the balance slots"""
+        from budget_app.utils.calculations import compute_ledger_balances
+        snapshots, totals = compute_ledger_balances([], {'C': 5.0}, [5.0, 1.0], {'C': 0}, {}, {})
+        assert snapshots.shape == (0, 2)
+        assert len(totals) == 0
+
+
+class TestMonthRange:
+    """Tests for the month_range iteration helper"""
+
+    def test_crosses_year_boundary(self):
+        """December steps into January of the next year"""
+        from budget_app.utils.calculations import month_range
+        months = list(month_range(date(2025, 11, 20), date(2026, 2, 3)))
+        assert months == [(2025, 11), (2025, 12), (2026, 1), (2026, 2)]
+
+    def test_single_month(self):
+        """Start and end in the same month yields that month once"""
+        from budget_app.utils.calculations import month_range
+        assert list(month_range(date(2026, 3, 1), date(2026, 3, 31))) == [(2026, 3)]
+
+    def test_end_before_start(self):
+        """Nothing is yielded when end precedes start's month"""
+        from budget_app.utils.calculations import month_range
+        assert list(month_range(date(2026, 3, 1), date(2026, 2, 1))) == []
+
+
+class TestCalculateRunningBalancesUtilization:
+    """Tests for the card totals tracked by calculate_running_balances"""
+
+    def test_utilization_tracks_charges_and_linked_payments(self, temp_db):
+        """Utilization follows card charges and CC payments from checking"""
+        from budget_app.utils.calculations import calculate_running_balances
+
+        card_a = CreditCard(id=None, pay_type_code='CH', name='Chase Freedom',
+                            credit_limit=1000.0, current_balance=0.0)
+        card_a.save()
+        CreditCard(id=None, pay_type_code='AM', name='Amex',
+                   credit_limit=3000.0, current_balance=0.0).save()
+        RecurringCharge(id=None, name='Chase Freedom Payment', amount=-100.0,
+                        day_of_month=1, payment_method='C',
+                        linked_card_id=card_a.id).save()
+
+        transactions = [
+            Transaction(id=None, date='2026-03-01', description='Groceries',
+                        amount=-200.0, payment_method='CH'),
+            Transaction(id=None, date='2026-03-02', description='Flights',
+                        amount=-600.0, payment_method='AM'),
+            Transaction(id=None, date='2026-03-03', description='Chase Freedom Payment',
+                        amount=-100.0, payment_method='C'),
+        ]
+        starting = {'C': 5000.0, 'CH': 400.0, 'AM': 0.0}
+
+        results = calculate_running_balances(transactions, starting)
+
+        # Owed across cards: 600, 1200, 1100 against a 4000 limit
+        assert [round(r['total_utilization'], 6) for r in results] == [0.15, 0.3, 0.275]
+        assert results[-1]['running_balances'] == {'C': 4900.0, 'CH': 500.0, 'AM': 600.0}
+        assert results[-1]['available_credit'] == {'CH': 500.0, 'AM': 2400.0}
+
+
 class TestFindFirstNegativeBalance:
     """Tests for find_first_negative_balance function"""
 
@@ -156,6 +373,20 @@ class TestGenerateSpecialCharges:
         assert len(transactions) >= 1
         assert all(t.amount == -1900.0 for t in transactions)
 
+    def test_code_991_mortgage_schedule(self, temp_db):
+        """Code 991 starts on the first Friday after start, then every 21 days"""
+        from budget_app.utils.calculations import _generate_special_charges
+        charge = RecurringCharge(
+            id=None, name='Mortgage', amount=-1900.0,
+            day_of_month=991, payment_method='C',
+            frequency='SPECIAL', amount_type='FIXED'
+        )
+        charge.save()
+
+        # 2025-01-03 is a Friday, so the schedule starts a week later
+        transactions = _generate_special_charges(date(2025, 1, 3), date(2025, 3, 14), [charge])
+        assert [t.date for t in transactions] == ['2025-01-10', '2025-01-31', '2025-02-21', '2025-03-14']
+
     def test_code_992_monthly_special(self, temp_db):
         """Code 992-995 should generate monthly on the 15th"""
         from budget_app.utils.calculations import _generate_special_charges
@@ -292,6 +523,24 @@ class TestGeneratePaydayTransactions:
         # All should be on Fridays (anchored from effective_date which is a Friday)
         assert all(t.date_obj.weekday() == 4 for t in paydays)
 
+    def test_dates_are_zero_padded_iso(self, temp_db):
+        """Payday and LDBPD dates are stored as zero-padded ISO strings"""
+        from budget_app.utils.calculations import _generate_payday_transactions
+
+        config = PaycheckConfig(
+            id=None, gross_amount=5000.0, pay_frequency='BIWEEKLY',
+            effective_date='2025-01-03', is_current=True
+        )
+        config.save()
+        config = PaycheckConfig.get_by_id(config.id)
+
+        transactions = _generate_payday_transactions(date(2025, 1, 1), date(2025, 1, 20), config)
+
+        assert [t.date for t in transactions if t.description == 'Payday'] == \
+            ['2025-01-03', '2025-01-17']
+        assert [t.date for t in transactions if t.description == 'LDBPD'] == \
+            ['2025-01-02 23:59:59', '2025-01-16 23:59:59']
+
     def test_generates_lisa_payments(self, temp_db):
         """Should generate Lisa Payment transactions on paydays"""
         from budget_app.utils.calculations import _generate_payday_transactions
@@ -392,6 +641,44 @@ class TestGeneratePaydayTransactions:
         amounts = set(abs(round(t.amount, 2)) for t in lisa_payments)
         assert len(amounts) >= 1  # At least some Lisa payments generated
 
+    def test_lisa_payment_looked_up_once_per_paycheck_count(self, temp_db):
+        """Lisa amounts are computed once per paycheck count, not once per payday"""
+        from budget_app.utils.calculations import _generate_payday_transactions
+
+        config = PaycheckConfig(
+            id=None, gross_amount=5000.0, pay_frequency='BIWEEKLY',
+            effective_date='2025-01-03', is_current=True
+        )
+        config.save()
+        config = PaycheckConfig.get_by_id(config.id)
+
+        with patch.object(SharedExpense, 'calculate_lisa_payment',
+                          side_effect=lambda count: 1800.0 / count) as spy:
+            transactions = _generate_payday_transactions(
+                date(2025, 1, 1), date(2025, 12, 31), config)
+
+        assert sorted(c.args for c in spy.call_args_list) == [(2,), (3,)]
+        lisa = [t for t in transactions if t.description == 'Lisa Payment']
+        assert len(lisa) == 26
+        assert {round(t.amount, 2) for t in lisa} == {-900.0, -600.0}
+
+    def test_anchor_far_from_range(self, temp_db):
+        """Paydays stay on the anchor's 14-day cycle when the anchor is years away"""
+        from budget_app.utils.calculations import _generate_payday_transactions
+
+        for effective in ('2019-01-04', '2031-01-03'):
+            config = PaycheckConfig(
+                id=None, gross_amount=5000.0, pay_frequency='BIWEEKLY',
+                effective_date=effective, is_current=True
+            )
+            transactions = _generate_payday_transactions(
+                date(2025, 6, 1), date(2025, 6, 30), config)
+            anchor = date.fromisoformat(effective)
+            paydays = [t.date_obj for t in transactions if t.description == 'Payday']
+            assert paydays
+            assert all(date(2025, 6, 1) <= p <= date(2025, 6, 30) for p in paydays)
+            assert all((p - anchor).days % 14 == 0 for p in paydays)
+
 
 class TestGenerateInterestCharges:
     """Tests for _generate_interest_charges"""
@@ -550,6 +837,50 @@ class TestGenerateInterestCharges:
         interest_trans = [t for t in result if 'Interest' in t.description]
         assert len(interest_trans) == 0
 
+    def test_balances_carry_across_months(self, temp_db):
+        """Each month's balance includes earlier rows, payments and interest"""
+        from budget_app.utils.calculations import _generate_interest_charges
+
+        card = CreditCard(
+            id=None, pay_type_code='CH', name='Chase Freedom',
+            credit_limit=10000.0, current_balance=1000.0,
+            interest_rate=0.12, due_day=10
+        )
+        card.save()
+        CreditCard(
+            id=None, pay_type_code='AM', name='Amex',
+            credit_limit=5000.0, current_balance=0.0,
+            interest_rate=0.12, due_day=10
+        ).save()
+        payment = RecurringCharge(
+            id=None, name='Chase Freedom Payment', amount=-200.0, day_of_month=5,
+            payment_method='C', frequency='MONTHLY', amount_type='FIXED',
+            linked_card_id=card.id
+        )
+        payment.save()
+
+        existing = [
+            Transaction(id=None, date='2025-06-20', description='TV',
+                        amount=-500.0, payment_method='CH'),
+            Transaction(id=None, date='2025-07-01', description='Shoes',
+                        amount=-100.0, payment_method='AM'),
+            Transaction(id=None, date='2025-07-05', description='Chase Freedom Payment',
+                        amount=-200.0, payment_method='C', recurring_charge_id=payment.id),
+        ]
+
+        result = _generate_interest_charges(date(2025, 6, 1), date(2025, 8, 31), existing, set())
+        interest = [(t.date, t.payment_method, t.amount)
+                    for t in result if 'Interest' in t.description]
+        # CH: 1000 -> 1000 + 500 - 200 + 10 = 1310 -> 1310 + 13.10 = 1323.10
+        # AM: 0 (none) -> 100 -> 100 + 1.00 = 101
+        assert interest == [
+            ('2025-06-13', 'CH', -10.0),
+            ('2025-07-13', 'CH', -13.1),
+            ('2025-07-13', 'AM', -1.0),
+            ('2025-08-13', 'CH', -13.23),
+            ('2025-08-13', 'AM', -1.01),
+        ]
+
     def test_due_day_rollover_to_next_month(self, temp_db):
         """Interest date rolling past end of month should go to next month"""
         from budget_app.utils.calculations import _generate_interest_charges
@@ -621,6 +952,40 @@ class TestGenerateFutureTransactionsIntegration:
         mortgage = [t for t in transactions if t.description == 'Mortgage Charge']
         assert len(mortgage) == 0  # Should be excluded
 
+    def test_monthly_charges_skip_days_missing_from_month(self, temp_db):
+        """A day-31 charge lands only in 31-day months, on start and end bounds"""
+        from budget_app.utils.calculations import generate_future_transactions
+
+        RecurringCharge(
+            id=None, name='Storage', amount=-20.0,
+            day_of_month=31, payment_method='C',
+            frequency='MONTHLY', amount_type='FIXED'
+        ).save()
+
+        # 2025-05-31 through 2025-08-29
+        transactions = generate_future_transactions(months_ahead=3,
+                                                     start_date=date(2025, 5, 31))
+
+        dates = [t.date for t in transactions if t.description == 'Storage']
+        assert dates == ['2025-05-31', '2025-07-31']
+
+    def test_amount_resolved_once_per_charge(self, temp_db):
+        """A charge's amount (a card query when linked) is resolved once, not per month"""
+        from budget_app.utils.calculations import generate_future_transactions
+
+        RecurringCharge(
+            id=None, name='Netflix', amount=-15.99,
+            day_of_month=15, payment_method='C',
+            frequency='MONTHLY', amount_type='FIXED'
+        ).save()
+
+        with patch.object(RecurringCharge, 'get_actual_amount',
+                          autospec=True, return_value=-15.99) as mock_amount:
+            transactions = generate_future_transactions(months_ahead=6,
+                                                         start_date=date(2025, 6, 1))
+        assert len([t for t in transactions if t.description == 'Netflix']) == 6
+        assert mock_amount.call_count == 1
+
     def test_transactions_sorted_by_date(self, temp_db):
         """Output transactions should be sorted by date"""
         from budget_app.utils.calculations import generate_future_transactions
@@ -720,6 +1085,37 @@ class TestGetStartingBalancesIntegration:
         assert balances['CH'] == 1500.0
         assert balances['K1'] == 7500.0
 
+    def test_supplied_cards_skip_card_query(self, temp_db):
+        """A card list the caller already fetched is used as is"""
+        from unittest.mock import patch
+        from budget_app.utils.calculations import get_starting_balances
+
+        CreditCard(
+            id=None, pay_type_code='CH', name='Chase Card',
+            credit_limit=5000, current_balance=1500, interest_rate=0.18, due_day=10
+        ).save()
+        cards = CreditCard.get_all()
+
+        with patch.object(CreditCard, 'get_all') as mock_get_all:
+            balances = get_starting_balances(cards)
+            mock_get_all.assert_not_called()
+        assert balances['CH'] == 1500.0
+
+    def test_interest_generation_reads_cards_once(self, temp_db):
+        """Interest charges fetch the card list once for the balances too"""
+        from unittest.mock import patch
+        from budget_app.utils.calculations import _generate_interest_charges
+
+        CreditCard(
+            id=None, pay_type_code='CH', name='Chase Card',
+            credit_limit=5000, current_balance=1500, interest_rate=0.18, due_day=10
+        ).save()
+
+        with patch.object(CreditCard, 'get_all', wraps=CreditCard.get_all) as spy:
+            result = _generate_interest_charges(date(2025, 6, 1), date(2025, 7, 31), [], set())
+        assert spy.call_count == 1
+        assert any(t.description == 'Chase Card Interest' for t in result)
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
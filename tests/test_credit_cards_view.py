@@ -464,6 +464,23 @@ class TestCreditCardsViewNotify:
         view._notify_recurring_changes()
         parent.recurring_view.mark_dirty.assert_called_once()
 
+    def test_notify_marks_transactions_view_dirty(self, qtbot, temp_db):
+        """Card changes also mark the transactions ledger dirty"""
+        from budget_app.views.credit_cards_view import CreditCardsView
+        from PyQt6.QtWidgets import QWidget
+        from unittest.mock import MagicMock
+
+        parent = QWidget()
+        parent.recurring_view = MagicMock()
+        parent.transactions_view = MagicMock()
+        qtbot.addWidget(parent)
+
+        view = CreditCardsView()
+        view.setParent(parent)
+
+        view._notify_recurring_changes()
+        parent.transactions_view.invalidate_cards.assert_called_once()
+
 
 class TestCreditCardsViewAdd:
     """Tests for _add_card with mocked dialog"""
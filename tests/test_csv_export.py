@@ -146,6 +146,28 @@ class TestExportTransactions:
         assert posted_values['Posted'] == 'Yes'
         assert posted_values['Unposted'] == 'No'
 
+    def test_row_fields_in_column_order(self, temp_db, export_dir):
+        """Each row lists every column, with blanks for missing notes and charges"""
+        charge = RecurringCharge(id=None, name='Gym', amount=-30.0, day_of_month=5,
+                                 payment_method='C', frequency='MONTHLY',
+                                 amount_type='FIXED')
+        charge.save()
+        Transaction(id=None, date='2025-01-05', description='Gym', amount=-30.0,
+                    payment_method='C', recurring_charge_id=charge.id,
+                    notes='January').save()
+        Transaction(id=None, date='2025-01-06', description='Coffee', amount=-4.25,
+                    payment_method='CH').save()
+
+        filepath = export_dir / 'transactions.csv'
+        export_transactions(filepath)
+        headers, rows = _read_csv(filepath)
+
+        assert len(headers) == 7
+        assert rows == [
+            ['2025-01-05', 'Gym', '-30.0', 'C', 'No', 'January', 'Gym'],
+            ['2025-01-06', 'Coffee', '-4.25', 'CH', 'No', '', ''],
+        ]
+
 
 class TestExportLoans:
     """Tests for export_loans"""
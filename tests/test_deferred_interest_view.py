@@ -80,6 +80,12 @@ class TestDeferredInterestView:
         qtbot.addWidget(view)
         assert view._get_risk_color("LOW") is None
 
+    def test_get_risk_color_is_shared(self, qtbot, temp_db):
+        from budget_app.views.deferred_interest_view import DeferredInterestView
+        view = DeferredInterestView()
+        qtbot.addWidget(view)
+        assert view._get_risk_color("HIGH") is view._get_risk_color("HIGH")
+
     def test_summary_labels(self, qtbot, temp_db, sample_deferred_purchase):
         from budget_app.views.deferred_interest_view import DeferredInterestView
         view = DeferredInterestView()
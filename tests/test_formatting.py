@@ -0,0 +1,19 @@
+"""Unit tests for the formatting module"""
+
+
+class TestDisplayDate:
+    """Tests for the cached display date formatter"""
+
+    def test_formats_iso_date(self):
+        from budget_app.utils.formatting import display_date
+        assert display_date('2026-03-07') == "03/07/2026"
+        assert display_date('2026-12-31 23:59:59') == "12/31/2026"
+
+    def test_repeat_dates_hit_cache(self):
+        from budget_app.utils.formatting import display_date
+        display_date.cache_clear()
+        for _ in range(3):
+            display_date('2026-05-01')
+        info = display_date.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
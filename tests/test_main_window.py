@@ -666,6 +666,45 @@ class TestMainWindowUndoAndRestore:
         assert "No Backups" in mock_qmessagebox.info_title
 
 
+# ---------------------------------------------------------------------------
+# MainWindow._generate_transactions tests
+# ---------------------------------------------------------------------------
+
+class TestMainWindowGenerateTransactions:
+    """Tests for _generate_transactions method"""
+
+    def test_generated_transactions_inserted_in_one_batch(self, main_window, monkeypatch,
+                                                          mock_qmessagebox):
+        """Generated transactions are written with one bulk insert, not per-row saves"""
+        from PyQt6.QtWidgets import QDialog
+        from budget_app.models.transaction import Transaction
+        from budget_app.views.transactions_view import GenerateRecurringDialog
+
+        generated = [
+            Transaction(id=None, date='2026-03-01', description='Rent', amount=-1500.0,
+                        payment_method='C', recurring_charge_id=None, is_posted=False),
+            Transaction(id=None, date='2026-03-13', description='Payday', amount=2500.0,
+                        payment_method='C', recurring_charge_id=None, is_posted=False,
+                        notes='Biweekly'),
+        ]
+        monkeypatch.setattr(GenerateRecurringDialog, 'exec',
+                            lambda self: QDialog.DialogCode.Accepted)
+        monkeypatch.setattr(GenerateRecurringDialog, 'get_clear_existing', lambda self: False)
+        monkeypatch.setattr('budget_app.views.main_window.create_auto_backup', lambda reason: None)
+        monkeypatch.setattr('budget_app.utils.calculations.generate_future_transactions',
+                            lambda months_ahead: generated)
+        monkeypatch.setattr(Transaction, 'save',
+                            lambda self: pytest.fail("per-row save() called"))
+
+        main_window._generate_transactions()
+
+        rows = {t.description: t for t in Transaction.get_all()}
+        assert set(rows) == {'Rent', 'Payday'}
+        assert rows['Payday'].notes == 'Biweekly'
+        assert mock_qmessagebox.info_title == "Generate Complete"
+        assert "Generated 2" in mock_qmessagebox.info_text
+
+
 # ---------------------------------------------------------------------------
 # MainWindow._show_about tests
 # ---------------------------------------------------------------------------
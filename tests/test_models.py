@@ -6,6 +6,13 @@ import pytest
 class TestCreditCardModel:
     """Tests for CreditCard model"""
 
+    def test_uses_slots(self):
+        """CreditCard rows are slotted (no per-instance __dict__)"""
+        from budget_app.models.credit_card import CreditCard
+
+        card = CreditCard(id=None, pay_type_code='T', name='T', credit_limit=1.0)
+        assert not hasattr(card, '__dict__')
+
     def test_available_credit_calculation(self, temp_db):
         """Available credit should be limit minus balance"""
         from budget_app.models.credit_card import CreditCard
@@ -476,6 +483,136 @@ class TestAccountModel:
 class TestTransactionModel:
     """Tests for Transaction model"""
 
+    def test_uses_slots(self):
+        """Transaction rows are slotted (no per-instance __dict__)"""
+        from budget_app.models.transaction import Transaction
+
+        trans = Transaction(id=None, date='2025-06-15', description='Test',
+                            amount=-1.0, payment_method='C')
+        assert not hasattr(trans, '__dict__')
+        with pytest.raises(AttributeError):
+            trans.unknown_field = 1
+
+    def test_bulk_insert(self, temp_db):
+        """bulk_insert should store every tuple and return the row count"""
+        from budget_app.models.transaction import Transaction
+
+        rows = [
+            ('2025-06-13', 'Payday', 2500.0, 'C', None, 0, None),
+            ('2025-06-12', 'LDBPD', 0, 'C', None, 0, 'Pay period boundary marker'),
+        ]
+        assert Transaction.bulk_insert(rows) == 2
+
+        stored = Transaction.get_all()
+        assert [(t.date, t.description) for t in stored] == [
+            ('2025-06-12', 'LDBPD'), ('2025-06-13', 'Payday')
+        ]
+        assert stored[0].notes == 'Pay period boundary marker'
+        assert stored[1].is_posted is False
+
+    def test_bulk_insert_uses_shared_statement(self, temp_db):
+        """Every bulk insert issues the same INSERT_SQL text"""
+        from unittest.mock import patch
+        from budget_app.models import transaction as transaction_module
+        from budget_app.models.database import Database
+        from budget_app.models.transaction import Transaction
+
+        db = Database()
+        with patch.object(Database, 'executemany', wraps=db.executemany) as spy:
+            Transaction.bulk_insert([('2026-01-01', 'A', -1.0, 'C', None, 0, None)])
+            Transaction.bulk_insert([('2026-01-02', 'B', -2.0, 'C', None, 0, None)])
+
+        assert [c.args[0] for c in spy.call_args_list] == [transaction_module.INSERT_SQL] * 2
+
+    def test_bulk_insert_generator(self, temp_db):
+        """bulk_insert accepts a generator and reports the inserted count"""
+        from budget_app.models.transaction import Transaction
+
+        rows = (('2026-01-01', f'Row {i}', -1.0, 'C', None, 0, None) for i in range(4))
+        assert Transaction.bulk_insert(rows) == 4
+        assert len(Transaction.get_all()) == 4
+
+    def test_bulk_insert_empty_generator(self, temp_db):
+        """An exhausted generator inserts nothing"""
+        from budget_app.models.transaction import Transaction
+
+        assert Transaction.bulk_insert(r for r in []) == 0
+
+    def test_bulk_insert_empty(self, temp_db):
+        """bulk_insert with no rows is a no-op"""
+        from budget_app.models.transaction import Transaction
+
+        assert Transaction.bulk_insert([]) == 0
+        assert Transaction.get_all() == []
+
+    def test_get_by_date_range_posted_filter(self, temp_db, sample_transactions):
+        """posted=False/True narrows the range query in SQL"""
+        from budget_app.models.transaction import Transaction
+        unposted = Transaction.get_by_date_range('2026-01-01', '2026-12-31', posted=False)
+        posted = Transaction.get_by_date_range('2026-01-01', '2026-12-31', posted=True)
+        everything = Transaction.get_by_date_range('2026-01-01', '2026-12-31')
+        assert [t.description for t in unposted] == ['Paycheck', 'Groceries', 'Netflix']
+        assert [t.description for t in posted] == ['Old Payment']
+        assert posted[0].is_posted is True
+        assert len(everything) == 4
+
+    def test_loaded_rows_match_saved_fields(self, temp_db):
+        """Rows load field for field, with is_posted as a bool"""
+        from budget_app.models.transaction import Transaction
+
+        saved = Transaction(id=None, date='2026-03-01', description='Rent',
+                            amount=-1200.0, payment_method='C', recurring_charge_id=None,
+                            is_posted=True, posted_date='2026-03-02', notes='March').save()
+        loaded = Transaction.get_by_id(saved.id)
+        assert loaded == saved
+        assert loaded.is_posted is True
+        assert Transaction.get_by_date_range('2026-03-01', '2026-03-31') == [saved]
+        assert Transaction.get_by_id(saved.id + 1) is None
+
+    def test_delete_many(self, temp_db):
+        """delete_many removes only the given ids"""
+        from budget_app.models.transaction import Transaction
+
+        Transaction.bulk_insert([
+            ('2026-01-0%d' % d, f'Row {d}', -10.0, 'C', None, 0, None)
+            for d in range(1, 6)
+        ])
+        ids = [t.id for t in Transaction.get_all()]
+
+        assert Transaction.delete_many(ids[:3]) == 3
+        assert [t.id for t in Transaction.get_all()] == ids[3:]
+
+    def test_delete_many_chunks_large_id_lists(self, temp_db, monkeypatch):
+        """delete_many splits the IN list to stay under the parameter limit"""
+        from budget_app.models import transaction as transaction_module
+        from budget_app.models.transaction import Transaction
+
+        monkeypatch.setattr(transaction_module, 'DELETE_CHUNK_SIZE', 2)
+        Transaction.bulk_insert([
+            ('2026-01-01', f'Row {i}', -1.0, 'C', None, 0, None) for i in range(5)
+        ])
+        ids = [t.id for t in Transaction.get_all()]
+
+        assert Transaction.delete_many(ids) == 5
+        assert Transaction.get_all() == []
+
+    def test_delete_many_empty(self, temp_db):
+        """delete_many with no ids is a no-op"""
+        from budget_app.models.transaction import Transaction
+
+        assert Transaction.delete_many([]) == 0
+
+    def test_delete_all(self, temp_db):
+        """delete_all empties the table and reports the count"""
+        from budget_app.models.transaction import Transaction
+
+        Transaction.bulk_insert([
+            ('2026-01-01', f'Row {i}', -1.0, 'C', None, 0, None) for i in range(3)
+        ])
+
+        assert Transaction.delete_all() == 3
+        assert Transaction.get_all() == []
+
     def test_date_obj_property(self, temp_db):
         """date_obj should return a date object"""
         from budget_app.models.transaction import Transaction
@@ -1026,5 +1163,84 @@ class TestPaycheckConfigModel:
         assert PaycheckConfig.get_by_id(99999) is None
 
 
+class TestDatabaseBulkLoad:
+    """Tests for Database.bulk_load"""
+
+    def _insert(self, desc):
+        from budget_app.models.transaction import Transaction
+        Transaction(id=None, date='2026-01-01', description=desc,
+                    amount=-1.0, payment_method='C').save()
+
+    def test_commits_once_at_exit(self, temp_db):
+        """Writes inside the block are committed together on exit"""
+        from budget_app.models.database import Database
+
+        db = Database()
+        with db.bulk_load():
+            self._insert('A')
+            self._insert('B')
+            # model-level commits are deferred to the context
+            assert db.connection.in_transaction
+        assert not db.connection.in_transaction
+        count = db.execute("SELECT COUNT(*) FROM transactions").fetchone()[0]
+        assert count == 2
+
+    def test_rolls_back_on_error(self, temp_db):
+        """An exception inside the block discards all of its writes"""
+        from budget_app.models.database import Database
+
+        db = Database()
+        with pytest.raises(RuntimeError):
+            with db.bulk_load():
+                self._insert('A')
+                raise RuntimeError("boom")
+        count = db.execute("SELECT COUNT(*) FROM transactions").fetchone()[0]
+        assert count == 0
+
+    def test_restores_synchronous(self, temp_db):
+        """synchronous is NORMAL during the load and restored afterwards"""
+        from budget_app.models.database import Database
+
+        db = Database()
+        before = db.execute("PRAGMA synchronous").fetchone()[0]
+        with db.bulk_load():
+            assert db.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert db.execute("PRAGMA synchronous").fetchone()[0] == before
+
+    def test_nested_blocks_commit_at_outermost(self, temp_db):
+        """Nested bulk_load blocks join the outer transaction"""
+        from budget_app.models.database import Database
+
+        db = Database()
+        with db.bulk_load():
+            with db.bulk_load():
+                self._insert('A')
+            assert db.connection.in_transaction
+        assert not db.connection.in_transaction
+
+
+class TestTransactionIndexes:
+    """Tests for the transactions table indexes"""
+
+    def _plan(self, sql, params=()):
+        from budget_app.models.database import Database
+        rows = Database().execute("EXPLAIN QUERY PLAN " + sql, params).fetchall()
+        return " ".join(tuple(row)[-1] for row in rows)
+
+    def test_ledger_query_searches_posted_date_index(self, temp_db):
+        """The unposted date-range query uses (is_posted, date)"""
+        plan = self._plan(
+            "SELECT id FROM transactions WHERE date >= ? AND date <= ? AND is_posted = ?",
+            ('2026-01-01', '2026-12-31', 0))
+        assert "idx_transactions_posted_date" in plan
+
+    def test_unlinking_charge_searches_recurring_index(self, temp_db):
+        """Unlinking a deleted charge's transactions does not scan the table"""
+        plan = self._plan(
+            "UPDATE transactions SET recurring_charge_id = NULL WHERE recurring_charge_id = ?",
+            (1,))
+        assert "idx_transactions_recurring_date" in plan
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -283,6 +283,30 @@ class TestEdgeCases:
         assert entry.amount > 0
         assert entry.remaining_balance >= 0
 
+    def test_schedule_steps_month_by_month(self):
+        """Payments fall on the first of each month, starting next month"""
+        from datetime import date
+        cards = [
+            CardPayoffInfo(card_id=1, name='Card A', balance=3000.0,
+                          apr=0.18, min_payment=25.0, credit_limit=5000.0),
+        ]
+        result = calculate_avalanche(cards, monthly_extra=200.0)
+        months = sorted({e.date for e in result.payment_schedule})
+        today = date.today()
+        assert months[0] == date(today.year + today.month // 12, today.month % 12 + 1, 1)
+        for earlier, later in zip(months, months[1:]):
+            assert later.day == 1
+            assert (later.year * 12 + later.month) - (earlier.year * 12 + earlier.month) == 1
+        assert len(months) == result.months_to_payoff
+        assert result.payoff_date == months[-1]
+
+    def test_month_start_rolls_over_year(self):
+        """Month numbers past December land in the following year"""
+        from datetime import date
+        from budget_app.utils.payoff_calculator import _month_start
+        assert _month_start(2026 * 12 + 11) == date(2026, 12, 1)
+        assert _month_start(2026 * 12 + 12) == date(2027, 1, 1)
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -401,6 +401,22 @@ class TestImportTransactions:
         assert 'Imported 3' in view.status_label.text()
         assert not view.import_btn.isEnabled()
 
+    def test_import_commits_once(self, qtbot, temp_db, sample_account, mock_qmessagebox):
+        from budget_app.views.pdf_import_view import PDFImportView
+        from budget_app.models.database import Database
+        from budget_app.models.transaction import Transaction
+        view = PDFImportView()
+        qtbot.addWidget(view)
+
+        view._statement = _make_cc_statement()
+        view._load_accounts()
+        view.account_combo.setCurrentIndex(1)
+
+        with patch.object(Database, 'bulk_load', wraps=Database().bulk_load) as mock_bulk:
+            view._import_transactions()
+            mock_bulk.assert_called_once()
+        assert len(Transaction.get_all()) == 3
+
     def test_mark_posted_checked(self, qtbot, temp_db, sample_account, mock_qmessagebox):
         from budget_app.views.pdf_import_view import PDFImportView
         from budget_app.models.transaction import Transaction
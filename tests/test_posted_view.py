@@ -60,6 +60,18 @@ class TestPostedTransactionsView:
         assert due_date_text == '01/15/2026'
         assert posted_date_text == '01/20/2026'
 
+    def test_timed_and_missing_dates(self, qtbot, temp_db):
+        """Time suffixes are dropped and a missing posted date shows '-'"""
+        from budget_app.models.transaction import Transaction
+        from budget_app.views.posted_transactions_view import PostedTransactionsView
+        Transaction(id=None, date='2026-03-04 23:59:59', description='Marker',
+                    amount=0.0, payment_method='C', is_posted=True).save()
+        view = PostedTransactionsView()
+        qtbot.addWidget(view)
+        view.refresh()
+        assert view.table.item(0, 0).text() == '03/04/2026'
+        assert view.table.item(0, 1).text() == '-'
+
     def test_amount_color_negative_red(self, qtbot, temp_db, sample_transactions):
         """Negative amounts are displayed in red (#f44336)"""
         from budget_app.views.posted_transactions_view import PostedTransactionsView
@@ -95,6 +107,37 @@ class TestPostedTransactionsView:
         view.refresh()
         assert view.info_label.text() == "Showing 1 posted transaction(s)"
 
+    def test_refresh_restores_sorting_and_updates(self, qtbot, temp_db, sample_transactions):
+        """refresh() fills with sorting/updates off, then restores both"""
+        from budget_app.views.posted_transactions_view import PostedTransactionsView
+        view = PostedTransactionsView()
+        qtbot.addWidget(view)
+        view.table.setSortingEnabled(True)
+        view.refresh()
+        assert view.table.rowCount() == 1
+        assert view.table.isSortingEnabled() is True
+        assert view.table.updatesEnabled() is True
+
+    def test_refresh_hides_table_only_during_fill(self, qtbot, temp_db, sample_transactions):
+        """The table is hidden while rows are filled and shown again afterwards"""
+        from unittest.mock import patch
+        from PyQt6.QtWidgets import QTableWidget
+        from budget_app.views.posted_transactions_view import PostedTransactionsView
+        view = PostedTransactionsView()
+        qtbot.addWidget(view)
+        view.show()
+        hidden_during_fill = []
+        original = QTableWidget.setItem
+
+        def spy(table, row, col, item):
+            hidden_during_fill.append(table.isHidden())
+            original(table, row, col, item)
+
+        with patch.object(QTableWidget, 'setItem', spy):
+            view.refresh()
+        assert hidden_during_fill and all(hidden_during_fill)
+        assert view.table.isVisible()
+
     def test_description_filter_hides_non_matching_rows(self, qtbot, temp_db):
         """Typing in desc_filter hides rows that don't match (case-insensitive)"""
         from budget_app.models.transaction import Transaction
@@ -179,6 +222,30 @@ class TestPostedTransactionsView:
         assert mock_qmessagebox.info_called
         assert "There are no posted transactions." in mock_qmessagebox.info_text
 
+    def test_clear_all_marks_ledger_dirty(self, qtbot, temp_db, mock_qmessagebox):
+        """Clearing posted transactions drops the ledger's cached rows"""
+        from unittest.mock import MagicMock
+        from PyQt6.QtWidgets import QWidget
+        from budget_app.models.transaction import Transaction
+        from budget_app.views.posted_transactions_view import PostedTransactionsView
+        Transaction(id=None, date='2026-01-10', description='Rent', amount=-1200.0,
+                    payment_method='C', is_posted=True, posted_date='2026-01-11').save()
+        parent = QWidget()
+        qtbot.addWidget(parent)
+        parent.transactions_view = MagicMock()
+        view = PostedTransactionsView()
+        view.setParent(parent)
+        view._clear_all_posted()
+        parent.transactions_view.mark_dirty.assert_called_once()
+
+    def test_rows_have_fixed_height(self, qtbot, temp_db):
+        """Row heights are fixed so filling the table never measures cell contents"""
+        from PyQt6.QtWidgets import QHeaderView
+        from budget_app.views.posted_transactions_view import PostedTransactionsView
+        view = PostedTransactionsView()
+        qtbot.addWidget(view)
+        assert view.table.verticalHeader().sectionResizeMode(0) == QHeaderView.ResizeMode.Fixed
+
     def test_table_has_six_columns(self, qtbot, temp_db):
         """Table should have 6 columns: Due Date, Posted Date, Pay Type, Description, Amount, Notes"""
         from budget_app.views.posted_transactions_view import PostedTransactionsView
@@ -193,6 +260,20 @@ class TestPostedTransactionsView:
 class TestPostedTransactionsViewAdditional:
     """Additional tests for PostedTransactionsView"""
 
+    def test_repeated_amounts_formatted_alike(self, qtbot, temp_db):
+        """Rows sharing an amount show the same currency text as distinct ones"""
+        from budget_app.models.transaction import Transaction
+        from budget_app.views.posted_transactions_view import PostedTransactionsView
+        for day, amount in (('01', -1234.5), ('02', -1234.5), ('03', 15.0)):
+            Transaction(id=None, date=f'2026-01-{day}', description='Bill',
+                        amount=amount, payment_method='C',
+                        is_posted=True, posted_date=f'2026-01-{day}').save()
+        view = PostedTransactionsView()
+        qtbot.addWidget(view)
+        view.refresh()
+        texts = sorted(view.table.item(r, 4).text() for r in range(3))
+        assert texts == ['$-1,234.50', '$-1,234.50', '$15.00']
+
     def test_multiple_posted_transactions_display(self, qtbot, temp_db):
         """Create 3 posted transactions, refresh, verify table has 3 rows"""
         from budget_app.models.transaction import Transaction
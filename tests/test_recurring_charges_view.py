@@ -459,3 +459,47 @@ class TestRecurringChargesViewAdditional:
         assert view.table.rowCount() == 2
 
 
+class TestNotifyChargeChanges:
+    """Tests for invalidating the ledger's charge caches"""
+
+    def test_notify_invalidates_transactions_view(self, qtbot, temp_db):
+        """Charge edits tell the ledger to drop its cached charges"""
+        from budget_app.views.recurring_charges_view import RecurringChargesView
+        from PyQt6.QtWidgets import QWidget
+        from unittest.mock import MagicMock
+
+        parent = QWidget()
+        parent.transactions_view = MagicMock()
+        qtbot.addWidget(parent)
+
+        view = RecurringChargesView()
+        view.setParent(parent)
+
+        view._notify_charge_changes()
+        parent.transactions_view.invalidate_recurring_charges.assert_called_once()
+
+    def test_notify_without_main_window_is_noop(self, qtbot, temp_db):
+        from budget_app.views.recurring_charges_view import RecurringChargesView
+        view = RecurringChargesView()
+        qtbot.addWidget(view)
+        view._notify_charge_changes()  # Should not raise
+
+    def test_add_charge_notifies(self, qtbot, temp_db, monkeypatch):
+        """Saving a new charge from the dialog notifies the ledger"""
+        from unittest.mock import MagicMock, patch
+        from PyQt6.QtWidgets import QDialog
+        from budget_app.models.recurring_charge import RecurringCharge
+        from budget_app.views import recurring_charges_view as module
+
+        view = module.RecurringChargesView()
+        qtbot.addWidget(view)
+        dialog = MagicMock()
+        dialog.exec.return_value = QDialog.DialogCode.Accepted
+        dialog.get_charge.return_value = RecurringCharge(
+            id=None, name='Gym', amount=-30.0, day_of_month=3,
+            payment_method='C', frequency='MONTHLY', amount_type='FIXED'
+        )
+        monkeypatch.setattr(module, 'RecurringChargeDialog', lambda *a, **k: dialog)
+        with patch.object(view, '_notify_charge_changes') as mock_notify:
+            view._add_charge()
+            mock_notify.assert_called_once()
@@ -4,6 +4,17 @@ import pytest
 from PyQt6.QtCore import Qt
 
 
+def _cell(view, row, col, role=Qt.ItemDataRole.DisplayRole):
+    """Read a ledger cell through the table model"""
+    model = view.table.model()
+    return model.data(model.index(row, col), role)
+
+
+def _header(view, col):
+    """Read a ledger column header through the table model"""
+    return view.table.model().headerData(col, Qt.Orientation.Horizontal)
+
+
 class TestTransactionsViewColumns:
     """Tests for TransactionsView column setup"""
 
@@ -14,7 +25,7 @@ class TestTransactionsViewColumns:
         qtbot.addWidget(view)
         expected_base = ["\u2713", "Date", "Pay Type", "Description", "Amount", "Chase Balance"]
         for i, label in enumerate(expected_base):
-            assert view.table.horizontalHeaderItem(i).text() == label
+            assert _header(view, i) == label
 
     def test_dynamic_card_columns_created(self, qtbot, temp_db, sample_card):
         """With a card in DB, Owed and Avail columns are created dynamically"""
@@ -22,10 +33,10 @@ class TestTransactionsViewColumns:
         view = TransactionsView()
         qtbot.addWidget(view)
         # Base (6) + Owed (1) + Avail (1) + CC Utilization (1) = 9
-        assert view.table.columnCount() == 9
+        assert view.model.columnCount() == 9
         # Check the dynamic card column headers
-        headers = [view.table.horizontalHeaderItem(i).text()
-                   for i in range(view.table.columnCount())]
+        headers = [_header(view, i)
+                   for i in range(view.model.columnCount())]
         assert "Chase Freedom Owed" in headers
         assert "Chase Freedom Avail" in headers
 
@@ -48,8 +59,8 @@ class TestTransactionsViewColumns:
         from budget_app.views.transactions_view import TransactionsView
         view = TransactionsView()
         qtbot.addWidget(view)
-        last_col = view.table.columnCount() - 1
-        assert view.table.horizontalHeaderItem(last_col).text() == "CC Utilization"
+        last_col = view.model.columnCount() - 1
+        assert _header(view, last_col) == "CC Utilization"
 
     def test_no_cards_still_has_utilization_column(self, qtbot, temp_db):
         """With no cards, base columns + CC Utilization still present"""
@@ -57,9 +68,9 @@ class TestTransactionsViewColumns:
         view = TransactionsView()
         qtbot.addWidget(view)
         # Base (6) + CC Utilization (1) = 7
-        assert view.table.columnCount() == 7
-        last_col = view.table.columnCount() - 1
-        assert view.table.horizontalHeaderItem(last_col).text() == "CC Utilization"
+        assert view.model.columnCount() == 7
+        last_col = view.model.columnCount() - 1
+        assert _header(view, last_col) == "CC Utilization"
 
     def test_multiple_cards_columns(self, qtbot, temp_db, multiple_cards):
         """Multiple cards each get Owed and Avail columns"""
@@ -67,7 +78,38 @@ class TestTransactionsViewColumns:
         view = TransactionsView()
         qtbot.addWidget(view)
         # Base (6) + 4 cards * 2 (Owed+Avail) + CC Utilization (1) = 15
-        assert view.table.columnCount() == 15
+        assert view.model.columnCount() == 15
+
+    def test_sizes_never_measured_from_contents(self, qtbot, temp_db, sample_card):
+        """Rows have a fixed height and columns keep explicit, user-resizable widths"""
+        from PyQt6.QtWidgets import QHeaderView
+        from budget_app.views.transactions_view import TransactionsView
+        view = TransactionsView()
+        qtbot.addWidget(view)
+        assert view.table.verticalHeader().sectionResizeMode(0) == QHeaderView.ResizeMode.Fixed
+        header = view.table.horizontalHeader()
+        for col in range(view.model.columnCount()):
+            assert header.sectionResizeMode(col) == QHeaderView.ResizeMode.Interactive
+
+    def test_card_column_widths_fit_header_labels(self, qtbot, temp_db):
+        """Card columns default to a fixed width, widened for long card names"""
+        from budget_app.models.credit_card import CreditCard
+        from budget_app.views.transactions_view import (
+            TransactionsView, CARD_COLUMN_WIDTH, HEADER_PADDING)
+        for code, name in (('V', 'Visa'), ('AB', 'Amex Blue Cash Preferred Everyday')):
+            CreditCard(id=None, pay_type_code=code, name=name, credit_limit=1000.0,
+                       current_balance=0.0, interest_rate=0.2, due_day=1).save()
+        view = TransactionsView()
+        qtbot.addWidget(view)
+        view._rebuild_columns_with_sorted_cards()  # Defaults, not saved widths
+
+        metrics = view.table.horizontalHeader().fontMetrics()
+        short_col = view._all_columns.index("Visa Owed")
+        assert view.table.columnWidth(short_col) == CARD_COLUMN_WIDTH
+        label = "Amex Blue Cash Preferred Everyday Avail"
+        long_col = view._all_columns.index(label)
+        assert view.table.columnWidth(long_col) == metrics.horizontalAdvance(label) + HEADER_PADDING
+        assert view.table.columnWidth(long_col) > CARD_COLUMN_WIDTH
 
 
 class TestTransactionsViewState:
@@ -107,13 +149,40 @@ class TestTransactionsViewColumnVisibility:
         view = TransactionsView()
         qtbot.addWidget(view)
         # First hide some columns
-        for i in range(view.table.columnCount()):
+        for i in range(view.model.columnCount()):
             view.table.setColumnHidden(i, True)
         # Show all
         view._show_all_columns()
-        for i in range(view.table.columnCount()):
+        for i in range(view.model.columnCount()):
             assert view.table.isColumnHidden(i) is False
 
+    def test_group_toggle_saves_visibility_once(self, qtbot, temp_db, multiple_cards):
+        """Hiding a column group saves visibility once and syncs the checkboxes"""
+        from unittest.mock import patch
+        from budget_app.views.transactions_view import TransactionsView
+        view = TransactionsView()
+        qtbot.addWidget(view)
+        view._show_all_columns()
+        with patch.object(view, '_save_column_visibility') as mock_save:
+            view._toggle_column_group("Avail", False)
+            mock_save.assert_called_once()
+        for i, col_name in enumerate(view._all_columns):
+            if "Avail" in col_name:
+                assert view.table.isColumnHidden(i) is True
+                assert view._column_checkboxes[i].isChecked() is False
+        assert view.table.updatesEnabled()
+
+    def test_batch_keeps_updates_disabled_inside_bulk_mode(self, qtbot, temp_db, sample_card):
+        """A column batch inside bulk_mode leaves updates disabled for bulk_mode"""
+        from budget_app.views.transactions_view import TransactionsView
+        view = TransactionsView()
+        qtbot.addWidget(view)
+        view._first_load = False
+        with view.bulk_mode(refresh=False):
+            view._hide_all_cc_columns()
+            assert not view.table.updatesEnabled()
+        assert view.table.updatesEnabled()
+
     def test_hide_all_cc_columns(self, qtbot, temp_db, sample_card):
         """_hide_all_cc_columns hides Owed and Avail columns"""
         from budget_app.views.transactions_view import TransactionsView
@@ -225,6 +294,38 @@ class TestTransactionDialog:
         qtbot.addWidget(dialog)
         assert dialog.windowTitle() == "Add Transaction"
 
+    def test_uses_supplied_payment_methods(self, qtbot, temp_db):
+        """A supplied method list fills the combo without querying cards"""
+        from budget_app.views.transactions_view import TransactionDialog
+        from budget_app.models.credit_card import CreditCard
+        from unittest.mock import patch
+
+        with patch.object(CreditCard, 'get_all') as mock_get_all:
+            dialog = TransactionDialog(payment_methods=[("Chase (Bank)", "C"), ("Visa", "V")])
+        qtbot.addWidget(dialog)
+
+        mock_get_all.assert_not_called()
+        assert [dialog.method_combo.itemData(i)
+                for i in range(dialog.method_combo.count())] == ["C", "V"]
+
+    def test_view_caches_payment_methods_until_dirty(self, qtbot, temp_db, sample_card):
+        """The view queries cards once per dirty cycle for its dialogs"""
+        from budget_app.views.transactions_view import TransactionsView
+        from budget_app.models.credit_card import CreditCard
+        from unittest.mock import patch
+
+        view = TransactionsView()
+        qtbot.addWidget(view)
+
+        with patch.object(CreditCard, 'get_all', wraps=CreditCard.get_all) as spy:
+            first = view._payment_methods()
+            assert view._payment_methods() is first
+            assert spy.call_count == 1
+            view.mark_dirty()
+            view._payment_methods()
+            assert spy.call_count == 2
+        assert (sample_card.name, sample_card.pay_type_code) in first
+
     def test_title_edit(self, qtbot, temp_db, sample_transactions):
         """Editing dialog has 'Edit Transaction' title"""
         from budget_app.views.transactions_view import TransactionDialog
@@ -348,6 +449,24 @@ class TestGenerateRecurringDialog:
         qtbot.addWidget(dialog)
         assert dialog.clear_check.isChecked() is True
 
+    def test_summary_counts_regular_and_special(self, qtbot, temp_db):
+        """Summary labels split active charges into regular and special"""
+        from budget_app.views.transactions_view import GenerateRecurringDialog
+        from budget_app.models.recurring_charge import RecurringCharge
+        from PyQt6.QtWidgets import QLabel
+
+        for name, day, freq in [('Netflix', 5, 'MONTHLY'), ('Gym', 10, 'MONTHLY'),
+                                ('Mortgage', 991, 'SPECIAL')]:
+            RecurringCharge(id=None, name=name, amount=-10.0, day_of_month=day,
+                            payment_method='C', frequency=freq,
+                            amount_type='FIXED').save()
+
+        dialog = GenerateRecurringDialog()
+        qtbot.addWidget(dialog)
+        texts = [label.text() for label in dialog.findChildren(QLabel)]
+        assert "- 2 regular monthly charges" in texts
+        assert "- 1 special charges (mortgage, etc.)" in texts
+
     def test_get_months_returns_value(self, qtbot, temp_db):
         """get_months() returns the spinner value"""
         from budget_app.views.transactions_view import GenerateRecurringDialog
@@ -394,16 +513,45 @@ class TestTransactionsViewRefresh:
         view = self._make_view(qtbot)
         view.refresh()
         # 4 sample transactions, but 1 is posted and filtered out
-        assert view.table.rowCount() == 3
+        assert view.model.rowCount() == 3
 
     def test_refresh_skips_when_not_dirty(self, qtbot, temp_db):
         """Create view, manually clear table, call refresh() - should be no-op since _data_dirty is already False"""
         view = self._make_view(qtbot)
         view.refresh()  # First refresh: sets _data_dirty = False
         # Manually clear the table to detect if refresh repopulates
-        view.table.setRowCount(0)
+        view.model.set_ledger([], [], [], [])
         view.refresh()  # Should be a no-op since _data_dirty is False and dates unchanged
-        assert view.table.rowCount() == 0
+        assert view.model.rowCount() == 0
+
+    def test_info_label_counts_recurring_rows(self, qtbot, temp_db, sample_card):
+        """The info label splits the row count into recurring and manual"""
+        from budget_app.models.recurring_charge import RecurringCharge
+        from budget_app.models.transaction import Transaction
+        charge = RecurringCharge(id=None, name='Gym', amount=-30.0, day_of_month=5,
+                                 payment_method='C', frequency='MONTHLY', amount_type='FIXED')
+        charge.save()
+        for day, rec_id in (('05', charge.id), ('06', None), ('07', None)):
+            Transaction(id=None, date=f'2026-02-{day}', description='Gym', amount=-30.0,
+                        payment_method='C', recurring_charge_id=rec_id).save()
+        view = self._make_view(qtbot)
+        view.refresh()
+        assert view.model.recurring_count() == 1
+        assert view.info_label.text() == "Showing 3 transactions (1 recurring, 2 manual)"
+
+    def test_refresh_deferred_while_hidden_tab(self, qtbot, temp_db, sample_card, sample_transactions):
+        """refresh() on a hidden embedded view waits until the view is shown"""
+        from PyQt6.QtWidgets import QWidget
+        view = self._make_view(qtbot)
+        container = QWidget()
+        qtbot.addWidget(container)
+        view.setParent(container)
+        view.refresh()
+        assert view._pending_refresh is True
+        assert view.model.rowCount() == 0
+        container.show()
+        assert view._pending_refresh is False
+        assert view.model.rowCount() == 3
 
     def test_recurring_description_highlighted_blue(self, qtbot, temp_db, sample_card):
         """Recurring transactions have description highlighted in blue (#64b5f6)"""
@@ -430,10 +578,9 @@ class TestTransactionsViewRefresh:
 
         # Find the row with recurring_charge_id set (description column = 3)
         found = False
-        for row in range(view.table.rowCount()):
-            desc_item = view.table.item(row, 3)
-            if desc_item and desc_item.text() == 'Test Recurring':
-                assert desc_item.foreground().color() == QColor("#64b5f6")
+        for row in range(view.model.rowCount()):
+            if _cell(view, row, 3) == 'Test Recurring':
+                assert _cell(view, row, 3, Qt.ItemDataRole.ForegroundRole) == QColor("#64b5f6")
                 found = True
                 break
         assert found, "Recurring transaction row not found"
@@ -446,18 +593,16 @@ class TestTransactionsViewRefresh:
 
         # Find a negative amount row (e.g., Groceries -150.0)
         found = False
-        for row in range(view.table.rowCount()):
-            amount_item = view.table.item(row, 4)
-            if amount_item:
-                amount_text = amount_item.text().replace('$', '').replace(',', '').strip()
-                try:
-                    amount = float(amount_text)
-                    if amount < 0:
-                        assert amount_item.foreground().color() == QColor("#f44336")
-                        found = True
-                        break
-                except ValueError:
-                    pass
+        for row in range(view.model.rowCount()):
+            amount_text = _cell(view, row, 4).replace('$', '').replace(',', '').strip()
+            try:
+                amount = float(amount_text)
+                if amount < 0:
+                    assert _cell(view, row, 4, Qt.ItemDataRole.ForegroundRole) == QColor("#f44336")
+                    found = True
+                    break
+            except ValueError:
+                pass
         assert found, "No negative amount row found"
 
     def test_amount_color_positive_green(self, qtbot, temp_db, sample_card, sample_transactions):
@@ -468,18 +613,16 @@ class TestTransactionsViewRefresh:
 
         # Find a positive amount row (e.g., Paycheck 2500.0)
         found = False
-        for row in range(view.table.rowCount()):
-            amount_item = view.table.item(row, 4)
-            if amount_item:
-                amount_text = amount_item.text().replace('$', '').replace(',', '').strip()
-                try:
-                    amount = float(amount_text)
-                    if amount > 0:
-                        assert amount_item.foreground().color() == QColor("#4caf50")
-                        found = True
-                        break
-                except ValueError:
-                    pass
+        for row in range(view.model.rowCount()):
+            amount_text = _cell(view, row, 4).replace('$', '').replace(',', '').strip()
+            try:
+                amount = float(amount_text)
+                if amount > 0:
+                    assert _cell(view, row, 4, Qt.ItemDataRole.ForegroundRole) == QColor("#4caf50")
+                    found = True
+                    break
+            except ValueError:
+                pass
         assert found, "No positive amount row found"
 
     def test_chase_balance_negative_red(self, qtbot, temp_db, sample_account, sample_card):
@@ -500,11 +643,9 @@ class TestTransactionsViewRefresh:
 
         # Find the row for Huge Expense and check chase balance color
         found = False
-        for row in range(view.table.rowCount()):
-            desc_item = view.table.item(row, 3)
-            if desc_item and desc_item.text() == 'Huge Expense':
-                chase_item = view.table.item(row, 5)
-                assert chase_item.foreground().color() == QColor("#f44336")
+        for row in range(view.model.rowCount()):
+            if _cell(view, row, 3) == 'Huge Expense':
+                assert _cell(view, row, 5, Qt.ItemDataRole.ForegroundRole) == QColor("#f44336")
                 found = True
                 break
         assert found, "Huge Expense row not found"
@@ -526,6 +667,85 @@ class TestTransactionsViewApplyFilters:
         view.refresh()
         return view
 
+    def test_filter_change_only_touches_flipped_rows(self, qtbot, temp_db, sample_card, sample_transactions):
+        """Narrowing a filter calls setRowHidden only for rows that changed"""
+        from unittest.mock import patch
+        view = self._make_view_with_data(qtbot, temp_db, sample_card, sample_transactions)
+        view.desc_filter.setText("Pay")
+        view._apply_filters()
+        hidden = [view.table.isRowHidden(r) for r in range(view.model.rowCount())]
+        assert any(hidden)
+        with patch.object(view.table, 'setRowHidden', wraps=view.table.setRowHidden) as spy:
+            view.desc_filter.setText("Pa")  # Same matches as "Pay"
+            view._apply_filters()
+            spy.assert_not_called()
+            view.desc_filter.setText("")
+            view._apply_filters()
+            assert spy.call_count == sum(hidden)
+
+    def test_reload_without_filters_touches_no_rows(self, qtbot, temp_db, sample_card, sample_transactions):
+        """Rows a reload leaves visible are not set one by one again"""
+        from unittest.mock import patch
+        view = self._make_view_with_data(qtbot, temp_db, sample_card, sample_transactions)
+        view.mark_dirty()
+        with patch.object(view.table, 'setRowHidden', wraps=view.table.setRowHidden) as spy:
+            view.refresh()
+            spy.assert_not_called()
+        assert view.model.rowCount() == 3
+
+    def test_hidden_rows_follow_filter_across_reloads(self, qtbot, temp_db, sample_card, sample_transactions):
+        """Growing or shrinking the ledger under a filter leaves every row correct"""
+        from budget_app.models.transaction import Transaction
+        view = self._make_view_with_data(qtbot, temp_db, sample_card, sample_transactions)
+        view.desc_filter.setText("e")  # Hides Paycheck only
+        view._apply_filters()
+
+        def assert_rows_match_filter():
+            for row in range(view.model.rowCount()):
+                assert view.table.isRowHidden(row) == ('e' not in _cell(view, row, 3).lower())
+
+        for day, desc in (('03', 'Bonus'), ('04', 'Tip'), ('20', 'Fee')):
+            Transaction(id=None, date=f'2026-02-{day}', description=desc,
+                        amount=-1.0, payment_method='C').save()
+        view.mark_dirty()
+        view.refresh()
+        assert view.model.rowCount() == 6
+        assert_rows_match_filter()
+
+        Transaction.delete_many([t.id for t in Transaction.get_all()
+                                 if t.description in ('Bonus', 'Paycheck')])
+        view.mark_dirty()
+        view.refresh()
+        assert view.model.rowCount() == 4
+        assert_rows_match_filter()
+
+        view.desc_filter.setText("")
+        view._apply_filters()
+        assert not any(view.table.isRowHidden(r) for r in range(view.model.rowCount()))
+
+    def test_typing_is_debounced(self, qtbot, temp_db, sample_card, sample_transactions):
+        """Keystrokes start the filter timer; one pass runs when it fires"""
+        from unittest.mock import patch
+        view = self._make_view_with_data(qtbot, temp_db, sample_card, sample_transactions)
+        with patch.object(view.model, 'row_mask', wraps=view.model.row_mask) as spy:
+            for text in ("P", "Pa", "Pay"):
+                view.desc_filter.setText(text)
+            assert view._filter_timer.isActive()
+            spy.assert_not_called()
+            qtbot.waitUntil(lambda: not view._filter_timer.isActive())
+            assert spy.call_count == 1
+        hidden = [view.table.isRowHidden(r) for r in range(view.model.rowCount())]
+        assert any(hidden) and not all(hidden)
+
+    def test_sign_filter_applies_immediately(self, qtbot, temp_db, sample_card, sample_transactions):
+        """The sign combo is a discrete choice and is not debounced"""
+        view = self._make_view_with_data(qtbot, temp_db, sample_card, sample_transactions)
+        view.amount_sign_filter.setCurrentIndex(1)
+        assert not view._filter_timer.isActive()
+        for row in range(view.model.rowCount()):
+            if not view.table.isRowHidden(row):
+                assert view.model.transaction(row).amount > 0
+
     def test_desc_filter_hides_non_matching(self, qtbot, temp_db, sample_card, sample_transactions):
         """Set desc_filter to 'Pay', verify rows with 'Paycheck' visible, 'Groceries' hidden"""
         view = self._make_view_with_data(qtbot, temp_db, sample_card, sample_transactions)
@@ -534,13 +754,11 @@ class TestTransactionsViewApplyFilters:
         # but call explicitly to be sure
         view._apply_filters()
 
-        for row in range(view.table.rowCount()):
-            desc_item = view.table.item(row, 3)
-            if desc_item:
-                if "Paycheck" in desc_item.text():
-                    assert not view.table.isRowHidden(row), "Paycheck row should be visible"
-                elif "Groceries" in desc_item.text():
-                    assert view.table.isRowHidden(row), "Groceries row should be hidden"
+        for row in range(view.model.rowCount()):
+            if "Paycheck" in _cell(view, row, 3):
+                assert not view.table.isRowHidden(row), "Paycheck row should be visible"
+            elif "Groceries" in _cell(view, row, 3):
+                assert view.table.isRowHidden(row), "Groceries row should be hidden"
 
     def test_desc_filter_case_insensitive(self, qtbot, temp_db, sample_card, sample_transactions):
         """Use lowercase filter, still matches"""
@@ -548,9 +766,8 @@ class TestTransactionsViewApplyFilters:
         view.desc_filter.setText("pay")
         view._apply_filters()
 
-        for row in range(view.table.rowCount()):
-            desc_item = view.table.item(row, 3)
-            if desc_item and "Paycheck" in desc_item.text():
+        for row in range(view.model.rowCount()):
+            if "Paycheck" in _cell(view, row, 3):
                 assert not view.table.isRowHidden(row), "Paycheck row should be visible with lowercase filter"
                 return
         pytest.fail("Paycheck row not found in table")
@@ -561,16 +778,10 @@ class TestTransactionsViewApplyFilters:
         view.amount_min_filter.setText("0")
         view._apply_filters()
 
-        for row in range(view.table.rowCount()):
+        for row in range(view.model.rowCount()):
             if not view.table.isRowHidden(row):
-                amount_item = view.table.item(row, 4)
-                if amount_item:
-                    amount_text = amount_item.text().replace('$', '').replace(',', '').strip()
-                    try:
-                        amount = float(amount_text)
-                        assert amount >= 0, f"Row {row} has amount {amount} but should be >= 0"
-                    except ValueError:
-                        pass
+                amount = view.model.transaction(row).amount
+                assert amount >= 0, f"Row {row} has amount {amount} but should be >= 0"
 
     def test_amount_max_filter(self, qtbot, temp_db, sample_card, sample_transactions):
         """Set amount_max_filter to '0', only negative amounts visible"""
@@ -578,16 +789,10 @@ class TestTransactionsViewApplyFilters:
         view.amount_max_filter.setText("0")
         view._apply_filters()
 
-        for row in range(view.table.rowCount()):
+        for row in range(view.model.rowCount()):
             if not view.table.isRowHidden(row):
-                amount_item = view.table.item(row, 4)
-                if amount_item:
-                    amount_text = amount_item.text().replace('$', '').replace(',', '').strip()
-                    try:
-                        amount = float(amount_text)
-                        assert amount <= 0, f"Row {row} has amount {amount} but should be <= 0"
-                    except ValueError:
-                        pass
+                amount = view.model.transaction(row).amount
+                assert amount <= 0, f"Row {row} has amount {amount} but should be <= 0"
 
     def test_sign_filter_income(self, qtbot, temp_db, sample_card, sample_transactions):
         """Set amount_sign_filter to index 1 (Income+), only positive amounts visible"""
@@ -595,16 +800,10 @@ class TestTransactionsViewApplyFilters:
         view.amount_sign_filter.setCurrentIndex(1)
         view._apply_filters()
 
-        for row in range(view.table.rowCount()):
+        for row in range(view.model.rowCount()):
             if not view.table.isRowHidden(row):
-                amount_item = view.table.item(row, 4)
-                if amount_item:
-                    amount_text = amount_item.text().replace('$', '').replace(',', '').strip()
-                    try:
-                        amount = float(amount_text)
-                        assert amount > 0, f"Row {row} has amount {amount} but should be > 0"
-                    except ValueError:
-                        pass
+                amount = view.model.transaction(row).amount
+                assert amount > 0, f"Row {row} has amount {amount} but should be > 0"
 
     def test_sign_filter_expenses(self, qtbot, temp_db, sample_card, sample_transactions):
         """Set amount_sign_filter to index 2 (Expenses-), only negative amounts visible"""
@@ -612,16 +811,10 @@ class TestTransactionsViewApplyFilters:
         view.amount_sign_filter.setCurrentIndex(2)
         view._apply_filters()
 
-        for row in range(view.table.rowCount()):
+        for row in range(view.model.rowCount()):
             if not view.table.isRowHidden(row):
-                amount_item = view.table.item(row, 4)
-                if amount_item:
-                    amount_text = amount_item.text().replace('$', '').replace(',', '').strip()
-                    try:
-                        amount = float(amount_text)
-                        assert amount < 0, f"Row {row} has amount {amount} but should be < 0"
-                    except ValueError:
-                        pass
+                amount = view.model.transaction(row).amount
+                assert amount < 0, f"Row {row} has amount {amount} but should be < 0"
 
     def test_clear_filters_shows_all(self, qtbot, temp_db, sample_card, sample_transactions):
         """Apply filters, then _clear_filters(), all rows visible"""
@@ -630,12 +823,12 @@ class TestTransactionsViewApplyFilters:
         view.desc_filter.setText("Paycheck")
         view._apply_filters()
         # Verify some rows are hidden
-        hidden_count = sum(1 for row in range(view.table.rowCount()) if view.table.isRowHidden(row))
+        hidden_count = sum(1 for row in range(view.model.rowCount()) if view.table.isRowHidden(row))
         assert hidden_count > 0, "At least one row should be hidden after filtering"
 
         # Clear filters
         view._clear_filters()
-        for row in range(view.table.rowCount()):
+        for row in range(view.model.rowCount()):
             assert not view.table.isRowHidden(row), f"Row {row} should be visible after clearing filters"
 
     def test_invalid_amount_filter_ignored(self, qtbot, temp_db, sample_card, sample_transactions):
@@ -644,10 +837,46 @@ class TestTransactionsViewApplyFilters:
         view.amount_min_filter.setText("abc")
         view._apply_filters()
         # All rows should remain visible since the invalid filter is ignored
-        for row in range(view.table.rowCount()):
+        for row in range(view.model.rowCount()):
             assert not view.table.isRowHidden(row), f"Row {row} should be visible with invalid filter"
 
 
+class TestGenerationStreaming:
+    """Tests for streaming generated rows into a single bulk insert"""
+
+    def test_rows_streamed_in_one_insert(self, qtbot, temp_db):
+        """Rows are passed as a generator to one bulk_insert call, none lost"""
+        import types
+        from budget_app.views.transactions_view import TransactionsView
+        from budget_app.models.transaction import Transaction
+        from budget_app.models.recurring_charge import RecurringCharge
+        from datetime import date
+        from unittest.mock import patch
+
+        view = TransactionsView()
+        qtbot.addWidget(view)
+        charge = RecurringCharge(id=None, name='Spaceship', amount=-100.0,
+                                 day_of_month=992, payment_method='C',
+                                 frequency='SPECIAL', amount_type='FIXED')
+        charge.save()
+
+        calls = []
+        real_bulk = Transaction.bulk_insert
+
+        def record_call(rows):
+            calls.append(rows)
+            return real_bulk(rows)
+
+        with patch.object(Transaction, 'bulk_insert', side_effect=record_call):
+            count = view._generate_special_charges(
+                date(2026, 1, 1), date(2026, 12, 31), [charge])
+
+        assert count == 12
+        assert len(Transaction.get_all()) == 12
+        assert len(calls) == 1
+        assert isinstance(calls[0], types.GeneratorType)
+
+
 class TestCountPaydaysInMonth:
     """Tests for _count_paydays_in_month(year, month)"""
 
@@ -673,6 +902,29 @@ class TestCountPaydaysInMonth:
         view = self._make_view(qtbot, temp_db)
         assert view._count_paydays_in_month(2026, 5) == 3
 
+    def test_matches_friday_walk_for_every_month(self, qtbot, temp_db):
+        """Closed-form count agrees with walking the calendar week by week"""
+        import calendar
+        from datetime import date
+        view = self._make_view(qtbot, temp_db)
+        # Every month of a full 28-year weekday/leap cycle, plus the
+        # non-leap century year 2100
+        for year in list(range(2024, 2052)) + [2100]:
+            for month in range(1, 13):
+                fridays = sum(1 for day in range(1, calendar.monthrange(year, month)[1] + 1)
+                              if date(year, month, day).weekday() == 4)
+                expected = 3 if fridays >= 5 else 2
+                assert view._count_paydays_in_month(year, month) == expected
+
+    def test_results_cached_per_month(self, qtbot, temp_db):
+        """Repeated lookups for a month are served from the cache"""
+        from budget_app.views.transactions_view import _paydays_in_month
+        view = self._make_view(qtbot, temp_db)
+        view._count_paydays_in_month(2027, 3)
+        hits_before = _paydays_in_month.cache_info().hits
+        view._count_paydays_in_month(2027, 3)
+        assert _paydays_in_month.cache_info().hits == hits_before + 1
+
 
 class TestPayTypeFilter:
     """Tests for pay type filter behavior"""
@@ -709,6 +961,93 @@ class TestPayTypeFilter:
         expected = f"1/{total} \u25bc"
         assert view.pay_type_btn.text() == expected
 
+    def test_toggles_coalesced_into_one_pass(self, qtbot, temp_db, sample_card):
+        """Several quick toggles trigger a single deferred filter pass"""
+        from unittest.mock import patch
+        view = self._make_view(qtbot, temp_db)
+        with patch.object(view, '_apply_filters') as mock_filter:
+            for code in list(view._pay_type_actions):
+                view._pay_type_actions[code].setChecked(False)
+                view._update_pay_type_filter()
+            mock_filter.assert_not_called()
+            qtbot.waitUntil(lambda: mock_filter.call_count == 1, timeout=2000)
+
+    def test_unchanged_selection_is_noop(self, qtbot, temp_db, sample_card):
+        """Re-selecting an already complete selection schedules nothing"""
+        view = self._make_view(qtbot, temp_db)
+        view._select_all_pay_types()
+        assert not view._pay_type_timer.isActive()
+        assert view._get_selected_pay_types() == frozenset({'C', 'CH'})
+
+    def test_selection_tracked_as_frozenset(self, qtbot, temp_db, sample_card):
+        """Toggling updates the cached selection used by the filters"""
+        view = self._make_view(qtbot, temp_db)
+        view._pay_type_actions['C'].setChecked(False)
+        view._update_pay_type_filter()
+        assert view._get_selected_pay_types() == frozenset({'CH'})
+        assert view._pay_type_timer.isActive()
+
+    def test_menu_close_flushes_pending_filter(self, qtbot, temp_db, sample_card):
+        """Closing the pay-type menu applies a pending change right away"""
+        from unittest.mock import patch
+        view = self._make_view(qtbot, temp_db)
+        with patch.object(view, '_apply_filters') as mock_filter:
+            view._pay_type_actions['CH'].setChecked(False)
+            view._update_pay_type_filter()
+            view.pay_type_menu.aboutToHide.emit()
+            mock_filter.assert_called_once()
+        assert not view._pay_type_timer.isActive()
+
+    def test_toggle_hides_rows_without_reload(self, qtbot, temp_db, sample_account, sample_card):
+        """Deselecting a pay type hides its rows without querying the database"""
+        from unittest.mock import patch
+        from PyQt6.QtCore import QDate
+        from budget_app.models.transaction import Transaction
+
+        Transaction(id=None, date='2026-03-01', description='Groceries',
+                    amount=-50.0, payment_method='C').save()
+        Transaction(id=None, date='2026-03-02', description='Gas',
+                    amount=-40.0, payment_method='CH').save()
+
+        view = self._make_view(qtbot, temp_db)
+        view._first_load = False
+        view.from_date.setDate(QDate.fromString("2026-01-01", "yyyy-MM-dd"))
+        view.to_date.setDate(QDate.fromString("2026-12-31", "yyyy-MM-dd"))
+        view.refresh()
+        assert view.model.rowCount() == 2
+        chase_before = [_cell(view, r, 5) for r in range(2)]
+
+        view._pay_type_actions['CH'].setChecked(False)
+        with patch.object(Transaction, 'get_by_date_range') as mock_fetch:
+            view._update_pay_type_filter()
+            view._apply_pay_type_filter()
+            mock_fetch.assert_not_called()
+
+        assert view.table.isRowHidden(0) is False
+        assert view.table.isRowHidden(1) is True
+        # Balances still include every payment method
+        assert [_cell(view, r, 5) for r in range(2)] == chase_before
+
+    def test_clear_filters_keeps_pay_type_selection(self, qtbot, temp_db, sample_account, sample_card):
+        """Clearing the column filters leaves deselected pay types hidden"""
+        from PyQt6.QtCore import QDate
+        from budget_app.models.transaction import Transaction
+
+        Transaction(id=None, date='2026-03-02', description='Gas',
+                    amount=-40.0, payment_method='CH').save()
+
+        view = self._make_view(qtbot, temp_db)
+        view._first_load = False
+        view.from_date.setDate(QDate.fromString("2026-01-01", "yyyy-MM-dd"))
+        view.to_date.setDate(QDate.fromString("2026-12-31", "yyyy-MM-dd"))
+        view.refresh()
+
+        view._pay_type_actions['CH'].setChecked(False)
+        view._update_pay_type_filter()
+        view._apply_pay_type_filter()
+        view._clear_filters()
+        assert view.table.isRowHidden(0) is True
+
 
 class TestToggleZeroOwedColumns:
     """Tests for _toggle_zero_owed_columns"""
@@ -787,6 +1126,52 @@ class TestSaveColumnVisibility:
         assert "Chase Freedom Owed" not in hidden
         assert "Chase Freedom Avail" not in hidden
 
+    def test_checkbox_toggles_coalesced(self, qtbot, temp_db, multiple_cards):
+        """Several column checkbox clicks are saved in one deferred write"""
+        from unittest.mock import patch
+        from budget_app.views.transactions_view import TransactionsView
+        view = TransactionsView()
+        qtbot.addWidget(view)
+        with patch.object(view, '_save_column_visibility',
+                          wraps=view._save_column_visibility) as spy:
+            for checkbox in list(view._column_checkboxes.values())[:3]:
+                checkbox.setChecked(not checkbox.isChecked())
+            spy.assert_not_called()
+            assert view._save_visibility_timer.isActive()
+            view._flush_column_visibility()
+            spy.assert_called_once()
+
+    def test_rebuild_keeps_pending_visibility(self, qtbot, temp_db, multiple_cards):
+        """A sort right after a checkbox click keeps the click's effect"""
+        from budget_app.views.transactions_view import TransactionsView
+        view = TransactionsView()
+        qtbot.addWidget(view)
+        view._first_load = False
+        view._show_all_columns()
+        idx = view._all_columns.index("Amex Blue Avail")
+        view._column_checkboxes[idx].setChecked(False)
+        view._rebuild_columns_with_sorted_cards()
+        idx = view._all_columns.index("Amex Blue Avail")
+        assert view.table.isColumnHidden(idx) is True
+
+    def test_unchanged_visibility_not_rewritten(self, qtbot, temp_db, sample_card):
+        """Saving the same hidden list twice only writes settings once"""
+        from budget_app.views.transactions_view import TransactionsView
+        from unittest.mock import patch
+        view = TransactionsView()
+        qtbot.addWidget(view)
+        owed_idx = view._all_columns.index("Chase Freedom Owed")
+        view.table.setColumnHidden(owed_idx, True)
+        view._save_column_visibility()
+
+        with patch.object(view._settings, 'setValue') as mock_set:
+            view._save_column_visibility()
+            mock_set.assert_not_called()
+
+            view.table.setColumnHidden(owed_idx, False)
+            view._save_column_visibility()
+            mock_set.assert_called_once()
+
 
 class TestUpdateBalancesForPostedTransaction:
     """Tests for _update_balances_for_posted_transaction"""
@@ -977,7 +1362,7 @@ class TestGetSelectedTransactionId:
         view.to_date.setDate(QDate.fromString("2026-12-31", "yyyy-MM-dd"))
         view.refresh()
         # Ensure there are rows in the table
-        assert view.table.rowCount() > 0
+        assert view.model.rowCount() > 0
         # Select the first row
         view.table.selectRow(0)
         trans_id = view._get_selected_transaction_id()
@@ -985,8 +1370,191 @@ class TestGetSelectedTransactionId:
         assert isinstance(trans_id, int)
 
 
-class TestOnItemChanged:
-    """Tests for _on_item_changed - posting/unposting via checkbox"""
+class TestFmtMoney:
+    """Tests for the cached currency formatter"""
+
+    def test_formats_cents(self):
+        from budget_app.views.transactions_model import _fmt_money
+        assert _fmt_money(123456) == "$1,234.56"
+        assert _fmt_money(-1250) == "$-12.50"
+        assert _fmt_money(0) == "$0.00"
+
+    def test_model_rounds_to_cent(self, qtbot):
+        """Float noise below a cent does not change the cell text"""
+        from budget_app.models.transaction import Transaction
+        from budget_app.views.transactions_model import TransactionsTableModel
+        model = TransactionsTableModel()
+        model.set_columns(["\u2713", "Date", "Pay Type", "Description", "Amount",
+                           "Chase Balance", "CC Utilization"])
+        rows = [Transaction(id=i, date='2026-03-04', description='X', amount=amount,
+                            payment_method='C')
+                for i, amount in enumerate((0.1 + 0.2, -15.99, -0.001), start=1)]
+        model.set_ledger(rows, [(0.1 + 0.2,), (-15.99,), (-0.001,)], [0.0] * 3, [])
+        assert [model.data(model.index(r, 4)) for r in range(3)] == [
+            "$0.30", "$-15.99", "$0.00"]
+        assert [model.data(model.index(r, 5)) for r in range(3)] == [
+            "$0.30", "$-15.99", "$0.00"]
+
+    def test_repeat_amounts_hit_cache(self):
+        from budget_app.views.transactions_model import _fmt_money
+        _fmt_money.cache_clear()
+        for _ in range(3):
+            _fmt_money(-4200)
+        info = _fmt_money.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+
+class TestTransactionsTableModel:
+    """Tests for TransactionsTableModel cell formatting"""
+
+    def _model(self, qtbot, amount=-12.5):
+        from budget_app.models.transaction import Transaction
+        from budget_app.views.transactions_model import TransactionsTableModel
+        model = TransactionsTableModel()
+        model.set_columns(["\u2713", "Date", "Pay Type", "Description", "Amount",
+                           "Chase Balance", "CC Utilization"])
+        trans = Transaction(id=1, date='2026-03-04', description='Coffee',
+                            amount=amount, payment_method='C')
+        model.set_ledger([trans], [(987.5,)], [0.0], [])
+        return model
+
+    def test_display_text_is_cached(self, qtbot):
+        """A cell is formatted once, then served from the cache"""
+        from unittest.mock import patch
+        model = self._model(qtbot)
+        index = model.index(0, 4)
+        assert model.data(index) == "$-12.50"
+        with patch.object(model, '_display') as mock_display:
+            assert model.data(index) == "$-12.50"
+            mock_display.assert_not_called()
+
+    def test_set_ledger_drops_cached_text(self, qtbot):
+        """Reloading rows re-formats cells from the new data"""
+        from budget_app.models.transaction import Transaction
+        model = self._model(qtbot)
+        assert model.data(model.index(0, 1)) == "03/04/2026"
+        trans = Transaction(id=2, date='2026-05-06', description='Tea',
+                            amount=-3.0, payment_method='C')
+        model.set_ledger([trans], [(984.5,)], [0.0], [])
+        assert model.data(model.index(0, 1)) == "05/06/2026"
+        assert model.data(model.index(0, 5)) == "$984.50"
+
+    def test_snapshots_stored_as_2d_array(self, qtbot):
+        """set_ledger accepts row tuples and keeps a (rows, slots) array"""
+        model = self._model(qtbot)
+        assert model._snapshots.shape == (1, 1)
+        model.set_ledger([], [], [], [1000.0, 500.0])
+        assert model._snapshots.shape == (0, 3)
+        assert model.rowCount() == 0
+
+    def test_avail_and_utilization_precomputed(self, qtbot):
+        """Avail per card and utilization per row are computed in set_ledger"""
+        from budget_app.models.transaction import Transaction
+        from budget_app.views.transactions_model import TransactionsTableModel
+        model = TransactionsTableModel()
+        model.set_columns(["\u2713", "Date", "Pay Type", "Description", "Amount",
+                           "Chase Balance", "A Owed", "A Avail", "B Owed", "B Avail",
+                           "CC Utilization"])
+        trans = Transaction(id=1, date='2026-03-04', description='X',
+                            amount=-1.0, payment_method='C')
+        model.set_ledger([trans], [(100.0, 900.0, 50.0)], [950.0], [1000.0, 1000.0])
+        assert model._avail.tolist() == [[100.0, 950.0]]
+        assert model._util.tolist() == [0.475]
+        assert model.data(model.index(0, 7)) == "$100.00"
+        assert model.data(model.index(0, 9)) == "$950.00"
+        assert model.data(model.index(0, 10)) == "47.5%"
+        assert model.data(model.index(0, 6), Qt.ItemDataRole.ForegroundRole) is not None
+
+    def test_card_columns_resolved_per_layout(self, qtbot):
+        """Card Owed/Avail columns map to their card slot once per set_columns"""
+        from budget_app.views.transactions_model import TransactionsTableModel
+        model = TransactionsTableModel()
+        model.set_columns(["\u2713", "Date", "Pay Type", "Description", "Amount",
+                           "Chase Balance", "A Owed", "A Avail", "B Owed", "B Avail",
+                           "CC Utilization"])
+        assert model._card_columns == {6: (0, 0), 7: (0, 1), 8: (1, 0), 9: (1, 1)}
+        assert model._owed_columns.tolist() == [6, 8]
+        assert model._util_column == 10
+
+    def test_card_colors_use_each_cards_limit(self, qtbot):
+        """Owed/avail thresholds are applied per card across all card columns"""
+        from budget_app.models.transaction import Transaction
+        from budget_app.views import transactions_model as module
+        model = module.TransactionsTableModel()
+        model.set_columns(["\u2713", "Date", "Pay Type", "Description", "Amount",
+                           "Chase Balance", "A Owed", "A Avail", "B Owed", "B Avail",
+                           "CC Utilization"])
+        trans = Transaction(id=1, date='2026-03-04', description='X',
+                            amount=-1.0, payment_method='C')
+        # A: 850 of 1000 owed (over 80%, avail 150); B: 950 of 900 owed (over limit)
+        model.set_ledger([trans], [(1000.0, 850.0, 950.0)], [0.0], [1000.0, 900.0])
+        assert model._colors[0, 6:10].tolist() == [
+            module.FG_ORANGE, module.FG_NONE, module.FG_RED, module.FG_RED]
+
+    def test_foreground_reuses_shared_colors(self, qtbot):
+        """Foreground colors are the module-level QColor instances"""
+        from budget_app.views import transactions_model as module
+        model = self._model(qtbot)
+        assert model.data(model.index(0, 4), Qt.ItemDataRole.ForegroundRole) is module.RED
+        assert model.data(model.index(0, 4), Qt.ItemDataRole.ForegroundRole) is module.RED
+        model = self._model(qtbot, amount=5.0)
+        assert model.data(model.index(0, 4), Qt.ItemDataRole.ForegroundRole) is module.GREEN
+
+    def test_color_codes_computed_per_load(self, qtbot):
+        """set_ledger codes every cell's color up front, one row per transaction"""
+        from budget_app.models.transaction import Transaction
+        from budget_app.views import transactions_model as module
+        model = module.TransactionsTableModel()
+        model.set_columns(["✓", "Date", "Pay Type", "Description", "Amount",
+                           "Chase Balance", "A Owed", "A Avail", "CC Utilization"])
+        rows = [
+            Transaction(id=1, date='2026-03-04', description='Rent', amount=-900.0,
+                        payment_method='C', recurring_charge_id=7),
+            Transaction(id=2, date='2026-03-05', description='Gear', amount=-950.0,
+                        payment_method='A'),
+        ]
+        model.set_ledger(rows, [(100.0, 850.0), (-50.0, 1050.0)], [600.0, 1050.0], [1000.0])
+        assert model._colors.tolist() == [
+            [0, 0, 0, module.FG_BLUE, module.FG_RED, module.FG_ORANGE,
+             module.FG_ORANGE, 0, module.FG_ORANGE],
+            [0, 0, 0, 0, module.FG_RED, module.FG_RED,
+             module.FG_RED, module.FG_RED, module.FG_RED],
+        ]
+        assert model.data(model.index(1, 8), Qt.ItemDataRole.ForegroundRole) is module.RED
+        assert model.data(model.index(0, 7), Qt.ItemDataRole.ForegroundRole) is None
+
+    def test_foreground_served_from_plain_lists(self, qtbot):
+        """Paint-time color lookups index Python lists, not the numpy array"""
+        model = self._model(qtbot)
+        assert model._color_rows == model._colors.tolist()
+        model._colors = None  # data() must not need the array
+        assert model.data(model.index(0, 4), Qt.ItemDataRole.ForegroundRole) is not None
+
+    def test_row_mask_combines_filters(self, qtbot):
+        """row_mask applies pay type, description, range and sign together"""
+        from budget_app.models.transaction import Transaction
+        from budget_app.views.transactions_model import TransactionsTableModel
+        model = TransactionsTableModel()
+        rows = [
+            Transaction(id=1, date='2026-01-01', description='Paycheck',
+                        amount=2000.0, payment_method='C'),
+            Transaction(id=2, date='2026-01-02', description='Groceries',
+                        amount=-80.0, payment_method='CH'),
+            Transaction(id=3, date='2026-01-03', description='Grocery Outlet',
+                        amount=-20.0, payment_method='C'),
+        ]
+        model.set_ledger(rows, [(0.0,)] * 3, [0.0] * 3, [])
+        assert model.row_mask().tolist() == [True, True, True]
+        assert model.row_mask(pay_types={'C'}).tolist() == [True, False, True]
+        assert model.row_mask(desc_filter='grocer').tolist() == [False, True, True]
+        assert model.row_mask(amount_min=-50, amount_max=100).tolist() == [False, False, True]
+        assert model.row_mask(sign_filter=1).tolist() == [True, False, False]
+        assert model.row_mask({'C'}, 'grocer', sign_filter=2).tolist() == [False, False, True]
+
+
+class TestSetPosted:
+    """Tests for posting/unposting via the checkbox column"""
 
     def _make_view(self, qtbot):
         """Helper to create a TransactionsView with a wide date range"""
@@ -999,122 +1567,134 @@ class TestOnItemChanged:
         view.to_date.setDate(QDate.fromString("2026-12-31", "yyyy-MM-dd"))
         return view
 
+    def _set_check(self, view, row, state):
+        model = view.model
+        return model.setData(model.index(row, 0), state, Qt.ItemDataRole.CheckStateRole)
+
+    def _first_unposted_row(self, view):
+        for row in range(view.model.rowCount()):
+            if _cell(view, row, 0, Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Unchecked:
+                return row
+        pytest.fail("No unposted transaction found in table")
+
     def test_non_checkbox_column_ignored(self, qtbot, temp_db, sample_account, sample_card, sample_transactions):
-        """Changing a non-checkbox column (column != 0) should do nothing"""
+        """setData on a non-checkbox column should be rejected and change nothing"""
         from budget_app.models.transaction import Transaction
         view = self._make_view(qtbot)
         view.refresh()
-        # Get a description item (column 3) and call _on_item_changed
-        item = view.table.item(0, 3)
-        assert item is not None
-        # Capture state before
-        trans_id = item.data(Qt.ItemDataRole.UserRole)
-        trans_before = Transaction.get_by_id(trans_id)
-        posted_before = trans_before.is_posted if trans_before else None
-        # Call _on_item_changed on a non-checkbox column - should be a no-op
-        view._on_item_changed(item)
-        # Verify nothing changed
-        if trans_before:
-            trans_after = Transaction.get_by_id(trans_id)
-            assert trans_after.is_posted == posted_before
-
-    def test_checkbox_no_trans_id_ignored(self, qtbot, temp_db):
-        """If checkbox item has no UserRole data, should be ignored"""
-        from budget_app.views.transactions_view import TransactionsView
-        from PyQt6.QtWidgets import QTableWidgetItem
-        view = TransactionsView()
-        qtbot.addWidget(view)
-        # Manually add a row with no UserRole data on the checkbox item
-        view.table.setRowCount(1)
-        item = QTableWidgetItem()
-        item.setData(Qt.ItemDataRole.UserRole, None)
-        item.setCheckState(Qt.CheckState.Checked)
-        view.table.setItem(0, 0, item)
-        # Should not crash or raise any errors
-        view._on_item_changed(view.table.item(0, 0))
+        trans_id = _cell(view, 0, 3, Qt.ItemDataRole.UserRole)
+        posted_before = Transaction.get_by_id(trans_id).is_posted
+        model = view.model
+        assert not model.setData(model.index(0, 3), Qt.CheckState.Checked,
+                                 Qt.ItemDataRole.CheckStateRole)
+        assert Transaction.get_by_id(trans_id).is_posted == posted_before
 
     def test_posting_transaction_via_checkbox(self, qtbot, temp_db, sample_account, sample_card, sample_transactions):
         """Checking the checkbox should mark transaction as posted and update balances"""
         from budget_app.models.transaction import Transaction
         view = self._make_view(qtbot)
         view.refresh()
-        # Find an unposted transaction row and check its checkbox
-        for row in range(view.table.rowCount()):
-            checkbox = view.table.item(row, 0)
-            if checkbox and checkbox.checkState() == Qt.CheckState.Unchecked:
-                trans_id = checkbox.data(Qt.ItemDataRole.UserRole)
-                if trans_id:
-                    # Block signals so we can manually trigger
-                    view.table.blockSignals(True)
-                    checkbox.setCheckState(Qt.CheckState.Checked)
-                    view.table.blockSignals(False)
-                    view._on_item_changed(checkbox)
-                    # Verify the transaction is now posted
-                    trans = Transaction.get_by_id(trans_id)
-                    assert trans.is_posted is True
-                    assert trans.posted_date is not None
-                    break
-        else:
-            pytest.fail("No unposted transaction found in table")
+        row = self._first_unposted_row(view)
+        trans_id = view.model.transaction_id(row)
+        assert self._set_check(view, row, Qt.CheckState.Checked)
+        trans = Transaction.get_by_id(trans_id)
+        assert trans.is_posted is True
+        assert trans.posted_date is not None
 
     def test_unposting_transaction_via_checkbox(self, qtbot, temp_db, sample_account, sample_card, sample_transactions):
         """Unchecking the checkbox should unpost and reverse balances"""
         from budget_app.models.transaction import Transaction
         view = self._make_view(qtbot)
         view.refresh()
-        # Find an unposted transaction, post it, then unpost it
-        for row in range(view.table.rowCount()):
-            checkbox = view.table.item(row, 0)
-            if checkbox and checkbox.checkState() == Qt.CheckState.Unchecked:
-                trans_id = checkbox.data(Qt.ItemDataRole.UserRole)
-                if trans_id:
-                    # Post it first
-                    view.table.blockSignals(True)
-                    checkbox.setCheckState(Qt.CheckState.Checked)
-                    view.table.blockSignals(False)
-                    view._on_item_changed(checkbox)
-                    trans = Transaction.get_by_id(trans_id)
-                    assert trans.is_posted is True
-                    # Now unpost it
-                    view.table.blockSignals(True)
-                    checkbox.setCheckState(Qt.CheckState.Unchecked)
-                    view.table.blockSignals(False)
-                    view._on_item_changed(checkbox)
-                    trans = Transaction.get_by_id(trans_id)
-                    assert trans.is_posted is False
-                    assert trans.posted_date is None
-                    break
-        else:
-            pytest.fail("No unposted transaction found in table")
+        row = self._first_unposted_row(view)
+        trans_id = view.model.transaction_id(row)
+        self._set_check(view, row, Qt.CheckState.Checked)
+        assert Transaction.get_by_id(trans_id).is_posted is True
+        self._set_check(view, row, Qt.CheckState.Unchecked)
+        trans = Transaction.get_by_id(trans_id)
+        assert trans.is_posted is False
+        assert trans.posted_date is None
 
     def test_posting_already_posted_is_noop(self, qtbot, temp_db, sample_account, sample_card, sample_transactions):
         """If transaction is already posted and checkbox is checked, no DB change occurs"""
-        from budget_app.models.transaction import Transaction
         from budget_app.models.account import Account
         view = self._make_view(qtbot)
         view.refresh()
-        # Find an unposted transaction and post it via checkbox
-        for row in range(view.table.rowCount()):
-            checkbox = view.table.item(row, 0)
-            if checkbox and checkbox.checkState() == Qt.CheckState.Unchecked:
-                trans_id = checkbox.data(Qt.ItemDataRole.UserRole)
-                if trans_id:
-                    # Post it
-                    view.table.blockSignals(True)
-                    checkbox.setCheckState(Qt.CheckState.Checked)
-                    view.table.blockSignals(False)
-                    view._on_item_changed(checkbox)
-                    # Record the account balance after posting
-                    account = Account.get_by_code('C')
-                    balance_after_post = account.current_balance
-                    # Call _on_item_changed again with same Checked state
-                    # The transaction is already posted, so is_posted == is_posted, should be a no-op
-                    view._on_item_changed(checkbox)
-                    account = Account.get_by_code('C')
-                    assert account.current_balance == balance_after_post
-                    break
-        else:
-            pytest.fail("No unposted transaction found in table")
+        row = self._first_unposted_row(view)
+        self._set_check(view, row, Qt.CheckState.Checked)
+        balance_after_post = Account.get_by_code('C').current_balance
+        # The row is already checked, so checking it again changes nothing
+        assert not self._set_check(view, row, Qt.CheckState.Checked)
+        assert Account.get_by_code('C').current_balance == balance_after_post
+
+    def test_toggle_skips_transaction_lookup(self, qtbot, temp_db, sample_account, sample_card, sample_transactions):
+        """A checkbox toggle saves the model's row object without re-fetching it"""
+        from unittest.mock import patch
+        from budget_app.models.transaction import Transaction
+        view = self._make_view(qtbot)
+        view.refresh()
+        row = self._first_unposted_row(view)
+        trans_id = view.model.transaction_id(row)
+        with patch.object(Transaction, 'get_by_id') as mock_get:
+            assert self._set_check(view, row, Qt.CheckState.Checked)
+            mock_get.assert_not_called()
+        assert Transaction.get_by_id(trans_id).is_posted is True
+
+    def test_check_updates_model_state(self, qtbot, temp_db, sample_account, sample_card, sample_transactions):
+        """The model reports the new check state after setData"""
+        view = self._make_view(qtbot)
+        view.refresh()
+        row = self._first_unposted_row(view)
+        self._set_check(view, row, Qt.CheckState.Checked)
+        assert _cell(view, row, 0, Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked
+
+    def test_toggle_emits_posted_toggled_once(self, qtbot, temp_db, sample_account, sample_card, sample_transactions):
+        """A checkbox toggle emits one posted_toggled with the row's transaction"""
+        view = self._make_view(qtbot)
+        view.refresh()
+        row = self._first_unposted_row(view)
+        trans_id = view.model.transaction_id(row)
+        received = []
+        view.model.posted_toggled.connect(lambda trans, posted: received.append((trans.id, posted)))
+        self._set_check(view, row, Qt.CheckState.Checked)
+        # Setting the same state again is not a change
+        self._set_check(view, row, Qt.CheckState.Checked)
+        assert received == [(trans_id, True)]
+
+    def test_reload_emits_no_toggles(self, qtbot, temp_db, sample_account, sample_card, sample_transactions):
+        """Repopulating the ledger is a model reset, not per-row toggles"""
+        view = self._make_view(qtbot)
+        received = []
+        view.model.posted_toggled.connect(lambda trans, posted: received.append(trans.id))
+        view.refresh()
+        view.mark_dirty()
+        view.refresh()
+        assert received == []
+
+    def test_check_survives_render_only_refresh(self, qtbot, temp_db, sample_account, sample_card, sample_transactions):
+        """A checked row stays checked when the ledger is re-rendered from cache"""
+        view = self._make_view(qtbot)
+        view.refresh()
+        row = self._first_unposted_row(view)
+        trans_id = view.model.transaction_id(row)
+        self._set_check(view, row, Qt.CheckState.Checked)
+        view._render_dirty = True
+        view.refresh()
+        row = next(r for r in range(view.model.rowCount())
+                   if view.model.transaction_id(r) == trans_id)
+        assert _cell(view, row, 0, Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked
+
+    def test_set_posted_repaints_only_checkbox_cell(self, qtbot, temp_db, sample_account, sample_card, sample_transactions):
+        """model.set_posted emits dataChanged for the one checkbox cell"""
+        view = self._make_view(qtbot)
+        view.refresh()
+        row = self._first_unposted_row(view)
+        changes = []
+        view.model.dataChanged.connect(
+            lambda tl, br, roles: changes.append((tl.row(), tl.column(), br.row(), br.column())))
+        assert view.model.set_posted(row, True)
+        assert not view.model.set_posted(row, True)
+        assert changes == [(row, 0, row, 0)]
 
 
 class TestTransactionCrudNoSelection:
@@ -1216,6 +1796,33 @@ class TestSortCCColumns:
         balances = [c.current_balance for c in view._cards]
         assert balances == sorted(balances, reverse=True)
 
+    def test_rebuild_saves_widths_once(self, qtbot, temp_db, multiple_cards):
+        """Header resize signals are blocked during the rebuild; one save follows"""
+        from unittest.mock import patch
+        from budget_app.views.transactions_view import TransactionsView
+        view = TransactionsView()
+        qtbot.addWidget(view)
+        view._first_load = False
+        with patch.object(view._save_widths_timer, 'start') as mock_start:
+            view._rebuild_columns_with_sorted_cards()
+            mock_start.assert_called_once()
+        assert not view.table.horizontalHeader().signalsBlocked()
+        assert view.table.updatesEnabled()
+
+    def test_sort_same_order_skips_rebuild(self, qtbot, temp_db, multiple_cards):
+        """Sorting into the order already shown does no column or data work"""
+        from unittest.mock import patch
+        from budget_app.views.transactions_view import TransactionsView
+        view = TransactionsView()
+        qtbot.addWidget(view)
+        view._first_load = False
+        view._sort_cc_columns(descending=True)
+        with patch.object(view, '_rebuild_columns_with_sorted_cards') as mock_rebuild, \
+                patch.object(view, 'refresh') as mock_refresh:
+            view._sort_cc_columns(descending=True)
+            mock_rebuild.assert_not_called()
+            mock_refresh.assert_not_called()
+
     def test_sort_ascending_reorders_by_balance(self, qtbot, temp_db, multiple_cards):
         """Sort ascending: cards reordered by balance low→high"""
         from budget_app.views.transactions_view import TransactionsView
@@ -1233,29 +1840,603 @@ class TestSortCCColumns:
         qtbot.addWidget(view)
         view._first_load = False
         view._sort_cc_columns(descending=True)
-        headers = [view.table.horizontalHeaderItem(i).text()
-                   for i in range(view.table.columnCount())]
+        headers = [_header(view, i)
+                   for i in range(view.model.columnCount())]
         # First card column after base (6) should be highest-balance card
         sorted_cards = sorted(multiple_cards, key=lambda c: c.current_balance, reverse=True)
         expected_first_owed = f"{sorted_cards[0].name} Owed"
         assert headers[6] == expected_first_owed
 
-    def test_rebuild_preserves_visibility(self, qtbot, temp_db, multiple_cards):
-        """_rebuild_columns_with_sorted_cards preserves hidden column settings"""
+    def test_rebuild_preserves_visibility(self, qtbot, temp_db, multiple_cards):
+        """_rebuild_columns_with_sorted_cards preserves hidden column settings"""
+        from budget_app.views.transactions_view import TransactionsView
+        from PyQt6.QtCore import QSettings
+        view = TransactionsView()
+        qtbot.addWidget(view)
+        view._first_load = False
+        # Hide a specific column
+        view._show_all_columns()
+        settings = QSettings("BudgetApp", "PersonalBudgetManager")
+        settings.setValue("transactions/hidden_columns", ["Amex Blue Owed"])
+        # Rebuild
+        view._rebuild_columns_with_sorted_cards()
+        # The "Amex Blue Owed" column should still be hidden
+        idx = view._all_columns.index("Amex Blue Owed")
+        assert view.table.isColumnHidden(idx) is True
+
+
+class TestBackgroundRefresh:
+    """Tests for computing balances on a RefreshWorker thread"""
+
+    def _make_view(self, qtbot):
+        from budget_app.views.transactions_view import TransactionsView
+        from PyQt6.QtCore import QDate
+        view = TransactionsView()
+        qtbot.addWidget(view)
+        view._first_load = False
+        view.from_date.setDate(QDate.fromString("2026-01-01", "yyyy-MM-dd"))
+        view.to_date.setDate(QDate.fromString("2026-12-31", "yyyy-MM-dd"))
+        return view
+
+    def _add_transactions(self):
+        from budget_app.models.transaction import Transaction
+        Transaction(id=None, date='2026-02-01', description='Paycheck',
+                    amount=1000.0, payment_method='C').save()
+        Transaction(id=None, date='2026-02-02', description='Rent',
+                    amount=-1500.0, payment_method='C').save()
+
+    def test_dates_displayed_as_mm_dd_yyyy(self, qtbot, temp_db, sample_account):
+        """ISO dates (with or without a time part) display as MM/DD/YYYY"""
+        from budget_app.models.transaction import Transaction
+        self._add_transactions()
+        Transaction(id=None, date='2026-02-05 23:59:59', description='LDBPD',
+                    amount=0, payment_method='C').save()
+        view = self._make_view(qtbot)
+        view.refresh()
+        dates = [_cell(view, r, 1) for r in range(view.model.rowCount())]
+        assert dates == ["02/01/2026", "02/02/2026", "02/05/2026"]
+
+    def test_small_ledger_populates_synchronously(self, qtbot, temp_db, sample_account):
+        """Below the threshold the table is filled before refresh() returns"""
+        self._add_transactions()
+        view = self._make_view(qtbot)
+        view.refresh()
+        assert view.model.rowCount() == 2
+        assert view._refresh_workers == {}
+
+    def test_refresh_does_not_pump_event_loop(self, qtbot, temp_db, sample_account):
+        """refresh() never re-enters the event loop via processEvents()"""
+        from unittest.mock import patch
+        from PyQt6.QtWidgets import QApplication
+        self._add_transactions()
+        view = self._make_view(qtbot)
+        with patch.object(QApplication, 'processEvents') as mock_process:
+            view.refresh()
+            mock_process.assert_not_called()
+        assert view.model.rowCount() == 2
+
+    def test_small_ledger_never_shows_progress_bar(self, qtbot, temp_db, sample_account):
+        """A synchronous refresh does not toggle the progress bar"""
+        from unittest.mock import call, patch
+        self._add_transactions()
+        view = self._make_view(qtbot)
+        with patch.object(view.progress_bar, 'setVisible') as mock_visible:
+            view.refresh()
+        assert call(True) not in mock_visible.call_args_list
+        assert view.model.rowCount() == 2
+
+    def test_worker_reports_progress(self, qtbot, temp_db, sample_account):
+        """RefreshWorker emits progress for its generation before finishing"""
+        from budget_app.views.transactions_view import RefreshWorker
+        self._add_transactions()
+        view = self._make_view(qtbot)
+        ledger = view._load_ledger("2026-01-01", "2026-12-31")
+        worker = RefreshWorker(7, ledger)
+        events = []
+        worker.progress.connect(lambda gen, pct: events.append(('progress', gen, pct)))
+        worker.finished.connect(lambda gen, result: events.append(('finished', gen)))
+        worker.run()  # Run inline; direct connections deliver immediately
+        assert events == [('progress', 7, 25), ('progress', 7, 75), ('finished', 7)]
+
+    def test_worker_builds_filter_arrays(self, qtbot, temp_db, sample_account):
+        """RefreshWorker hands back the filter arrays along with the balances"""
+        from budget_app.views.transactions_view import RefreshWorker
+        self._add_transactions()
+        view = self._make_view(qtbot)
+        ledger = view._load_ledger("2026-01-01", "2026-12-31")
+        worker = RefreshWorker(1, ledger)
+        results = []
+        worker.finished.connect(lambda gen, result: results.append(result))
+        worker.run()
+        snapshots, totals, (amounts, methods, descs) = results[0]
+        assert list(amounts) == [1000.0, -1500.0]
+        assert list(methods) == ['C', 'C']
+        assert list(descs) == ['paycheck', 'rent']
+
+    def test_interrupted_worker_skips_work(self, qtbot, temp_db, sample_account):
+        """A worker asked to stop finishes with no result and computes nothing"""
+        from unittest.mock import patch
+        from budget_app.views import transactions_view
+        from budget_app.views.transactions_view import RefreshWorker
+        self._add_transactions()
+        view = self._make_view(qtbot)
+        ledger = view._load_ledger("2026-01-01", "2026-12-31")
+        worker = RefreshWorker(1, ledger)
+        results = []
+        worker.finished.connect(lambda gen, result: results.append(result))
+        worker.cancel()
+        with patch.object(transactions_view, 'compute_ledger_balances') as mock_compute:
+            worker.run()
+            mock_compute.assert_not_called()
+        assert results == [None]
+
+    def test_new_refresh_interrupts_running_worker(self, qtbot, temp_db, sample_account, monkeypatch):
+        """Starting a refresh asks the superseded worker to stop"""
+        from budget_app.views import transactions_view
+        monkeypatch.setattr(transactions_view, 'ASYNC_REFRESH_THRESHOLD', 0)
+        self._add_transactions()
+        view = self._make_view(qtbot)
+
+        view.refresh()
+        first = view._refresh_workers[1]
+        view.mark_dirty()
+        view.refresh()
+        assert first.cancelled
+        assert not view._refresh_workers[2].cancelled
+
+        qtbot.waitUntil(lambda: not view._refresh_workers, timeout=5000)
+        assert view.model.rowCount() == 2
+        assert view._loading is False
+
+    def test_stale_progress_ignored(self, qtbot, temp_db):
+        """Progress from a superseded worker does not move the bar"""
+        view = self._make_view(qtbot)
+        view._refresh_generation = 3
+        view.progress_bar.setValue(10)
+        view._on_refresh_progress(2, 75)
+        assert view.progress_bar.value() == 10
+        view._on_refresh_progress(3, 75)
+        assert view.progress_bar.value() == 75
+
+    def test_large_ledger_uses_worker(self, qtbot, temp_db, sample_account, monkeypatch):
+        """At or above the threshold balances are computed on a worker thread"""
+        from budget_app.views import transactions_view
+        monkeypatch.setattr(transactions_view, 'ASYNC_REFRESH_THRESHOLD', 0)
+        self._add_transactions()
+        view = self._make_view(qtbot)
+
+        view.refresh()
+        assert len(view._refresh_workers) == 1
+
+        assert view.progress_bar.isVisibleTo(view)
+
+        qtbot.waitUntil(lambda: not view._refresh_workers, timeout=5000)
+        assert not view.progress_bar.isVisibleTo(view)
+        assert view.model.rowCount() == 2
+        # 5000 + 1000 - 1500
+        assert _cell(view, 1, 5) == "$4,500.00"
+        assert view._loading is False
+
+    def test_stale_worker_result_ignored(self, qtbot, temp_db, sample_account, monkeypatch):
+        """A result from a superseded refresh does not overwrite the table"""
+        from budget_app.views import transactions_view
+        monkeypatch.setattr(transactions_view, 'ASYNC_REFRESH_THRESHOLD', 0)
+        self._add_transactions()
+        view = self._make_view(qtbot)
+
+        view.refresh()
+        view.mark_dirty()
+        view.refresh()
+
+        qtbot.waitUntil(lambda: not view._refresh_workers, timeout=5000)
+        assert view._refresh_generation == 2
+        assert view.model.rowCount() == 2
+        assert view._loading is False
+
+
+class TestLedgerCache:
+    """Tests for reusing fetched ledger data across re-renders"""
+
+    def _make_view(self, qtbot):
+        from budget_app.views.transactions_view import TransactionsView
+        from PyQt6.QtCore import QDate
+        view = TransactionsView()
+        qtbot.addWidget(view)
+        view._first_load = False
+        view.from_date.setDate(QDate.fromString("2026-01-01", "yyyy-MM-dd"))
+        view.to_date.setDate(QDate.fromString("2026-12-31", "yyyy-MM-dd"))
+        return view
+
+    def test_sort_repopulates_without_query(self, qtbot, temp_db, sample_account, multiple_cards):
+        """Sorting card columns re-renders from cached rows, no SQL"""
+        from unittest.mock import patch
+        from budget_app.models.transaction import Transaction
+        Transaction(id=None, date='2026-03-01', description='Gas',
+                    amount=-40.0, payment_method='AM').save()
+        view = self._make_view(qtbot)
+        view.refresh()
+
+        with patch.object(Transaction, 'get_by_date_range') as mock_fetch:
+            view._sort_cc_columns(descending=False)
+            mock_fetch.assert_not_called()
+
+        # Amex Blue (4500 owed + 40) is still shown under its own column
+        owed_col = view._all_columns.index("Amex Blue Owed")
+        assert _cell(view, 0, owed_col) == "$4,540.00"
+
+    def test_mark_dirty_drops_cache(self, qtbot, temp_db, sample_account):
+        """mark_dirty() forces the next refresh to query again"""
+        from unittest.mock import patch
+        from budget_app.models.transaction import Transaction
+        view = self._make_view(qtbot)
+        view.refresh()
+        assert view._ledger_cache is not None
+
+        view.mark_dirty()
+        assert view._ledger_cache is None
+        with patch.object(Transaction, 'get_by_date_range', return_value=[]) as mock_fetch:
+            view.refresh()
+            mock_fetch.assert_called_once()
+
+    def test_rerender_reuses_computed_balances(self, qtbot, temp_db, sample_account):
+        """Re-rendering unchanged rows skips the balance computation"""
+        from unittest.mock import patch
+        from budget_app.models.transaction import Transaction
+        from budget_app.views import transactions_view
+        Transaction(id=None, date='2026-03-01', description='Rent',
+                    amount=-500.0, payment_method='C').save()
+        view = self._make_view(qtbot)
+        view.refresh()
+
+        view._render_dirty = True
+        with patch.object(transactions_view, 'compute_ledger_balances',
+                          wraps=transactions_view.compute_ledger_balances) as mock_compute:
+            view.refresh()
+            mock_compute.assert_not_called()
+        assert _cell(view, 0, 3) == "Rent"
+
+        view.mark_dirty()
+        with patch.object(transactions_view, 'compute_ledger_balances',
+                          wraps=transactions_view.compute_ledger_balances) as mock_compute:
+            view.refresh()
+            mock_compute.assert_called_once()
+
+    def _accept_dialog(self, trans):
+        """Patch TransactionDialog to accept with the given transaction"""
+        from unittest.mock import patch, MagicMock
+        dialog = MagicMock()
+        dialog.exec.return_value = 1  # Accepted
+        dialog.get_transaction.return_value = trans
+        return patch('budget_app.views.transactions_view.TransactionDialog',
+                     return_value=dialog)
+
+    def test_add_patches_rows_without_query(self, qtbot, temp_db, sample_account, sample_card, sample_transactions):
+        """An added row is inserted in ledger order instead of re-querying"""
+        from unittest.mock import patch
+        from budget_app.models.transaction import Transaction
+        view = self._make_view(qtbot)
+        view.refresh()
+        ensure_columns = view._ensure_columns
+
+        new = Transaction(id=None, date='2026-02-05', description='Coffee',
+                          amount=-5.0, payment_method='C')
+        with self._accept_dialog(new), \
+                patch.object(Transaction, 'get_by_date_range') as mock_fetch, \
+                patch.object(view, '_ensure_columns', wraps=ensure_columns) as mock_cols:
+            view._add_transaction()
+            view.refresh()
+            mock_fetch.assert_not_called()
+            mock_cols.assert_not_called()
+
+        # Same order as the query: date, then larger amount first, then id
+        assert [_cell(view, r, 3) for r in range(4)] == \
+            ['Paycheck', 'Coffee', 'Groceries', 'Netflix']
+        assert view._ledger_cache['transactions'] == \
+            Transaction.get_by_date_range('2026-01-01', '2026-12-31', posted=False)
+
+    def test_add_outside_range_or_posted_not_shown(self, qtbot, temp_db, sample_account):
+        """Rows the range query would not return are not inserted"""
+        from budget_app.models.transaction import Transaction
+        view = self._make_view(qtbot)
+        view.refresh()
+        for trans in (Transaction(id=None, date='2027-01-05', description='Later',
+                                  amount=-5.0, payment_method='C'),
+                      Transaction(id=None, date='2026-03-05', description='Done',
+                                  amount=-5.0, payment_method='C', is_posted=True)):
+            with self._accept_dialog(trans):
+                view._add_transaction()
+        view.refresh()
+        assert view.model.rowCount() == 0
+
+    def test_edit_moves_row_and_recomputes(self, qtbot, temp_db, sample_account, sample_card, sample_transactions):
+        """An edit replaces the row at its new position with fresh balances"""
+        from unittest.mock import patch
+        from budget_app.models.transaction import Transaction
+        view = self._make_view(qtbot)
+        view.refresh()
+        view.table.selectRow(0)  # Paycheck, 2026-02-01
+
+        updated = Transaction(id=None, date='2026-03-01', description='Paycheck',
+                              amount=2500.0, payment_method='C')
+        with self._accept_dialog(updated), \
+                patch.object(Transaction, 'get_by_date_range') as mock_fetch:
+            view._edit_transaction()
+            view.refresh()
+            mock_fetch.assert_not_called()
+
+        assert [_cell(view, r, 3) for r in range(3)] == ['Groceries', 'Netflix', 'Paycheck']
+        fresh = self._make_view(qtbot)
+        fresh.refresh()
+        assert [_cell(view, r, 5) for r in range(3)] == [_cell(fresh, r, 5) for r in range(3)]
+
+    def test_delete_patches_rows_without_query(self, qtbot, temp_db, sample_account, sample_card, sample_transactions, mock_qmessagebox):
+        """Deleted rows are dropped from the cached ledger"""
+        from unittest.mock import patch
+        from budget_app.models.transaction import Transaction
+        from PyQt6.QtWidgets import QMessageBox
+        mock_qmessagebox.last_return = QMessageBox.StandardButton.Yes
+        view = self._make_view(qtbot)
+        view.refresh()
+        view.table.selectRow(1)  # Groceries
+
+        with patch.object(Transaction, 'get_by_date_range') as mock_fetch:
+            view._delete_transaction()
+            view.refresh()
+            mock_fetch.assert_not_called()
+        assert [_cell(view, r, 3) for r in range(view.model.rowCount())] == ['Paycheck', 'Netflix']
+
+    def test_add_after_posting_matches_full_reload(self, qtbot, temp_db, sample_account):
+        """Adding after a checkbox posting shows what a full reload would"""
+        from budget_app.models.transaction import Transaction
+        Transaction(id=None, date='2026-03-01', description='Rent',
+                    amount=-100.0, payment_method='C').save()
+        Transaction(id=None, date='2026-03-02', description='Food',
+                    amount=-50.0, payment_method='C').save()
+        view = self._make_view(qtbot)
+        view.refresh()
+        model = view.model
+        rent = next(r for r in range(model.rowCount()) if _cell(view, r, 3) == 'Rent')
+        model.setData(model.index(rent, 0), Qt.CheckState.Checked, Qt.ItemDataRole.CheckStateRole)
+
+        new = Transaction(id=None, date='2026-03-03', description='Coffee',
+                          amount=-5.0, payment_method='C')
+        with self._accept_dialog(new):
+            view._add_transaction()
+        view.refresh()
+
+        rows = {_cell(view, r, 3): _cell(view, r, 5) for r in range(model.rowCount())}
+        assert view.chase_summary.text() == "Chase: $4,845.00"
+        view.mark_dirty()
+        view.refresh()
+        assert view.chase_summary.text() == "Chase: $4,845.00"
+        assert rows == {_cell(view, r, 3): _cell(view, r, 5) for r in range(model.rowCount())}
+        assert 'Rent' not in rows
+
+    def test_edit_after_posting_matches_full_reload(self, qtbot, temp_db, sample_account):
+        """Editing another row after a posting keeps balances and rows consistent"""
+        from budget_app.models.transaction import Transaction
+        Transaction(id=None, date='2026-03-01', description='Rent',
+                    amount=-100.0, payment_method='C').save()
+        Transaction(id=None, date='2026-03-02', description='Food',
+                    amount=-50.0, payment_method='C').save()
+        view = self._make_view(qtbot)
+        view.refresh()
+        model = view.model
+        rent = next(r for r in range(model.rowCount()) if _cell(view, r, 3) == 'Rent')
+        model.setData(model.index(rent, 0), Qt.CheckState.Checked, Qt.ItemDataRole.CheckStateRole)
+        food = next(r for r in range(model.rowCount()) if _cell(view, r, 3) == 'Food')
+        view.table.selectRow(food)
+
+        updated = Transaction(id=None, date='2026-03-02', description='Food',
+                              amount=-70.0, payment_method='C')
+        with self._accept_dialog(updated):
+            view._edit_transaction()
+        view.refresh()
+
+        rows = {_cell(view, r, 3): _cell(view, r, 5) for r in range(model.rowCount())}
+        assert rows == {'Food': "$4,830.00"}
+        view.mark_dirty()
+        view.refresh()
+        assert view.chase_summary.text() == "Chase: $4,830.00"
+        assert rows == {_cell(view, r, 3): _cell(view, r, 5) for r in range(model.rowCount())}
+
+    def test_crud_without_cache_reloads(self, qtbot, temp_db, sample_account):
+        """Before the first load there is nothing to patch; reload instead"""
+        from budget_app.models.transaction import Transaction
+        view = self._make_view(qtbot)
+        new = Transaction(id=None, date='2026-03-05', description='Coffee',
+                          amount=-5.0, payment_method='C')
+        with self._accept_dialog(new):
+            view._add_transaction()
+        assert view._data_dirty is True
+        view.refresh()
+        assert _cell(view, 0, 3) == 'Coffee'
+
+    def test_date_change_queries_new_range(self, qtbot, temp_db, sample_account):
+        """A different date range is never served from the cache"""
+        from unittest.mock import patch
+        from PyQt6.QtCore import QDate
+        from budget_app.models.transaction import Transaction
+        view = self._make_view(qtbot)
+        view.refresh()
+
+        view.to_date.setDate(QDate.fromString("2026-06-30", "yyyy-MM-dd"))
+        with patch.object(Transaction, 'get_by_date_range', return_value=[]) as mock_fetch:
+            view.refresh()
+            mock_fetch.assert_called_once_with("2026-01-01", "2026-06-30", posted=False)
+
+    def test_date_change_reuses_recurring_charges(self, qtbot, temp_db, sample_account, sample_card):
+        """Recurring charges are fetched once, not again per date range"""
+        from unittest.mock import patch
+        from PyQt6.QtCore import QDate
+        from budget_app.models.recurring_charge import RecurringCharge
+        view = self._make_view(qtbot)
+        view.refresh()
+        assert view._cc_payment_map_cache is not None
+
+        view.to_date.setDate(QDate.fromString("2026-06-30", "yyyy-MM-dd"))
+        with patch.object(RecurringCharge, 'get_all') as mock_get_all:
+            view.refresh()
+            mock_get_all.assert_not_called()
+
+    def test_invalidate_recurring_charges_drops_maps(self, qtbot, temp_db, sample_account, sample_card):
+        """A charge edit elsewhere forces the CC payment maps to be rebuilt"""
+        from unittest.mock import patch
+        from budget_app.models.recurring_charge import RecurringCharge
+        view = self._make_view(qtbot)
+        view.refresh()
+        view.invalidate_recurring_charges()
+        assert view._cc_payment_map_cache is None
+        with patch.object(RecurringCharge, 'get_all', return_value=[]) as mock_get_all:
+            view.refresh()
+            mock_get_all.assert_called_once()
+
+    def test_invalidate_cards_drops_charge_caches(self, qtbot, temp_db, sample_account):
+        """invalidate_cards() clears the cached charges and payment maps"""
+        view = self._make_view(qtbot)
+        view.refresh()
+        assert view._recurring_charges_cache is not None
+
+        view.invalidate_cards()
+        assert view._recurring_charges_cache is None
+        assert view._cc_payment_map_cache is None
+        assert view._data_dirty is True
+
+    def _post_row(self, view, description):
+        """Tick the posted checkbox of the row with this description"""
+        model = view.model
+        row = next(r for r in range(model.rowCount()) if _cell(view, r, 3) == description)
+        model.setData(model.index(row, 0), Qt.CheckState.Checked, Qt.ItemDataRole.CheckStateRole)
+
+    def _full_reload(self, qtbot):
+        """A fresh view's Chase summary and per-row Chase balances"""
+        fresh = self._make_view(qtbot)
+        fresh.refresh()
+        balances = {_cell(fresh, r, 3): _cell(fresh, r, 5) for r in range(fresh.model.rowCount())}
+        return fresh.chase_summary.text(), balances
+
+    def test_posting_refreshes_cached_starting_balances(self, qtbot, temp_db, sample_account, multiple_cards):
+        """A render after posting starts from the newly saved account balance"""
+        from budget_app.models.transaction import Transaction
+        Transaction(id=None, date='2026-03-01', description='Rent',
+                    amount=-100.0, payment_method='C').save()
+        Transaction(id=None, date='2026-03-02', description='Food',
+                    amount=-50.0, payment_method='C').save()
+        view = self._make_view(qtbot)
+        view.refresh()
+        order = [c.id for c in view._cards]
+
+        self._post_row(view, 'Rent')
+        assert view._ledger_cache['starting']['C'] == 4900.0
+
+        # A new card order recomputes balances from the cached inputs
+        view._sort_cc_columns(descending=False)
+        assert [c.id for c in view._cards] != order
+        summary, _ = self._full_reload(qtbot)
+        assert summary == "Chase: $4,850.00"
+        assert view.chase_summary.text() == summary
+
+    def _ledger_with_two_rows(self, qtbot):
+        from budget_app.models.transaction import Transaction
+        Transaction(id=None, date='2026-03-01', description='Rent',
+                    amount=-100.0, payment_method='C').save()
+        Transaction(id=None, date='2026-03-02', description='Food',
+                    amount=-50.0, payment_method='C').save()
+        view = self._make_view(qtbot)
+        view.refresh()
+        return view
+
+    def test_posting_drops_balances_computed_before(self, qtbot, temp_db, sample_account, multiple_cards):
+        """Balances memoized for a card order before posting are not reused"""
+        view = self._ledger_with_two_rows(qtbot)
+        self._post_row(view, 'Food')
+
+        view._render_dirty = True  # Same card order as before the posting
+        view.refresh()
+        summary, balances = self._full_reload(qtbot)
+        rent = next(r for r in range(view.model.rowCount()) if _cell(view, r, 3) == 'Rent')
+        assert _cell(view, rent, 5) == balances['Rent'] == "$4,850.00"
+        assert view.chase_summary.text() == summary
+
+    def test_posting_updates_cached_row(self, qtbot, temp_db, sample_account, multiple_cards):
+        """A checkbox posting reaches the cached row the model shares"""
+        view = self._ledger_with_two_rows(qtbot)
+        food = next(t for t in view._ledger_cache['transactions'] if t.description == 'Food')
+        self._post_row(view, 'Food')
+        assert food.is_posted is True
+        assert food.posted_date is not None
+
+        view._sort_cc_columns(descending=False)
+        summary, balances = self._full_reload(qtbot)
+        rent = next(r for r in range(view.model.rowCount()) if _cell(view, r, 3) == 'Rent')
+        assert _cell(view, rent, 5) == balances['Rent']
+        assert view.chase_summary.text() == summary
+
+
+class TestEnsureColumns:
+    """Tests for _ensure_columns card/column syncing"""
+
+    def _make_view(self, qtbot):
         from budget_app.views.transactions_view import TransactionsView
-        from PyQt6.QtCore import QSettings
         view = TransactionsView()
         qtbot.addWidget(view)
         view._first_load = False
-        # Hide a specific column
-        view._show_all_columns()
-        settings = QSettings("BudgetApp", "PersonalBudgetManager")
-        settings.setValue("transactions/hidden_columns", ["Amex Blue Owed"])
-        # Rebuild
-        view._rebuild_columns_with_sorted_cards()
-        # The "Amex Blue Owed" column should still be hidden
-        idx = view._all_columns.index("Amex Blue Owed")
-        assert view.table.isColumnHidden(idx) is True
+        return view
+
+    def test_unchanged_cards_skip_rebuild(self, qtbot, temp_db, sample_card):
+        """Same cards -> menus are not torn down and rebuilt"""
+        from budget_app.models.credit_card import CreditCard
+        view = self._make_view(qtbot)
+        actions_before = view._pay_type_actions
+        assert view._ensure_columns(CreditCard.get_all()) is False
+        assert view._pay_type_actions is actions_before
+
+    def test_unchanged_cards_pick_up_new_data(self, qtbot, temp_db, sample_card):
+        """Same cards with edited limits -> card data is refreshed in place"""
+        from budget_app.models.credit_card import CreditCard
+        view = self._make_view(qtbot)
+        sample_card.credit_limit = 12345
+        sample_card.save()
+        view._ensure_columns(CreditCard.get_all())
+        assert view._cards[0].credit_limit == 12345
+
+    def test_new_card_adds_columns_on_refresh(self, qtbot, temp_db, sample_card):
+        """A card added after the view was built shows up on the next refresh"""
+        from budget_app.models.credit_card import CreditCard
+        view = self._make_view(qtbot)
+        assert "Amex Blue Owed" not in view._all_columns
+
+        CreditCard(id=None, pay_type_code='AM', name='Amex Blue',
+                   credit_limit=5000, current_balance=100).save()
+        view.mark_dirty()
+        view.refresh()
+
+        assert "Amex Blue Owed" in view._all_columns
+        assert "AM" in view._pay_type_actions
+        assert view.model.columnCount() == 6 + 2 * 2 + 1
+
+    def test_sorted_order_survives_refresh(self, qtbot, temp_db, multiple_cards):
+        """A user-chosen card column order is kept when cards did not change"""
+        view = self._make_view(qtbot)
+        view._sort_cc_columns(descending=False)
+        order = [c.pay_type_code for c in view._cards]
+        view.mark_dirty()
+        view.refresh()
+        assert [c.pay_type_code for c in view._cards] == order
+
+    def test_rebuild_keeps_pay_type_selection(self, qtbot, temp_db, sample_card):
+        """Deselected pay types stay deselected when the menu is rebuilt"""
+        from budget_app.models.credit_card import CreditCard
+        view = self._make_view(qtbot)
+        view._pay_type_actions['CH'].setChecked(False)
+
+        CreditCard(id=None, pay_type_code='AM', name='Amex Blue',
+                   credit_limit=5000).save()
+        assert view._ensure_columns(CreditCard.get_all()) is True
+
+        assert view._pay_type_actions['CH'].isChecked() is False
+        assert view._pay_type_actions['AM'].isChecked() is True
+        assert view.pay_type_btn.text() == "2/3 \u25bc"
 
 
 class TestRefreshCCPaymentMap:
@@ -1297,12 +2478,10 @@ class TestRefreshCCPaymentMap:
         view.refresh()
 
         # Find the row for CF Payment and check the card's Owed column
-        for row in range(view.table.rowCount()):
-            desc_item = view.table.item(row, 3)
-            if desc_item and desc_item.text() == 'CF Payment':
+        for row in range(view.model.rowCount()):
+            if _cell(view, row, 3) == 'CF Payment':
                 # Chase Freedom Owed is column 6 (base 6 + card index 0 * 2)
-                owed_item = view.table.item(row, 6)
-                owed_text = owed_item.text().replace('$', '').replace(',', '')
+                owed_text = _cell(view, row, 6).replace('$', '').replace(',', '')
                 owed_value = float(owed_text)
                 # Card started at 3000, payment of -200 reduces it: 3000 + (-200) = 2800
                 assert owed_value == 2800.0
@@ -1324,13 +2503,11 @@ class TestRefreshCCPaymentMap:
         view.refresh()
 
         # Find the row for Netflix and check the card's Owed column
-        for row in range(view.table.rowCount()):
-            desc_item = view.table.item(row, 3)
-            if desc_item and desc_item.text() == 'Netflix':
+        for row in range(view.model.rowCount()):
+            if _cell(view, row, 3) == 'Netflix':
                 # Chase Freedom Owed column
                 owed_col = view._all_columns.index("Chase Freedom Owed")
-                owed_item = view.table.item(row, owed_col)
-                owed_text = owed_item.text().replace('$', '').replace(',', '')
+                owed_text = _cell(view, row, owed_col).replace('$', '').replace(',', '')
                 owed_value = float(owed_text)
                 # Card started at 3000, charge of -15 should increase owed: 3000 - (-15) = 3015
                 assert owed_value == 3015.0
@@ -1363,12 +2540,10 @@ class TestRefreshCCPaymentMap:
         view.refresh()
 
         # Find the row and check the card's Owed column
-        for row in range(view.table.rowCount()):
-            desc_item = view.table.item(row, 3)
-            if desc_item and desc_item.text() == 'Chase Freedom':
+        for row in range(view.model.rowCount()):
+            if _cell(view, row, 3) == 'Chase Freedom':
                 owed_col = view._all_columns.index("Chase Freedom Owed")
-                owed_item = view.table.item(row, owed_col)
-                owed_text = owed_item.text().replace('$', '').replace(',', '')
+                owed_text = _cell(view, row, owed_col).replace('$', '').replace(',', '')
                 owed_value = float(owed_text)
                 # Card started at 3000, manual payment of -200 should reduce: 3000 + (-200) = 2800
                 assert owed_value == 2800.0
@@ -1415,11 +2590,9 @@ class TestRefreshCardColorThresholds:
 
         # Find the OverLimit Owed column
         owed_col = view._all_columns.index("OverLimit Owed")
-        for row in range(view.table.rowCount()):
-            item = view.table.item(row, owed_col)
-            if item:
-                assert item.foreground().color() == QColor("#f44336")
-                return
+        for row in range(view.model.rowCount()):
+            assert _cell(view, row, owed_col, Qt.ItemDataRole.ForegroundRole) == QColor("#f44336")
+            return
         pytest.fail("No row found with OverLimit Owed cell")
 
     def test_owed_over_80pct_is_orange(self, qtbot, temp_db, sample_account):
@@ -1446,11 +2619,9 @@ class TestRefreshCardColorThresholds:
         view.refresh()
 
         owed_col = view._all_columns.index("High80 Owed")
-        for row in range(view.table.rowCount()):
-            item = view.table.item(row, owed_col)
-            if item:
-                assert item.foreground().color() == QColor("#ff9800")
-                return
+        for row in range(view.model.rowCount()):
+            assert _cell(view, row, owed_col, Qt.ItemDataRole.ForegroundRole) == QColor("#ff9800")
+            return
         pytest.fail("No row found with High80 Owed cell")
 
     def test_avail_negative_is_red(self, qtbot, temp_db, sample_account):
@@ -1476,11 +2647,9 @@ class TestRefreshCardColorThresholds:
         view.refresh()
 
         avail_col = view._all_columns.index("NegAvail Avail")
-        for row in range(view.table.rowCount()):
-            item = view.table.item(row, avail_col)
-            if item:
-                assert item.foreground().color() == QColor("#f44336")
-                return
+        for row in range(view.model.rowCount()):
+            assert _cell(view, row, avail_col, Qt.ItemDataRole.ForegroundRole) == QColor("#f44336")
+            return
         pytest.fail("No row found with NegAvail Avail cell")
 
     def test_avail_under_100_is_orange(self, qtbot, temp_db, sample_account):
@@ -1507,11 +2676,9 @@ class TestRefreshCardColorThresholds:
         view.refresh()
 
         avail_col = view._all_columns.index("LowAvail Avail")
-        for row in range(view.table.rowCount()):
-            item = view.table.item(row, avail_col)
-            if item:
-                assert item.foreground().color() == QColor("#ff9800")
-                return
+        for row in range(view.model.rowCount()):
+            assert _cell(view, row, avail_col, Qt.ItemDataRole.ForegroundRole) == QColor("#ff9800")
+            return
         pytest.fail("No row found with LowAvail Avail cell")
 
     def test_utilization_over_80pct_is_red(self, qtbot, temp_db, sample_account):
@@ -1538,11 +2705,9 @@ class TestRefreshCardColorThresholds:
         view.refresh()
 
         util_col = view._all_columns.index("CC Utilization")
-        for row in range(view.table.rowCount()):
-            item = view.table.item(row, util_col)
-            if item:
-                assert item.foreground().color() == QColor("#f44336")
-                return
+        for row in range(view.model.rowCount()):
+            assert _cell(view, row, util_col, Qt.ItemDataRole.ForegroundRole) == QColor("#f44336")
+            return
         pytest.fail("No row found with CC Utilization cell")
 
     def test_utilization_over_50pct_is_orange(self, qtbot, temp_db, sample_account):
@@ -1569,11 +2734,9 @@ class TestRefreshCardColorThresholds:
         view.refresh()
 
         util_col = view._all_columns.index("CC Utilization")
-        for row in range(view.table.rowCount()):
-            item = view.table.item(row, util_col)
-            if item:
-                assert item.foreground().color() == QColor("#ff9800")
-                return
+        for row in range(view.model.rowCount()):
+            assert _cell(view, row, util_col, Qt.ItemDataRole.ForegroundRole) == QColor("#ff9800")
+            return
         pytest.fail("No row found with CC Utilization cell")
 
 
@@ -1614,6 +2777,20 @@ class TestRefreshSummaryColors:
 
         assert "color: #f44336" in view.total_avail_label.styleSheet()
 
+    def test_unchanged_style_not_reapplied(self, qtbot, temp_db, sample_account):
+        """Re-rendering with the same thresholds leaves the label styles alone"""
+        from unittest.mock import patch
+        from budget_app.models.transaction import Transaction
+        Transaction(id=None, date='2026-06-01', description='Test',
+                    amount=-10.0, payment_method='C', is_posted=False).save()
+        view = self._make_view(qtbot)
+        view.refresh()
+        assert view.chase_summary.styleSheet() == "font-weight: bold; color: #4caf50;"
+        view._render_dirty = True
+        with patch.object(view.chase_summary, 'setStyleSheet') as mock_style:
+            view.refresh()
+        mock_style.assert_not_called()
+
     def test_total_cc_avail_positive_is_green(self, qtbot, temp_db, sample_account):
         """Total CC avail > 0 → green label"""
         from budget_app.models.credit_card import CreditCard
@@ -1830,7 +3007,7 @@ class TestEditTransaction:
         view.table.selectRow(0)
 
         # Capture trans_id BEFORE edit (refresh inside edit reorders rows)
-        trans_id = view.table.item(0, 3).data(Qt.ItemDataRole.UserRole)
+        trans_id = _cell(view, 0, 3, Qt.ItemDataRole.UserRole)
 
         updated_trans = Transaction(
             id=None, date='2026-06-01', description='Updated Description',
@@ -1858,7 +3035,7 @@ class TestEditTransaction:
         view.refresh()
         view.table.selectRow(0)
 
-        trans_id = view.table.item(0, 3).data(Qt.ItemDataRole.UserRole)
+        trans_id = _cell(view, 0, 3, Qt.ItemDataRole.UserRole)
         original = Transaction.get_by_id(trans_id)
         original_desc = original.description
 
@@ -1894,9 +3071,9 @@ class TestDeleteTransaction:
 
         view = self._make_view(qtbot)
         view.refresh()
-        initial_count = view.table.rowCount()
+        initial_count = view.model.rowCount()
         view.table.selectRow(0)
-        trans_id = view.table.item(0, 3).data(Qt.ItemDataRole.UserRole)
+        trans_id = _cell(view, 0, 3, Qt.ItemDataRole.UserRole)
 
         view._delete_transaction()
 
@@ -1912,13 +3089,93 @@ class TestDeleteTransaction:
         view = self._make_view(qtbot)
         view.refresh()
         view.table.selectRow(0)
-        trans_id = view.table.item(0, 3).data(Qt.ItemDataRole.UserRole)
+        trans_id = _cell(view, 0, 3, Qt.ItemDataRole.UserRole)
 
         view._delete_transaction()
 
         assert Transaction.get_by_id(trans_id) is not None
 
 
+    def test_delete_multiple_selected_rows(self, qtbot, temp_db, sample_account, sample_card, sample_transactions, mock_qmessagebox):
+        """Multi-row selection is deleted with a single delete_many call"""
+        from budget_app.models.transaction import Transaction
+        from PyQt6.QtWidgets import QMessageBox, QAbstractItemView
+        from unittest.mock import patch
+
+        mock_qmessagebox.last_return = QMessageBox.StandardButton.Yes
+
+        view = self._make_view(qtbot)
+        view.refresh()
+        view.table.setSelectionMode(QAbstractItemView.SelectionMode.MultiSelection)
+        view.table.selectRow(0)
+        view.table.selectRow(1)
+        ids = [_cell(view, r, 3, Qt.ItemDataRole.UserRole) for r in (0, 1)]
+
+        with patch.object(Transaction, 'delete_many', wraps=Transaction.delete_many) as spy:
+            view._delete_transaction()
+
+        spy.assert_called_once_with(ids)
+        assert all(Transaction.get_by_id(i) is None for i in ids)
+
+
+class TestScheduleRefresh:
+    """Tests for coalescing CRUD refreshes with _schedule_refresh"""
+
+    def test_repeated_calls_share_one_refresh(self, qtbot, temp_db):
+        """Several schedules before the timer fires produce a single refresh"""
+        from budget_app.views.transactions_view import TransactionsView
+        from unittest.mock import patch
+
+        view = TransactionsView()
+        qtbot.addWidget(view)
+        view._first_load = False
+
+        with patch.object(view, 'refresh') as mock_refresh:
+            # The timer holds the bound method captured at construction
+            view._refresh_timer.timeout.disconnect()
+            view._refresh_timer.timeout.connect(mock_refresh)
+            view._schedule_refresh()
+            view._schedule_refresh()
+            view._schedule_refresh()
+            qtbot.waitUntil(lambda: mock_refresh.called, timeout=1000)
+            qtbot.wait(100)
+
+        assert mock_refresh.call_count == 1
+
+    def test_direct_refresh_cancels_scheduled_one(self, qtbot, temp_db):
+        """A refresh() while one is scheduled absorbs the pending timer"""
+        from budget_app.views.transactions_view import TransactionsView
+        view = TransactionsView()
+        qtbot.addWidget(view)
+        view._first_load = False
+        view._schedule_refresh()
+        assert view._refresh_timer.isActive()
+        view.refresh()
+        assert not view._refresh_timer.isActive()
+
+    def test_delete_schedules_refresh(self, qtbot, temp_db, sample_account, sample_card, sample_transactions, mock_qmessagebox):
+        """Deleting defers the table reload to the refresh timer"""
+        from budget_app.views.transactions_view import TransactionsView
+        from PyQt6.QtWidgets import QMessageBox
+        from PyQt6.QtCore import QDate
+
+        mock_qmessagebox.last_return = QMessageBox.StandardButton.Yes
+
+        view = TransactionsView()
+        qtbot.addWidget(view)
+        view._first_load = False
+        view.from_date.setDate(QDate.fromString("2026-01-01", "yyyy-MM-dd"))
+        view.to_date.setDate(QDate.fromString("2026-12-31", "yyyy-MM-dd"))
+        view.refresh()
+        rows_before = view.model.rowCount()
+        view.table.selectRow(0)
+
+        view._delete_transaction()
+
+        assert view._refresh_timer.isActive()
+        qtbot.waitUntil(lambda: view.model.rowCount() == rows_before - 1, timeout=1000)
+
+
 class TestDeleteAllTransactions:
     """Tests for _delete_all_transactions with double confirmation"""
 
@@ -2022,7 +3279,7 @@ class TestClearPostedTransactions:
         assert mock_qmessagebox.info_called is not True
 
 
-class TestGenerateRecurringDialog:
+class TestGenerateRecurringFlow:
     """Tests for _generate_recurring_transactions dialog flow"""
 
     def test_dialog_accepted_calls_do_generate(self, qtbot, temp_db, mock_qmessagebox):
@@ -2148,6 +3405,95 @@ class TestDoGenerateRecurring:
 
         assert mock_qmessagebox.info_called is not True
 
+    def test_generated_rows_bulk_inserted(self, qtbot, temp_db, mock_qmessagebox):
+        """Generated transactions are written with one bulk insert, not per-row saves"""
+        from budget_app.views.transactions_view import TransactionsView
+        from budget_app.models.transaction import Transaction
+        from unittest.mock import patch
+
+        view = TransactionsView()
+        qtbot.addWidget(view)
+        view._first_load = False
+
+        generated = [
+            Transaction(id=None, date='2026-06-01', description='T1',
+                        amount=-10.0, payment_method='C', recurring_charge_id=None),
+            Transaction(id=None, date='2026-07-01', description='T2',
+                        amount=-20.0, payment_method='C', notes='note'),
+        ]
+
+        with patch('budget_app.utils.calculations.generate_future_transactions',
+                   return_value=generated), \
+                patch.object(Transaction, 'save') as mock_save:
+            view._do_generate_recurring(months=3, clear_existing=False, show_message=False)
+
+        mock_save.assert_not_called()
+        saved = {t.description: t for t in Transaction.get_all()}
+        assert saved['T1'].amount == -10.0
+        assert saved['T2'].notes == 'note'
+
+
+class TestBulkMode:
+    """Tests for TransactionsView.bulk_mode"""
+
+    def _make_view(self, qtbot):
+        from budget_app.views.transactions_view import TransactionsView
+        view = TransactionsView()
+        qtbot.addWidget(view)
+        view._first_load = False
+        return view
+
+    def test_refresh_suppressed_until_exit(self, qtbot, temp_db):
+        """refresh() calls inside the block are deferred to one load on exit"""
+        from unittest.mock import patch
+
+        view = self._make_view(qtbot)
+        with patch.object(view, '_load_ledger', wraps=view._load_ledger) as spy:
+            with view.bulk_mode():
+                view.mark_dirty()
+                view.refresh()
+                view.refresh()
+                assert spy.call_count == 0
+                assert not view.table.updatesEnabled()
+            assert spy.call_count == 1
+        assert view.table.updatesEnabled()
+
+    def test_nested_blocks_refresh_once(self, qtbot, temp_db):
+        """Only the outermost block triggers the refresh"""
+        from unittest.mock import patch
+
+        view = self._make_view(qtbot)
+        with patch.object(view, 'refresh', wraps=view.refresh) as spy:
+            with view.bulk_mode():
+                with view.bulk_mode():
+                    pass
+                assert spy.call_count == 0
+            assert spy.call_count == 1
+
+    def test_generate_refreshes_once(self, qtbot, temp_db, mock_qmessagebox):
+        """_do_generate_recurring reloads the ledger a single time"""
+        from unittest.mock import patch
+
+        view = self._make_view(qtbot)
+        with patch('budget_app.utils.calculations.generate_future_transactions',
+                   return_value=[]), \
+                patch.object(view, '_load_ledger', wraps=view._load_ledger) as spy:
+            view._do_generate_recurring(months=1, clear_existing=False, show_message=False)
+        assert spy.call_count == 1
+
+    def test_first_load_generation_does_not_nest_refresh(self, qtbot, temp_db, mock_qmessagebox):
+        """Auto-generation on first load is loaded by the outer refresh only"""
+        from budget_app.views.transactions_view import TransactionsView
+        from unittest.mock import patch
+
+        view = TransactionsView()
+        qtbot.addWidget(view)
+        with patch('budget_app.utils.calculations.generate_future_transactions',
+                   return_value=[]), \
+                patch.object(view, '_load_ledger', wraps=view._load_ledger) as spy:
+            view.refresh()
+        assert spy.call_count == 1
+
 
 class TestGenerateSpecialCharges:
     """Tests for _generate_special_charges"""
@@ -2268,6 +3614,23 @@ class TestGenerateSpecialCharges:
             date(2026, 1, 1), date(2026, 4, 30), [charge])
         assert count == 0
 
+    def test_skip_zero_amount_mortgage(self, qtbot, temp_db):
+        """Bi-weekly mortgage charges with amount=0 are skipped as well"""
+        from budget_app.models.recurring_charge import RecurringCharge
+        from datetime import date
+
+        charge = RecurringCharge(
+            id=None, name='Zero Mortgage', amount=0.0,
+            day_of_month=991, payment_method='C',
+            frequency='SPECIAL', amount_type='FIXED'
+        )
+        charge.save()
+
+        view = self._make_view(qtbot, temp_db)
+        count = view._generate_special_charges(
+            date(2026, 1, 1), date(2026, 4, 30), [charge])
+        assert count == 0
+
     def test_monthly_special_start_after_15th(self, qtbot, temp_db):
         """Starting after the 15th should start from next month's 15th"""
         from budget_app.models.recurring_charge import RecurringCharge
@@ -2521,6 +3884,119 @@ class TestGeneratePaydayTransactions:
         three_paycheck_lisa = [t for t in lisa_trans if t.amount == -350.0]
         assert len(three_paycheck_lisa) > 0
 
+    def test_lisa_charges_come_from_cached_list(self, qtbot, temp_db):
+        """Lisa and Lisa3 are found in the view's charge cache, not queried by name"""
+        from unittest.mock import patch
+        from budget_app.models.paycheck import PaycheckConfig
+        from budget_app.models.recurring_charge import RecurringCharge
+        from budget_app.models.transaction import Transaction
+        from datetime import date
+
+        paycheck = PaycheckConfig(
+            id=None, gross_amount=3500.0,
+            pay_frequency='BIWEEKLY',
+            effective_date='2026-01-09',
+            is_current=True, pay_day_of_week=4
+        )
+        paycheck.save()
+        paycheck = PaycheckConfig.get_by_id(paycheck.id)
+        RecurringCharge(id=None, name='Lisa3', amount=-350.0, day_of_month=1,
+                        payment_method='C', frequency='SPECIAL', amount_type='FIXED').save()
+
+        view = self._make_view(qtbot, temp_db)
+        view._recurring_charges()
+        with patch.object(RecurringCharge, 'get_by_name') as mock_by_name, \
+                patch.object(RecurringCharge, 'get_all') as mock_all:
+            view._generate_payday_transactions(date(2026, 1, 1), date(2026, 1, 31), paycheck)
+            mock_by_name.assert_not_called()
+            mock_all.assert_not_called()
+
+        # Jan 2026 has 5 Fridays, so Lisa3's amount applies
+        assert any(t.description == 'Lisa' and t.amount == -350.0
+                   for t in Transaction.get_all())
+
+    def test_first_payday_matches_stepping(self, qtbot, temp_db):
+        """First payday equals stepping from the anchor, before and after it"""
+        from budget_app.models.paycheck import PaycheckConfig
+        from budget_app.models.transaction import Transaction
+        from datetime import date, timedelta
+
+        paycheck = PaycheckConfig(
+            id=None, gross_amount=3500.0,
+            pay_frequency='BIWEEKLY',
+            effective_date='2026-03-06',
+            is_current=True, pay_day_of_week=4
+        )
+        paycheck.save()
+        paycheck = PaycheckConfig.get_by_id(paycheck.id)
+        anchor = date(2026, 3, 6)
+
+        view = self._make_view(qtbot, temp_db)
+        for offset in range(-30, 31):
+            start = anchor + timedelta(days=offset)
+            expected = anchor - timedelta(days=14 * 4)
+            while expected < start:
+                expected += timedelta(days=14)
+
+            view._generate_payday_transactions(start, start + timedelta(days=13), paycheck)
+            paydays = [t.date for t in Transaction.get_all() if t.description == 'Payday']
+            assert paydays == [expected.isoformat()], f"start={start}"
+            Transaction.delete_all()
+
+    def test_paydays_counted_once_per_month(self, qtbot, temp_db):
+        """The payday count is computed once per month, not once per payday"""
+        from budget_app.models.paycheck import PaycheckConfig
+        from datetime import date
+        from unittest.mock import patch
+
+        paycheck = PaycheckConfig(
+            id=None, gross_amount=3500.0,
+            pay_frequency='BIWEEKLY',
+            effective_date='2026-01-09',
+            is_current=True, pay_day_of_week=4
+        )
+        paycheck.save()
+        paycheck = PaycheckConfig.get_by_id(paycheck.id)
+
+        view = self._make_view(qtbot, temp_db)
+        with patch.object(view, '_count_paydays_in_month',
+                          wraps=view._count_paydays_in_month) as spy:
+            view._generate_payday_transactions(
+                date(2026, 1, 1), date(2026, 3, 31), paycheck)
+
+        # 6 paydays across Jan-Mar, but only three distinct months
+        assert [c.args for c in spy.call_args_list] == [(2026, 1), (2026, 2), (2026, 3)]
+
+    def test_lisa_3_missing_falls_back_to_lisa(self, qtbot, temp_db):
+        """3-paycheck month without a 'Lisa3' charge uses the 'Lisa' amount"""
+        from budget_app.models.paycheck import PaycheckConfig
+        from budget_app.models.recurring_charge import RecurringCharge
+        from budget_app.models.transaction import Transaction
+        from datetime import date
+
+        paycheck = PaycheckConfig(
+            id=None, gross_amount=3500.0,
+            pay_frequency='BIWEEKLY',
+            effective_date='2026-01-09',
+            is_current=True, pay_day_of_week=4
+        )
+        paycheck.save()
+        paycheck = PaycheckConfig.get_by_id(paycheck.id)
+
+        RecurringCharge(
+            id=None, name='Lisa', amount=-500.0,
+            day_of_month=1, payment_method='C',
+            frequency='SPECIAL', amount_type='FIXED'
+        ).save()
+
+        view = self._make_view(qtbot, temp_db)
+        view._generate_payday_transactions(
+            date(2026, 1, 1), date(2026, 1, 31), paycheck)
+
+        lisa_trans = [t for t in Transaction.get_all() if t.description == 'Lisa']
+        assert lisa_trans
+        assert all(t.amount == -500.0 for t in lisa_trans)
+
     def test_non_biweekly_returns_zero(self, qtbot, temp_db):
         """Non-biweekly frequency returns 0 and generates nothing"""
         from budget_app.models.paycheck import PaycheckConfig
@@ -2575,7 +4051,7 @@ class TestLoadColumnWidthsStringBranch:
         # Need to know column count first - create a view to check
         view = TransactionsView()
         qtbot.addWidget(view)
-        col_count = view.table.columnCount()
+        col_count = view.model.columnCount()
 
         # Set string widths
         string_widths = [str(100 + i * 10) for i in range(col_count)]
@@ -2596,7 +4072,7 @@ class TestLoadColumnWidthsStringBranch:
 
         view = TransactionsView()
         qtbot.addWidget(view)
-        col_count = view.table.columnCount()
+        col_count = view.model.columnCount()
 
         int_widths = [100 + i * 10 for i in range(col_count)]
         settings = QSettings("BudgetApp", "PersonalBudgetManager")
@@ -2618,7 +4094,7 @@ class TestLoadColumnWidthsStringBranch:
 
         # Record current widths
         original_widths = [view.table.columnWidth(i)
-                          for i in range(view.table.columnCount())]
+                          for i in range(view.model.columnCount())]
 
         # Set wrong-length widths
         settings = QSettings("BudgetApp", "PersonalBudgetManager")
@@ -2627,10 +4103,60 @@ class TestLoadColumnWidthsStringBranch:
         view._load_column_widths()
 
         # Widths should be unchanged
-        for i in range(view.table.columnCount()):
+        for i in range(view.model.columnCount()):
             assert view.table.columnWidth(i) == original_widths[i]
 
 
+class TestSaveColumnWidthsDebounce:
+    """Tests for debounced column width persistence"""
+
+    def test_resize_does_not_write_immediately(self, qtbot, temp_db):
+        """Resizing a column only starts the save timer"""
+        from budget_app.views.transactions_view import TransactionsView
+        from unittest.mock import patch
+
+        view = TransactionsView()
+        qtbot.addWidget(view)
+
+        with patch.object(view, '_save_column_widths_now') as mock_save:
+            view.table.setColumnWidth(3, 250)
+            view.table.setColumnWidth(3, 260)
+            mock_save.assert_not_called()
+        assert view._save_widths_timer.isActive()
+
+    def test_timer_persists_widths(self, qtbot, temp_db):
+        """When the timer fires, the final widths are written once"""
+        from budget_app.views.transactions_view import TransactionsView
+        from PyQt6.QtCore import QSettings
+
+        view = TransactionsView()
+        qtbot.addWidget(view)
+        view.table.setColumnWidth(3, 250)
+        view.table.setColumnWidth(3, 275)
+
+        qtbot.waitUntil(lambda: not view._save_widths_timer.isActive(), timeout=2000)
+
+        settings = QSettings("BudgetApp", "PersonalBudgetManager")
+        widths = settings.value("transactions/column_widths")
+        assert int(widths[3]) == 275
+
+    def test_hide_flushes_pending_save(self, qtbot, temp_db):
+        """Hiding the view writes widths that are still pending"""
+        from budget_app.views.transactions_view import TransactionsView
+        from PyQt6.QtCore import QSettings
+
+        view = TransactionsView()
+        qtbot.addWidget(view)
+        view.show()
+        view.table.setColumnWidth(3, 222)
+        assert view._save_widths_timer.isActive()
+
+        view.hide()
+
+        settings = QSettings("BudgetApp", "PersonalBudgetManager")
+        assert int(settings.value("transactions/column_widths")[3]) == 222
+
+
 class TestAutoGenerateIfNeeded:
     """Tests for _auto_generate_if_needed"""
 